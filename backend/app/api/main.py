@@ -3,6 +3,7 @@ from fastapi import APIRouter
 from backend.app.api.routes import home
 from backend.app.api.routes.auth import (
     activate,
+    import_users,
     login,
     logout,
     password_reset,
@@ -10,12 +11,26 @@ from backend.app.api.routes.auth import (
     register,
 )
 from backend.app.api.routes.bank_account import activate as bank_account_activate
+from backend.app.api.routes.bank_account import balance as account_balance
+from backend.app.api.routes.bank_account import bulk_activate as bank_account_bulk_activate
 from backend.app.api.routes.bank_account import create as create_bank_account
+from backend.app.api.routes.bank_account import kyc_queue
+from backend.app.api.routes.bank_account import name_enquiry
+from backend.app.api.routes.bank_account import statement as account_statement
+from backend.app.api.routes.bank_account import transfer as transfer_funds
+from backend.app.api.routes.bank_account import validate as validate_bank_account
 from backend.app.api.routes.next_of_kin import all
 from backend.app.api.routes.next_of_kin import create as create_next_of_kin
 from backend.app.api.routes.next_of_kin import delete
 from backend.app.api.routes.next_of_kin import update as update_next_of_kin
-from backend.app.api.routes.profile import all_profiles, create, me, update, upload
+from backend.app.api.routes.profile import (
+    all_profiles,
+    create,
+    me,
+    search,
+    update,
+    upload,
+)
 
 api_router = APIRouter()
 
@@ -26,14 +41,23 @@ api_router.include_router(login.router)
 api_router.include_router(password_reset.router)
 api_router.include_router(refresh.router)
 api_router.include_router(logout.router)
+api_router.include_router(import_users.router)
 api_router.include_router(create.router)
 api_router.include_router(update.router)
 api_router.include_router(upload.router)
 api_router.include_router(me.router)
 api_router.include_router(all_profiles.router)
+api_router.include_router(search.router)
 api_router.include_router(create_next_of_kin.router)
 api_router.include_router(all.router)
 api_router.include_router(update_next_of_kin.router)
 api_router.include_router(delete.router)
 api_router.include_router(create_bank_account.router)
+api_router.include_router(kyc_queue.router)
+api_router.include_router(bank_account_bulk_activate.router)
 api_router.include_router(bank_account_activate.router)
+api_router.include_router(validate_bank_account.router)
+api_router.include_router(name_enquiry.router)
+api_router.include_router(transfer_funds.router)
+api_router.include_router(account_statement.router)
+api_router.include_router(account_balance.router)
@@ -5,6 +5,8 @@ from fastapi import Cookie, Depends, HTTPException, status
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.app.auth.models import User
+from backend.app.auth.principal_cache import principal_cache
+from backend.app.auth.token_revocation import token_revocation_list
 from backend.app.core.config import settings
 from backend.app.core.db import get_session
 from backend.app.core.logging import get_logger
@@ -42,18 +44,32 @@ async def get_current_user(
                 },
             )
 
-        from backend.app.api.services.user_auth import user_auth_service
-
-        user = await user_auth_service.get_user_by_id(payload["id"], session)
-        if not user:
+        if await token_revocation_list.is_revoked(payload.get("jti")):
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
+                status_code=status.HTTP_401_UNAUTHORIZED,
                 detail={
                     "status": "error",
-                    "message": "User not found",
-                    "action": "Please login again",
+                    "message": "Token has been revoked",
+                    "action": "Please log in again",
                 },
             )
+
+        from backend.app.api.services.user_auth import user_auth_service
+
+        user = await principal_cache.get(payload["id"])
+        if user is None:
+            user = await user_auth_service.get_user_by_id(payload["id"], session)
+            if not user:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail={
+                        "status": "error",
+                        "message": "User not found",
+                        "action": "Please login again",
+                    },
+                )
+            await principal_cache.set(user)
+
         await user_auth_service.validate_user_status(user)
         return user
 
@@ -75,6 +91,8 @@ async def get_current_user(
                 "action": "Please log in again",
             },
         )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Authentication error: {e}")
         raise HTTPException(
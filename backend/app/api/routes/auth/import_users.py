@@ -0,0 +1,90 @@
+import json
+from typing import AsyncIterator
+
+from fastapi import APIRouter, File, HTTPException, UploadFile, status
+from fastapi.responses import StreamingResponse
+
+from backend.app.api.routes.auth.deps import CurrentUser
+from backend.app.api.services.user_import import (
+    detect_import_format,
+    import_users,
+)
+from backend.app.auth.schema import RoleChoicesSchema
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+router = APIRouter(prefix="/auth")
+
+IMPORT_ROLES = {
+    RoleChoicesSchema.BRANCH_MANAGER,
+    RoleChoicesSchema.ADMIN,
+    RoleChoicesSchema.SUPER_ADMIN,
+}
+
+
+async def stream_import(content: str, fmt: str) -> AsyncIterator[str]:
+    try:
+        async for event in import_users(content, fmt):
+            yield json.dumps(event) + "\n"
+    except Exception as e:
+        logger.error(f"User import aborted: {e}")
+        yield json.dumps({"status": "error", "message": "User import aborted"}) + "\n"
+
+
+@router.post("/import", status_code=status.HTTP_200_OK)
+async def import_customers(
+    current_user: CurrentUser,
+    file: UploadFile = File(...),
+) -> StreamingResponse:
+    try:
+        if current_user.role not in IMPORT_ROLES:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail={
+                    "status": "error",
+                    "message": "Access denied",
+                    "action": "Only branch managers and admins can import customers",
+                },
+            )
+
+        fmt = detect_import_format(file.filename, file.content_type)
+        if fmt is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "status": "error",
+                    "message": "Unsupported import file format",
+                    "action": "Please upload a .csv or .ndjson file",
+                },
+            )
+
+        try:
+            content = (await file.read()).decode("utf-8-sig")
+        except UnicodeDecodeError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "status": "error",
+                    "message": "Import file must be UTF-8 encoded",
+                    "action": "Please re-encode the file and try again",
+                },
+            )
+
+        logger.info(f"User import of {file.filename} started by {current_user.email}")
+        return StreamingResponse(
+            stream_import(content, fmt), media_type="application/x-ndjson"
+        )
+
+    except HTTPException as http_ex:
+        raise http_ex
+    except Exception as e:
+        logger.error(f"Failed to start user import: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "status": "error",
+                "message": "Failed to start user import",
+                "action": "Please try again later",
+            },
+        )
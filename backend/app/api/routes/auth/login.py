@@ -1,3 +1,5 @@
+import uuid
+
 from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -6,6 +8,7 @@ from backend.app.auth.schema import LoginRequestSchema, OTPVerifyRequestSchema
 from backend.app.auth.utils import create_jwt_token, set_auth_cookies
 from backend.app.core.config import settings
 from backend.app.core.db import get_session
+from backend.app.core.services.login_otp import get_login_otp_delivery_status
 from backend.app.core.logging import get_logger
 
 logger = get_logger()
@@ -20,17 +23,20 @@ async def request_login_otp(
 ):
     try:
         user = await user_auth_service.get_user_by_email(login_data.email, session)
+        delivery_id = str(uuid.uuid4())
 
         if user:
             await user_auth_service.check_user_lockout(user, session)
 
-            if not await user_auth_service.verify_user_password(
-                login_data.password, user.hashed_password
+            if not await user_auth_service.authenticate_password(
+                user, login_data.password, session
             ):
-                await user_auth_service.increment_failed_login_attempts(user, session)
-                remaining_attempts = (
-                    settings.LOGIN_ATTEMPTS - user.failed_login_attempts
+                failed_attempts = (
+                    await user_auth_service.increment_failed_login_attempts(
+                        user, session
+                    )
                 )
+                remaining_attempts = settings.LOGIN_ATTEMPTS - failed_attempts
 
                 if remaining_attempts > 0:
                     error_message = (
@@ -64,14 +70,15 @@ async def request_login_otp(
                     },
                 )
 
-            await user_auth_service.reset_user_state(
-                user, session, clear_otp=True, log_action=True
+            issued, otp_delivery_id = await user_auth_service.generate_and_save_otp(
+                user, session
             )
-
-            await user_auth_service.generate_and_save_otp(user, session)
+            if issued:
+                delivery_id = otp_delivery_id
 
         return {
-            "message": "if an account exists with this email, an OTP has been sent to it."
+            "message": "if an account exists with this email, an OTP has been sent to it.",
+            "delivery_id": delivery_id,
         }
     except HTTPException as http_ex:
         raise http_ex
@@ -83,6 +90,23 @@ async def request_login_otp(
         )
 
 
+@router.get("/login/otp-delivery/{delivery_id}", status_code=status.HTTP_200_OK)
+async def get_otp_delivery_status(delivery_id: uuid.UUID):
+    try:
+        delivery_status = await get_login_otp_delivery_status(str(delivery_id))
+        return {"delivery_id": str(delivery_id), "status": delivery_status}
+    except Exception as e:
+        logger.error(f"Failed to get OTP delivery status: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "status": "error",
+                "message": "Failed to get OTP delivery status",
+                "action": "Please try again later",
+            },
+        )
+
+
 @router.post("/login/verify-otp", status_code=status.HTTP_200_OK)
 async def verify_login_otp(
     verify_data: OTPVerifyRequestSchema,
@@ -93,9 +117,6 @@ async def verify_login_otp(
         user = await user_auth_service.verify_login_otp(
             verify_data.email, verify_data.otp, session
         )
-        await user_auth_service.reset_user_state(
-            user, session, clear_otp=True, log_action=True
-        )
 
         access_token = create_jwt_token(user.id)
         refresh_token = create_jwt_token(user.id, type=settings.COOKIE_REFRESH_NAME)
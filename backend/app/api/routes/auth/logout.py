@@ -1,6 +1,9 @@
-from fastapi import APIRouter, HTTPException, Response, status
+import jwt
+from fastapi import APIRouter, Cookie, HTTPException, Response, status
 
+from backend.app.auth.token_revocation import token_revocation_list
 from backend.app.auth.utils import delete_auth_cookies
+from backend.app.core.config import settings
 from backend.app.core.logging import get_logger
 
 logger = get_logger()
@@ -8,9 +11,33 @@ logger = get_logger()
 router = APIRouter(prefix="/auth")
 
 
+async def revoke_token(token: str | None) -> None:
+    if not token:
+        return
+
+    try:
+        payload = jwt.decode(
+            token,
+            settings.SIGNING_KEY,
+            algorithms=[settings.JWT_ALGORITHM],
+            options={"verify_exp": False},
+        )
+    except jwt.InvalidTokenError:
+        return
+
+    if payload.get("jti") and payload.get("exp"):
+        await token_revocation_list.revoke(payload["jti"], payload["exp"])
+
+
 @router.post("/logout", status_code=status.HTTP_200_OK)
-async def logout(response: Response) -> dict:
+async def logout(
+    response: Response,
+    access_token: str | None = Cookie(None, alias=settings.COOKIE_ACCESS_NAME),
+    refresh_token: str | None = Cookie(None, alias=settings.COOKIE_REFRESH_NAME),
+) -> dict:
     try:
+        await revoke_token(access_token)
+        await revoke_token(refresh_token)
         delete_auth_cookies(response)
         logger.info("User logged out successfully")
         return {"message": "Logged out successfully"}
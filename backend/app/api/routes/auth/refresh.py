@@ -3,6 +3,7 @@ from fastapi import APIRouter, Cookie, Depends, HTTPException, Response, status
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.app.api.services.user_auth import user_auth_service
+from backend.app.auth.token_revocation import token_revocation_list
 from backend.app.auth.utils import create_jwt_token, set_auth_cookies
 from backend.app.core.config import settings
 from backend.app.core.db import get_session
@@ -64,6 +65,15 @@ async def refresh_access_token(
                     "action": "Please login again",
                 },
             )
+        if await token_revocation_list.is_revoked(payload.get("jti")):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail={
+                    "status": "error",
+                    "message": "Refresh token has been revoked",
+                    "action": "Please login again",
+                },
+            )
         user = await user_auth_service.get_user_by_id(payload["id"], session)
         if not user:
             logger.warning(f"User not found for ID: {payload['id']}")
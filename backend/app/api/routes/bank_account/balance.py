@@ -0,0 +1,56 @@
+from datetime import datetime, timezone
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.app.api.routes.auth.deps import CurrentUser
+from backend.app.api.services.bank_account import get_viewable_bank_account
+from backend.app.api.services.ledger import get_balance_at
+from backend.app.core.db import get_session
+from backend.app.core.logging import get_logger
+from backend.app.ledger.schema import BalanceAtReadSchema
+from backend.app.ledger.utils import from_minor_units
+
+logger = get_logger()
+
+router = APIRouter(prefix="/bank-account")
+
+
+@router.get(
+    "/{account_id}/balance",
+    response_model=BalanceAtReadSchema,
+    status_code=status.HTTP_200_OK,
+    description="Get the balance of an account at a point in time, defaulting to now",
+)
+async def balance_at(
+    account_id: UUID,
+    current_user: CurrentUser,
+    at: datetime | None = Query(default=None),
+    session: AsyncSession = Depends(get_session),
+) -> BalanceAtReadSchema:
+    try:
+        at = at or datetime.now(timezone.utc)
+        if at.tzinfo is None:
+            at = at.replace(tzinfo=timezone.utc)
+
+        account = await get_viewable_bank_account(account_id, current_user, session)
+        balance, snapshot_date = await get_balance_at(account.id, at, session)
+
+        return BalanceAtReadSchema(
+            account_id=account.id,
+            currency=account.currency,
+            at=at,
+            balance=from_minor_units(balance, account.currency),
+            snapshot_date=snapshot_date,
+        )
+
+    except HTTPException as http_ex:
+        raise http_ex
+
+    except Exception as e:
+        logger.error(f"Failed to get balance for account {account_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"status": "error", "message": "Failed to get account balance"},
+        )
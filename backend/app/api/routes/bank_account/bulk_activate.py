@@ -0,0 +1,84 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.app.api.routes.auth.deps import CurrentUser
+from backend.app.api.services.bank_account import activate_bank_accounts
+from backend.app.auth.schema import RoleChoicesSchema
+from backend.app.bank_account.schema import (
+    BankAccountBulkActivateRequestSchema,
+    BankAccountBulkActivateResponseSchema,
+)
+from backend.app.core.db import get_session
+from backend.app.core.logging import get_logger
+from backend.app.core.services.bank_account_activated_email import (
+    send_account_activated_emails,
+)
+
+logger = get_logger()
+
+router = APIRouter(prefix="/bank-account")
+
+
+@router.patch(
+    "/bulk-activate",
+    response_model=BankAccountBulkActivateResponseSchema,
+    status_code=status.HTTP_200_OK,
+    description="Activate several bank accounts after KYC verification. Only accessible to account executives",
+)
+async def bulk_activate_accounts(
+    activation_data: BankAccountBulkActivateRequestSchema,
+    current_user: CurrentUser,
+    session: AsyncSession = Depends(get_session),
+) -> BankAccountBulkActivateResponseSchema:
+    try:
+        if not current_user.role == RoleChoicesSchema.ACCOUNT_EXECUTIVE:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail={
+                    "status": "error",
+                    "message": "Only account executives can activate bank accounts",
+                },
+            )
+
+        results, recipients = await activate_bank_accounts(
+            account_ids=activation_data.account_ids,
+            verified_by=current_user.id,
+            session=session,
+        )
+
+        emails_queued = False
+        if recipients:
+            try:
+                await send_account_activated_emails(recipients)
+                emails_queued = True
+                logger.info(
+                    f"Queued {len(recipients)} bank account activated emails"
+                )
+            except Exception as email_error:
+                logger.error(
+                    f"Failed to queue bank account activated emails: {email_error}"
+                )
+
+        activated = sum(1 for result in results if result.status == "activated")
+        logger.info(
+            f"{activated} of {len(results)} bank accounts activated by account "
+            f"executive {current_user.email}"
+        )
+
+        return BankAccountBulkActivateResponseSchema(
+            requested=len(results),
+            activated=activated,
+            failed=len(results) - activated,
+            emails_queued=emails_queued,
+            results=results,
+        )
+
+    except HTTPException as http_ex:
+        raise http_ex
+
+    except Exception as e:
+        logger.error(f"Failed to bulk activate bank accounts: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"status": "error", "message": "Failed to activate bank accounts"},
+        )
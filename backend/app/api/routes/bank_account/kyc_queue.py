@@ -0,0 +1,104 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.app.api.routes.auth.deps import CurrentUser
+from backend.app.api.services.kyc_queue import (
+    claim_pending_accounts,
+    release_claimed_accounts,
+)
+from backend.app.auth.schema import RoleChoicesSchema
+from backend.app.bank_account.schema import (
+    KycClaimRequestSchema,
+    KycClaimResponseSchema,
+    KycReleaseRequestSchema,
+    KycReleaseResponseSchema,
+)
+from backend.app.core.db import get_session
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+router = APIRouter(prefix="/bank-account/kyc-queue")
+
+
+def ensure_account_executive(current_user: CurrentUser) -> None:
+    if not current_user.role == RoleChoicesSchema.ACCOUNT_EXECUTIVE:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={
+                "status": "error",
+                "message": "Only account executives can review pending accounts",
+            },
+        )
+
+
+@router.post(
+    "/claim",
+    response_model=KycClaimResponseSchema,
+    status_code=status.HTTP_200_OK,
+    description="Claim the next pending bank accounts for KYC review. Claims are leased and expire if not completed. Only accessible to account executives",
+)
+async def claim_accounts(
+    claim_data: KycClaimRequestSchema,
+    current_user: CurrentUser,
+    session: AsyncSession = Depends(get_session),
+) -> KycClaimResponseSchema:
+    try:
+        ensure_account_executive(current_user)
+
+        items, lease_expires_at = await claim_pending_accounts(
+            reviewer_id=current_user.id, limit=claim_data.limit, session=session
+        )
+        logger.info(
+            f"Account executive {current_user.email} claimed {len(items)} pending accounts"
+        )
+
+        return KycClaimResponseSchema(
+            claimed=len(items), lease_expires_at=lease_expires_at, items=items
+        )
+
+    except HTTPException as http_ex:
+        raise http_ex
+
+    except Exception as e:
+        logger.error(f"Failed to claim pending accounts: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"status": "error", "message": "Failed to claim pending accounts"},
+        )
+
+
+@router.post(
+    "/release",
+    response_model=KycReleaseResponseSchema,
+    status_code=status.HTTP_200_OK,
+    description="Return claimed bank accounts to the KYC review queue. Only accessible to account executives",
+)
+async def release_accounts(
+    release_data: KycReleaseRequestSchema,
+    current_user: CurrentUser,
+    session: AsyncSession = Depends(get_session),
+) -> KycReleaseResponseSchema:
+    try:
+        ensure_account_executive(current_user)
+
+        released = await release_claimed_accounts(
+            account_ids=release_data.account_ids,
+            reviewer_id=current_user.id,
+            session=session,
+        )
+        logger.info(
+            f"Account executive {current_user.email} released {released} claimed accounts"
+        )
+
+        return KycReleaseResponseSchema(released=released)
+
+    except HTTPException as http_ex:
+        raise http_ex
+
+    except Exception as e:
+        logger.error(f"Failed to release claimed accounts: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"status": "error", "message": "Failed to release claimed accounts"},
+        )
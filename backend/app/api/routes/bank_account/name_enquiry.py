@@ -0,0 +1,37 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.app.api.routes.auth.deps import CurrentUser
+from backend.app.api.services.bank_account import name_enquiry
+from backend.app.bank_account.schema import NameEnquiryResponseSchema
+from backend.app.core.db import get_session
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+router = APIRouter(prefix="/bank-account")
+
+
+@router.get(
+    "/name-enquiry",
+    response_model=NameEnquiryResponseSchema,
+    status_code=status.HTTP_200_OK,
+    description="Resolve an account number to its account holder, currency and status",
+)
+async def account_name_enquiry(
+    current_user: CurrentUser,
+    account_number: str = Query(min_length=1, max_length=32),
+    session: AsyncSession = Depends(get_session),
+) -> NameEnquiryResponseSchema:
+    try:
+        return await name_enquiry(account_number, session)
+
+    except HTTPException as http_ex:
+        raise http_ex
+
+    except Exception as e:
+        logger.error(f"Failed name enquiry for account {account_number}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"status": "error", "message": "Failed to resolve account number"},
+        )
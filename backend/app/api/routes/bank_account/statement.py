@@ -0,0 +1,99 @@
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Literal
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.app.api.routes.auth.deps import CurrentUser
+from backend.app.api.services.bank_account import get_viewable_bank_account
+from backend.app.api.services.statement import render_statement
+from backend.app.bank_account.models import BankAccount
+from backend.app.core.config import settings
+from backend.app.core.db import get_session
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+router = APIRouter(prefix="/bank-account")
+
+STATEMENT_MEDIA_TYPES = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+
+async def stream_statement(
+    account: BankAccount, start: datetime, end: datetime, fmt: str
+) -> AsyncIterator[str]:
+    try:
+        async for chunk in render_statement(account, start, end, fmt):
+            yield chunk
+    except Exception as e:
+        logger.error(f"Statement export for account {account.id} aborted: {e}")
+        raise
+
+
+@router.get(
+    "/{account_id}/statement",
+    status_code=status.HTTP_200_OK,
+    description="Stream an account statement for a date range as CSV or NDJSON",
+)
+async def export_statement(
+    account_id: UUID,
+    current_user: CurrentUser,
+    start: datetime | None = Query(default=None),
+    end: datetime | None = Query(default=None),
+    fmt: Literal["csv", "ndjson"] = Query(default="csv", alias="format"),
+    session: AsyncSession = Depends(get_session),
+) -> StreamingResponse:
+    try:
+        end = end or datetime.now(timezone.utc)
+        start = start or end - timedelta(days=30)
+        if end.tzinfo is None:
+            end = end.replace(tzinfo=timezone.utc)
+        if start.tzinfo is None:
+            start = start.replace(tzinfo=timezone.utc)
+
+        if start >= end:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "status": "error",
+                    "message": "Statement start must be before its end",
+                },
+            )
+        if end - start > timedelta(days=settings.STATEMENT_MAX_RANGE_DAYS):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "status": "error",
+                    "message": "Statement range is too long",
+                    "action": (
+                        f"Request at most {settings.STATEMENT_MAX_RANGE_DAYS} "
+                        "days at a time"
+                    ),
+                },
+            )
+
+        account = await get_viewable_bank_account(account_id, current_user, session)
+
+        filename = (
+            f"statement-{account.account_number}-{start:%Y%m%d}-{end:%Y%m%d}.{fmt}"
+        )
+        logger.info(
+            f"Statement export for account {account.id} started by {current_user.email}"
+        )
+        return StreamingResponse(
+            stream_statement(account, start, end, fmt),
+            media_type=STATEMENT_MEDIA_TYPES[fmt],
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        )
+
+    except HTTPException as http_ex:
+        raise http_ex
+
+    except Exception as e:
+        logger.error(f"Failed to export statement: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"status": "error", "message": "Failed to export statement"},
+        )
@@ -0,0 +1,42 @@
+from fastapi import APIRouter, HTTPException, status
+
+from backend.app.api.routes.auth.deps import CurrentUser
+from backend.app.api.services.transfer import transfer_batcher
+from backend.app.core.logging import get_logger
+from backend.app.ledger.schema import TransferCreateSchema, TransferReadSchema
+
+logger = get_logger()
+
+router = APIRouter(prefix="/bank-account")
+
+
+@router.post(
+    "/transfer",
+    response_model=TransferReadSchema,
+    status_code=status.HTTP_201_CREATED,
+    description="Transfer funds from one of your active accounts to another active account",
+)
+async def transfer_funds(
+    transfer_data: TransferCreateSchema,
+    current_user: CurrentUser,
+) -> TransferReadSchema:
+    try:
+        transfer = await transfer_batcher.submit(current_user.id, transfer_data)
+
+        if transfer.created:
+            logger.info(
+                f"Transfer {transfer.journal_entry_id} of {transfer.amount} "
+                f"{transfer.currency.value} posted by {current_user.email}"
+            )
+
+        return transfer
+
+    except HTTPException as http_ex:
+        raise http_ex
+
+    except Exception as e:
+        logger.error(f"Failed to process transfer: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"status": "error", "message": "Failed to process transfer"},
+        )
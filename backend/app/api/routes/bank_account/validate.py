@@ -0,0 +1,61 @@
+import asyncio
+
+from fastapi import APIRouter, HTTPException, status
+
+from backend.app.api.routes.auth.deps import CurrentUser
+from backend.app.auth.schema import RoleChoicesSchema
+from backend.app.bank_account.luhn import validate_luhn_numbers
+from backend.app.bank_account.schema import (
+    AccountNumberValidationRequestSchema,
+    AccountNumberValidationResponseSchema,
+)
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+router = APIRouter(prefix="/bank-account")
+
+
+@router.post(
+    "/validate",
+    response_model=AccountNumberValidationResponseSchema,
+    status_code=status.HTTP_200_OK,
+    description="Validate the Luhn check digits of account numbers in bulk. Only accessible to account executives",
+)
+async def validate_account_numbers(
+    validation_data: AccountNumberValidationRequestSchema,
+    current_user: CurrentUser,
+) -> AccountNumberValidationResponseSchema:
+    try:
+        if not current_user.role == RoleChoicesSchema.ACCOUNT_EXECUTIVE:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail={
+                    "status": "error",
+                    "message": "Only account executives can validate account numbers",
+                },
+            )
+
+        account_numbers = validation_data.account_numbers
+        valid = await asyncio.to_thread(validate_luhn_numbers, account_numbers)
+
+        invalid_account_numbers = [
+            account_numbers[index] for index in (~valid).nonzero()[0]
+        ]
+
+        return AccountNumberValidationResponseSchema(
+            total=len(account_numbers),
+            valid=len(account_numbers) - len(invalid_account_numbers),
+            invalid=len(invalid_account_numbers),
+            invalid_account_numbers=invalid_account_numbers,
+        )
+
+    except HTTPException as http_ex:
+        raise http_ex
+
+    except Exception as e:
+        logger.error(f"Failed to validate account numbers: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"status": "error", "message": "Failed to validate account numbers"},
+        )
@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.app.api.routes.auth.deps import CurrentUser
-from backend.app.api.services.next_of_kin import get_user_next_of_kins
+from backend.app.api.services.next_of_kin import (
+    get_next_of_kins_etag,
+    get_user_next_of_kins,
+)
 from backend.app.core.db import get_session
 from backend.app.core.logging import get_logger
+from backend.app.core.utils.etag import etag_headers, etag_matches
 from backend.app.next_of_kin.schema import NextOfKinReadSchema
 
 logger = get_logger()
@@ -16,14 +20,25 @@ router = APIRouter(prefix="/next-of-kin")
     response_model=list[NextOfKinReadSchema],
     status_code=status.HTTP_200_OK,
     description="Get all next of kins for the authenticated user",
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Next of kins unchanged"}},
 )
 async def list_next_of_kins(
-    current_user: CurrentUser, session: AsyncSession = Depends(get_session)
-) -> list[NextOfKinReadSchema]:
+    current_user: CurrentUser,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+    session: AsyncSession = Depends(get_session),
+) -> list[NextOfKinReadSchema] | Response:
     try:
+        etag = await get_next_of_kins_etag(current_user.id, session)
+        if etag_matches(if_none_match, etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers=etag_headers(etag)
+            )
+
         next_of_kins = await get_user_next_of_kins(
             user_id=current_user.id, session=session
         )
+        response.headers.update(etag_headers(etag))
         return [NextOfKinReadSchema.model_validate(kin) for kin in next_of_kins]
     except HTTPException as http_ex:
 
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -23,12 +25,19 @@ router = APIRouter(prefix="/profile")
 async def list_user_profiles(
     current_user: CurrentUser,
     session: AsyncSession = Depends(get_session),
-    skip: int = Query(default=0, ge=0),
-    limit: int = Query(default=20, ge=1),
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=20, ge=1, le=100),
+    total: Literal["none", "exact", "estimate"] = Query(default="none"),
 ) -> PaginatedProfileResponseSchema:
     try:
-        users, total_count = await get_all_user_profiles(
-            session=session, current_user=current_user, skip=skip, limit=limit
+        users, next_cursor, total_count, total_is_estimate = (
+            await get_all_user_profiles(
+                session=session,
+                current_user=current_user,
+                cursor=cursor,
+                limit=limit,
+                total_mode=total,
+            )
         )
 
         profile_responses = [
@@ -46,7 +55,11 @@ async def list_user_profiles(
         ]
 
         return PaginatedProfileResponseSchema(
-            profiles=profile_responses, total=total_count, skip=skip, limit=limit
+            profiles=profile_responses,
+            limit=limit,
+            next_cursor=next_cursor,
+            total=total_count,
+            total_is_estimate=total_is_estimate,
         )
     except HTTPException as http_ex:
         raise http_ex
@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.app.api.routes.auth.deps import CurrentUser
-from backend.app.api.services.profile import get_user_with_profile
+from backend.app.api.services.profile import get_profile_etag, get_user_with_profile
 from backend.app.core.db import get_session
 from backend.app.core.logging import get_logger
+from backend.app.core.utils.etag import etag_headers, etag_matches
 from backend.app.user_profile.schema import ProfileResponseSchema
 
 logger = get_logger()
@@ -12,11 +13,25 @@ logger = get_logger()
 router = APIRouter(prefix="/profile")
 
 
-@router.get("/me", response_model=ProfileResponseSchema, status_code=status.HTTP_200_OK)
+@router.get(
+    "/me",
+    response_model=ProfileResponseSchema,
+    status_code=status.HTTP_200_OK,
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Profile unchanged"}},
+)
 async def get_my_profile(
-    current_user: CurrentUser, session: AsyncSession = Depends(get_session)
-) -> ProfileResponseSchema:
+    current_user: CurrentUser,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+    session: AsyncSession = Depends(get_session),
+) -> ProfileResponseSchema | Response:
     try:
+        etag = await get_profile_etag(current_user.id, session)
+        if etag and etag_matches(if_none_match, etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers=etag_headers(etag)
+            )
+
         user_with_profile = await get_user_with_profile(current_user.id, session)
 
         if not user_with_profile:
@@ -29,7 +44,7 @@ async def get_my_profile(
                 },
             )
 
-        response = ProfileResponseSchema(
+        profile_response = ProfileResponseSchema(
             username=user_with_profile.username or "",
             first_name=user_with_profile.first_name or "",
             middle_name=user_with_profile.middle_name or "",
@@ -39,8 +54,10 @@ async def get_my_profile(
             role=user_with_profile.role,
             profile=user_with_profile.profile,
         )
+        if etag:
+            response.headers.update(etag_headers(etag))
         logger.debug(f"Successfully fetched profile for user {user_with_profile.id}")
-        return response
+        return profile_response
     except HTTPException as http_ex:
         raise http_ex
 
@@ -0,0 +1,69 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.app.api.routes.auth.deps import CurrentUser
+from backend.app.api.services.profile import search_user_profiles
+from backend.app.core.db import get_session
+from backend.app.core.logging import get_logger
+from backend.app.user_profile.schema import (
+    ProfileSearchHitSchema,
+    ProfileSearchResponseSchema,
+)
+
+logger = get_logger()
+
+router = APIRouter(prefix="/profile")
+
+
+@router.get(
+    "/search",
+    response_model=ProfileSearchResponseSchema,
+    status_code=status.HTTP_200_OK,
+    description="Fuzzy search customers by name, email, phone number or id number. Only accessible to branch managers",
+)
+async def search_profiles(
+    current_user: CurrentUser,
+    q: str = Query(min_length=3, max_length=100),
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=20, ge=1, le=100),
+    session: AsyncSession = Depends(get_session),
+) -> ProfileSearchResponseSchema:
+    try:
+        hits, next_cursor = await search_user_profiles(
+            session=session,
+            current_user=current_user,
+            query=q,
+            cursor=cursor,
+            limit=limit,
+        )
+
+        results = [
+            ProfileSearchHitSchema(
+                username=user.username or "",
+                first_name=user.first_name or "",
+                middle_name=user.middle_name or "",
+                last_name=user.last_name or "",
+                email=user.email or "",
+                id_no=str(user.id_no) if user.id_no else "",
+                role=user.role,
+                profile=user.profile,
+                score=score,
+            )
+            for user, score in hits
+        ]
+
+        return ProfileSearchResponseSchema(
+            results=results, limit=limit, next_cursor=next_cursor
+        )
+    except HTTPException as http_ex:
+        raise http_ex
+    except Exception as e:
+        logger.error(f"Error searching user profiles: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "status": "error",
+                "message": "Failed to search user profiles",
+                "action": "Please try again later",
+            },
+        )
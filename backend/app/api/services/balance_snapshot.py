@@ -0,0 +1,121 @@
+from datetime import date, datetime, time, timedelta, timezone
+
+from sqlalchemy import func, literal, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import col
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+from backend.app.ledger.models import BalanceSnapshot, BalanceSnapshotRun, Posting
+
+logger = get_logger()
+
+BALANCE_SNAPSHOT_LOCK_ID = 7_310_416_001
+
+
+def day_bounds(day: date) -> tuple[datetime, datetime]:
+    start = datetime.combine(day, time.min, tzinfo=timezone.utc)
+    return start, start + timedelta(days=1)
+
+
+def last_settled_day(now: datetime) -> date:
+    settled = now - timedelta(minutes=settings.BALANCE_SNAPSHOT_SETTLE_MINUTES)
+    return settled.date() - timedelta(days=1)
+
+
+async def next_snapshot_day(session: AsyncSession) -> date | None:
+    result = await session.exec(
+        select(func.max(col(BalanceSnapshotRun.snapshot_date)))
+    )
+    last_run = result.scalar()
+    if last_run is not None:
+        return last_run + timedelta(days=1)
+
+    result = await session.exec(select(func.min(col(Posting.created_at))))
+    first_posting = result.scalar()
+    if first_posting is None:
+        return None
+    return first_posting.astimezone(timezone.utc).date()
+
+
+async def snapshot_day(day: date, session: AsyncSession) -> int | None:
+    await session.exec(
+        text("SELECT pg_advisory_xact_lock(:lock_id)").bindparams(
+            lock_id=BALANCE_SNAPSHOT_LOCK_ID
+        )
+    )
+    already_taken = await session.exec(
+        select(col(BalanceSnapshotRun.snapshot_date)).where(
+            col(BalanceSnapshotRun.snapshot_date) == day
+        )
+    )
+    if already_taken.first() is not None:
+        await session.rollback()
+        return None
+
+    start, end = day_bounds(day)
+    deltas = (
+        select(
+            col(Posting.account_id).label("account_id"),
+            func.sum(col(Posting.amount)).label("delta"),
+            func.count().label("postings"),
+        )
+        .where(
+            col(Posting.account_id).is_not(None),
+            col(Posting.created_at) >= start,
+            col(Posting.created_at) < end,
+        )
+        .group_by(col(Posting.account_id))
+        .subquery()
+    )
+    previous_balance = (
+        select(col(BalanceSnapshot.balance))
+        .where(
+            col(BalanceSnapshot.account_id) == deltas.c.account_id,
+            col(BalanceSnapshot.snapshot_date) < day,
+        )
+        .order_by(col(BalanceSnapshot.snapshot_date).desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+
+    statement = (
+        insert(BalanceSnapshot)
+        .from_select(
+            ["account_id", "snapshot_date", "as_of", "balance", "postings"],
+            select(
+                deltas.c.account_id,
+                literal(day),
+                literal(end),
+                func.coalesce(previous_balance, 0) + deltas.c.delta,
+                deltas.c.postings,
+            ),
+        )
+        .on_conflict_do_nothing()
+        .returning(col(BalanceSnapshot.account_id))
+    )
+    result = await session.exec(statement)
+    accounts = len(result.all())
+
+    session.add(BalanceSnapshotRun(snapshot_date=day, accounts=accounts))
+    await session.commit()
+    return accounts
+
+
+async def take_balance_snapshots(session: AsyncSession) -> list[tuple[date, int]]:
+    day = await next_snapshot_day(session)
+    if day is None:
+        return []
+
+    last_day = last_settled_day(datetime.now(timezone.utc))
+    taken: list[tuple[date, int]] = []
+
+    while day <= last_day and len(taken) < settings.BALANCE_SNAPSHOT_MAX_DAYS_PER_RUN:
+        accounts = await snapshot_day(day, session)
+        if accounts is not None:
+            taken.append((day, accounts))
+            logger.info(f"Balance snapshot for {day} written for {accounts} accounts")
+        day += timedelta(days=1)
+
+    return taken
@@ -1,20 +1,61 @@
+import asyncio
 from datetime import datetime, timezone
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from fastapi import HTTPException, status
-from sqlmodel import select
+from sqlalchemy import (
+    ARRAY,
+    Select,
+    Uuid,
+    and_,
+    any_,
+    bindparam,
+    exists,
+    func,
+    literal,
+    or_,
+    text,
+    true,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.app.auth.models import User
+from backend.app.auth.schema import RoleChoicesSchema
+from backend.app.auth.utils import format_full_name
+from backend.app.bank_account.allocator import account_number_allocator
 from backend.app.bank_account.enums import AccountStatusEnum
 from backend.app.bank_account.models import BankAccount
-from backend.app.bank_account.schema import BankAccountCreateSchema
-from backend.app.bank_account.utils import generate_account_number
+from backend.app.bank_account.name_enquiry_cache import name_enquiry_cache
+from backend.app.bank_account.schema import (
+    BankAccountActivationResultSchema,
+    BankAccountCreateSchema,
+    NameEnquiryResponseSchema,
+)
 from backend.app.core.config import settings
 from backend.app.core.logging import get_logger
+from backend.app.core.services.bank_account_activated_email import (
+    account_activated_context,
+)
+from backend.app.next_of_kin.models import NextOfKin
+from backend.app.user_profile.models import Profile
 
 logger = get_logger()
 
+LEGACY_ACCOUNT_NUMBER_ATTEMPTS = 3
+BANK_ACCOUNT_LOCK_NAMESPACE = 7_310_417
+PRIMARY_ACCOUNT_CONSTRAINT = "uq_bankaccount_user_id_primary"
+
+ACCOUNT_VIEWER_ROLES = {
+    RoleChoicesSchema.ACCOUNT_EXECUTIVE,
+    RoleChoicesSchema.BRANCH_MANAGER,
+    RoleChoicesSchema.ADMIN,
+    RoleChoicesSchema.SUPER_ADMIN,
+}
+
 
 async def get_primary_bank_account(
     user_id: UUID, session: AsyncSession
@@ -27,79 +68,205 @@ async def get_primary_bank_account(
     return result.first()
 
 
-async def validate_user_kyc(user: User) -> bool:
-    if not user.profile:
-        return False
-    if not user.next_of_kins or len(user.next_of_kins) == 0:
-        return False
-    return True
+async def get_viewable_bank_account(
+    account_id: UUID, current_user: User, session: AsyncSession
+) -> BankAccount:
+    statement = select(BankAccount).where(BankAccount.id == account_id)
+    result = await session.exec(statement)
+    account = result.first()
+
+    if not account or (
+        account.user_id != current_user.id
+        and current_user.role not in ACCOUNT_VIEWER_ROLES
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"status": "error", "message": "Bank account not found"},
+        )
+    return account
+
+
+async def name_enquiry(
+    account_number: str, session: AsyncSession
+) -> NameEnquiryResponseSchema:
+    cached = await name_enquiry_cache.get(account_number)
+    if cached is not None:
+        return cached
+
+    version = await name_enquiry_cache.version(account_number)
+    result = await session.exec(
+        select(
+            col(BankAccount.id),
+            col(BankAccount.account_number),
+            col(BankAccount.account_name),
+            col(BankAccount.currency),
+            col(BankAccount.account_status),
+            col(User.first_name),
+            col(User.middle_name),
+            col(User.last_name),
+        )
+        .join(User, col(User.id) == col(BankAccount.user_id))
+        .where(col(BankAccount.account_number) == account_number)
+    )
+    row = result.first()
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "status": "error",
+                "message": "Bank account not found",
+                "action": "Check the account number and try again",
+            },
+        )
+
+    enquiry = NameEnquiryResponseSchema(
+        account_id=row.id,
+        account_number=row.account_number,
+        account_name=row.account_name,
+        holder_name=format_full_name(row.first_name, row.middle_name, row.last_name),
+        currency=row.currency,
+        account_status=row.account_status,
+    )
+    await name_enquiry_cache.set(enquiry, version)
+    return enquiry
+
+
+def build_create_account_statement(user_id: UUID, values: dict) -> Select:
+    table = BankAccount.__table__
+
+    facts = select(
+        exists().where(col(User.id) == user_id).label("user_exists"),
+        and_(
+            exists().where(col(Profile.user_id) == user_id),
+            exists().where(col(NextOfKin.user_id) == user_id),
+        ).label("kyc_complete"),
+        select(func.count())
+        .select_from(table)
+        .where(table.c.user_id == user_id)
+        .scalar_subquery()
+        .label("account_count"),
+        exists()
+        .where(table.c.user_id == user_id, table.c.is_primary)
+        .label("primary_exists"),
+    ).cte("facts")
+
+    is_primary = values.pop("is_primary")
+    columns = list(values)
+    new_row = select(
+        *(literal(values[name], type_=table.c[name].type) for name in columns),
+        or_(literal(is_primary), facts.c.account_count == 0),
+    ).where(
+        facts.c.user_exists,
+        facts.c.kyc_complete,
+        facts.c.account_count < settings.MAX_BANK_ACCOUNTS,
+        or_(literal(not is_primary), ~facts.c.primary_exists),
+    )
+
+    inserted = (
+        insert(table)
+        .from_select([*columns, "is_primary"], new_row)
+        .returning(*table.c)
+        .cte("inserted")
+    )
+    return select(facts, inserted).select_from(facts.outerjoin(inserted, true()))
+
+
+def create_account_rejection(row) -> HTTPException:
+    if not row.user_exists:
+        return HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"status": "error", "message": "User not found"},
+        )
+    if not row.kyc_complete:
+        return HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "status": "error",
+                "message": "KYC requirements not met",
+                "action": "Please complete your profile and add at least one next of kin",
+            },
+        )
+    if row.account_count >= settings.MAX_BANK_ACCOUNTS:
+        return HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "status": "error",
+                "message": "Maximum number of accounts reached",
+            },
+        )
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail={
+            "status": "error",
+            "message": "A primary account already exists",
+            "action": "Please unset the existing primary account first",
+        },
+    )
 
 
 async def create_bank_account(
     user_id: UUID, account_data: BankAccountCreateSchema, session: AsyncSession
 ) -> BankAccount:
     try:
-        statement = select(User).where(User.id == user_id)
-        result = await session.exec(statement)
-        user = result.first()
-
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={"status": "error", "message": "User not found"},
+        # Numbers issued before the block allocator were random and can
+        # still occupy a slot in the scrambled sequence.
+        for _ in range(LEGACY_ACCOUNT_NUMBER_ATTEMPTS):
+            await session.exec(
+                text(
+                    "SELECT pg_advisory_xact_lock(:namespace, hashtext(:user_id))"
+                ).bindparams(
+                    namespace=BANK_ACCOUNT_LOCK_NAMESPACE, user_id=str(user_id)
+                )
             )
-
-        await session.refresh(user, ["profile", "next_of_kins"])
-
-        if not await validate_user_kyc(user):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "status": "error",
-                    "message": "KYC requirements not met",
-                    "action": "Please complete your profile and add at least one next of kin",
-                },
+            account_number = await account_number_allocator.allocate(
+                account_data.currency, session
             )
+            now = datetime.now(timezone.utc)
+            values = {
+                **account_data.model_dump(exclude={"account_number", "balance"}),
+                "id": uuid4(),
+                "user_id": user_id,
+                "account_number": account_number,
+                "balance": 0.0,
+                "created_at": now,
+                "updated_at": now,
+            }
 
-        statement = select(BankAccount).where(BankAccount.user_id == user_id)
-        result = await session.exec(statement)
-        existing_accounts = result.all()
-        if len(existing_accounts) >= settings.MAX_BANK_ACCOUNTS:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "status": "error",
-                    "message": "Maximum number of accounts reached",
-                },
-            )
-        if account_data.is_primary:
-            primary_exists = any(account.is_primary for account in existing_accounts)
-
-            if primary_exists:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail={
-                        "status": "error",
-                        "message": "A primary account already exists",
-                        "action": "Please unset the existing primary account first",
-                    },
+            try:
+                result = await session.exec(
+                    build_create_account_statement(user_id, values)
                 )
-        elif len(existing_accounts) == 0:
-            account_data.is_primary = True
-
-        account_number = generate_account_number(account_data.currency)
-        new_account = BankAccount(
-            **account_data.model_dump(exclude={"account_number"}),
-            user_id=user_id,
-            account_number=account_number,
-        )
+                row = result.one()
+            except IntegrityError as e:
+                await session.rollback()
+                if PRIMARY_ACCOUNT_CONSTRAINT in str(e.orig):
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail={
+                            "status": "error",
+                            "message": "A primary account already exists",
+                        },
+                    )
+                logger.warning(
+                    f"Account number {account_number} already issued, allocating another"
+                )
+                continue
 
-        session.add(new_account)
+            if row.id is None:
+                raise create_account_rejection(row)
 
-        await session.commit()
-        await session.refresh(new_account)
+            await session.commit()
+            return BankAccount.model_validate(
+                {
+                    column.name: getattr(row, column.name)
+                    for column in BankAccount.__table__.c
+                }
+            )
 
-        return new_account
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"status": "error", "message": "Failed to create account"},
+        )
 
     except HTTPException as http_ex:
         await session.rollback()
@@ -124,6 +291,7 @@ async def activate_bank_account(
             select(BankAccount, User)
             .join(User)
             .where(BankAccount.id == account_id, BankAccount.user_id != verified_by)
+            .with_for_update(of=BankAccount)
         )
         result = await session.exec(statement)
         account_user_tuple = result.first()
@@ -142,16 +310,36 @@ async def activate_bank_account(
                 detail={"status": "error", "message": "Account is already activated"},
             )
 
+        now = datetime.now(timezone.utc)
+        if (
+            account.kyc_claimed_by not in (None, verified_by)
+            and account.kyc_claim_expires_at
+            and account.kyc_claim_expires_at > now
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail={
+                    "status": "error",
+                    "message": "Account is under review by another account executive",
+                    "action": "Claim accounts from the KYC review queue",
+                },
+            )
+
         account.kyc_submitted = True
         account.kyc_verified = True
-        account.kyc_verified_on = datetime.now(timezone.utc)
+        account.kyc_verified_on = now
         account.kyc_verified_by = verified_by
         account.account_status = AccountStatusEnum.Active
+        account.kyc_claimed_by = None
+        account.kyc_claim_expires_at = None
 
         session.add(account)
         await session.commit()
         await session.refresh(account)
 
+        if account.account_number:
+            await name_enquiry_cache.invalidate(account.account_number)
+
         return account, user
 
     except HTTPException as http_ex:
@@ -164,3 +352,137 @@ async def activate_bank_account(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={"status": "error", "message": "Failed to activate bank account"},
         )
+
+
+def account_ids_param(account_ids: list[UUID]):
+    return bindparam("account_ids", account_ids, type_=ARRAY(Uuid(as_uuid=True)))
+
+
+def claim_available(reviewer_id: UUID, now: datetime):
+    return or_(
+        col(BankAccount.kyc_claim_expires_at).is_(None),
+        col(BankAccount.kyc_claim_expires_at) <= now,
+        col(BankAccount.kyc_claimed_by) == reviewer_id,
+    )
+
+
+async def activate_bank_accounts(
+    account_ids: list[UUID],
+    verified_by: UUID,
+    session: AsyncSession,
+) -> tuple[list[BankAccountActivationResultSchema], list[tuple[str, dict]]]:
+    account_ids = list(dict.fromkeys(account_ids))
+    now = datetime.now(timezone.utc)
+
+    try:
+        statement = (
+            update(BankAccount)
+            .where(
+                col(BankAccount.id) == any_(account_ids_param(account_ids)),
+                col(BankAccount.user_id) != verified_by,
+                col(BankAccount.account_status) != AccountStatusEnum.Active,
+                claim_available(verified_by, now),
+                col(User.id) == col(BankAccount.user_id),
+            )
+            .values(
+                kyc_submitted=True,
+                kyc_verified=True,
+                kyc_verified_on=now,
+                kyc_verified_by=verified_by,
+                account_status=AccountStatusEnum.Active,
+                kyc_claimed_by=None,
+                kyc_claim_expires_at=None,
+            )
+            .returning(
+                col(BankAccount.id),
+                col(BankAccount.account_number),
+                col(BankAccount.account_name),
+                col(BankAccount.account_type),
+                col(BankAccount.currency),
+                col(User.email),
+                col(User.first_name),
+                col(User.middle_name),
+                col(User.last_name),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await session.exec(statement)
+        activated = {row.id: row for row in result.all()}
+
+        skipped = {}
+        missing_ids = [
+            account_id for account_id in account_ids if account_id not in activated
+        ]
+        if missing_ids:
+            result = await session.exec(
+                select(
+                    col(BankAccount.id),
+                    col(BankAccount.user_id),
+                    col(BankAccount.account_number),
+                    col(BankAccount.account_status),
+                ).where(col(BankAccount.id) == any_(account_ids_param(missing_ids)))
+            )
+            skipped = {row.id: row for row in result.all()}
+
+        await session.commit()
+
+    except Exception as e:
+        await session.rollback()
+        logger.error(f"Failed to bulk activate bank accounts: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"status": "error", "message": "Failed to activate bank accounts"},
+        )
+
+    await asyncio.gather(
+        *(
+            name_enquiry_cache.invalidate(row.account_number)
+            for row in activated.values()
+            if row.account_number
+        )
+    )
+
+    results: list[BankAccountActivationResultSchema] = []
+    recipients: list[tuple[str, dict]] = []
+
+    for account_id in account_ids:
+        if account_id in activated:
+            row = activated[account_id]
+            results.append(
+                BankAccountActivationResultSchema(
+                    account_id=account_id,
+                    status="activated",
+                    account_number=row.account_number,
+                )
+            )
+            if row.account_number:
+                context = account_activated_context(
+                    full_name=format_full_name(
+                        row.first_name, row.middle_name, row.last_name
+                    ),
+                    account_number=row.account_number,
+                    account_name=row.account_name,
+                    account_type=row.account_type.value,
+                    currency=row.currency.value,
+                )
+                recipients.append((row.email, context))
+            continue
+
+        row = skipped.get(account_id)
+        if row is None:
+            outcome = "not_found"
+        elif row.user_id == verified_by:
+            outcome = "own_account"
+        elif row.account_status == AccountStatusEnum.Active:
+            outcome = "already_active"
+        else:
+            outcome = "claimed"
+        results.append(
+            BankAccountActivationResultSchema(
+                account_id=account_id,
+                status=outcome,
+                account_number=row.account_number if row else None,
+            )
+        )
+
+    return results, recipients
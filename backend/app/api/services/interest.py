@@ -0,0 +1,371 @@
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+import numpy as np
+from sqlalchemy import (
+    BigInteger,
+    Row,
+    String,
+    Uuid,
+    cast,
+    column,
+    func,
+    literal,
+    null,
+    or_,
+    select,
+    table,
+    text,
+    true,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects import postgresql as pg
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import col
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.app.api.services.balance_snapshot import day_bounds, last_settled_day
+from backend.app.api.services.ledger import upsert_ledger_balances
+from backend.app.bank_account.enums import AccountStatusEnum
+from backend.app.bank_account.models import BankAccount
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+from backend.app.ledger.enums import InternalAccountEnum, JournalEntryTypeEnum
+from backend.app.ledger.models import (
+    BalanceSnapshot,
+    InterestAccrualRun,
+    JournalEntry,
+    LedgerBalance,
+    Posting,
+)
+
+logger = get_logger()
+
+INTEREST_ACCRUAL_LOCK_ID = 7_310_416_002
+RATE_PRECISION = 1_000_000
+INT64_MAX = np.iinfo(np.int64).max
+
+interest_accrual_stage = table(
+    "interest_accrual_stage",
+    column("account_id", Uuid),
+    column("amount", BigInteger),
+    column("journal_entry_id", Uuid),
+)
+
+
+def divide_half_even(numerator: np.ndarray, denominator: int) -> np.ndarray:
+    quotient = numerator // denominator
+    remainder = numerator % denominator
+    twice = remainder * 2
+    round_up = (twice > denominator) | ((twice == denominator) & (quotient % 2 == 1))
+    return quotient + round_up
+
+
+def compute_daily_accruals(
+    balances: np.ndarray, rates: np.ndarray, day_count: int
+) -> np.ndarray:
+    # interest_rate is an annual percentage; scale it to an integer number of
+    # millionths so the accrual is computed exactly in minor units.
+    rates_ppm = np.rint(np.clip(rates, 0, None) / 100 * RATE_PRECISION).astype(
+        np.int64
+    )
+    balances = np.clip(balances, 0, None).astype(np.int64)
+    denominator = RATE_PRECISION * day_count
+
+    accruals = np.zeros(len(balances), dtype=np.int64)
+    fits = balances <= INT64_MAX // np.maximum(rates_ppm, 1)
+    accruals[fits] = divide_half_even(balances[fits] * rates_ppm[fits], denominator)
+
+    if not fits.all():
+        overflow = ~fits
+        numerator = balances[overflow].astype(object) * rates_ppm[overflow].astype(
+            object
+        )
+        accruals[overflow] = divide_half_even(numerator, denominator)
+
+    return accruals
+
+
+def accrual_candidates(day: date, after: uuid.UUID | None):
+    # Interest for a day accrues on that day's closing balance: the latest
+    # snapshot up to the day plus any postings after it, as get_balance_at
+    # does for a single account.
+    _, cutoff = day_bounds(day)
+    snapshot = (
+        select(col(BalanceSnapshot.balance), col(BalanceSnapshot.as_of))
+        .where(
+            col(BalanceSnapshot.account_id) == col(BankAccount.id),
+            col(BalanceSnapshot.snapshot_date) <= day,
+        )
+        .order_by(col(BalanceSnapshot.snapshot_date).desc())
+        .limit(1)
+        .lateral("snapshot")
+    )
+    postings_since = (
+        select(func.coalesce(func.sum(col(Posting.amount)), 0))
+        .where(
+            col(Posting.account_id) == col(BankAccount.id),
+            col(Posting.created_at) < cutoff,
+            or_(
+                snapshot.c.as_of.is_(None),
+                col(Posting.created_at) >= snapshot.c.as_of,
+            ),
+        )
+        .scalar_subquery()
+    )
+    closing = (
+        select(
+            col(BankAccount.id).label("id"),
+            cast(
+                func.coalesce(snapshot.c.balance, 0) + postings_since, BigInteger
+            ).label("balance"),
+            col(BankAccount.interest_rate).label("interest_rate"),
+        )
+        .outerjoin(snapshot, true())
+        .where(
+            col(BankAccount.account_status) == AccountStatusEnum.Active,
+            col(BankAccount.interest_rate) > 0,
+        )
+    )
+    if after is not None:
+        closing = closing.where(col(BankAccount.id) > after)
+    closing = closing.subquery("closing")
+
+    return select(closing).where(closing.c.balance > 0).order_by(closing.c.id)
+
+
+async def stage_accruals(
+    records: list[tuple[uuid.UUID, int]], session: AsyncSession
+) -> None:
+    await session.exec(
+        text(
+            "CREATE TEMP TABLE interest_accrual_stage ("
+            "account_id uuid PRIMARY KEY, amount bigint NOT NULL, "
+            "journal_entry_id uuid) ON COMMIT DROP"
+        )
+    )
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        "interest_accrual_stage", records=records, columns=["account_id", "amount"]
+    )
+
+
+async def post_staged_accruals(day: date, session: AsyncSession) -> int:
+    stage = interest_accrual_stage
+
+    await session.exec(
+        select(col(BankAccount.id))
+        .join(stage, stage.c.account_id == col(BankAccount.id))
+        .order_by(col(BankAccount.id))
+        .with_for_update(of=BankAccount)
+    )
+
+    idempotency_key = literal(f"interest:{day.isoformat()}:") + cast(
+        stage.c.account_id, String
+    )
+    entry_type = col(JournalEntry.entry_type).type
+    entries = (
+        insert(JournalEntry)
+        .from_select(
+            ["id", "idempotency_key", "entry_type", "description"],
+            select(
+                func.gen_random_uuid(),
+                idempotency_key,
+                literal(JournalEntryTypeEnum.Interest, entry_type),
+                literal(f"Interest accrued for {day.isoformat()}"),
+            ).select_from(stage),
+        )
+        .on_conflict_do_nothing(index_elements=[col(JournalEntry.idempotency_key)])
+        .returning(col(JournalEntry.id), col(JournalEntry.idempotency_key))
+        .cte("entries")
+    )
+    await session.exec(
+        update(stage)
+        .where(entries.c.idempotency_key == idempotency_key)
+        .values(journal_entry_id=entries.c.id)
+    )
+
+    posted = (
+        select(
+            stage.c.journal_entry_id,
+            stage.c.account_id,
+            stage.c.amount,
+            col(BankAccount.currency),
+        )
+        .join(BankAccount, col(BankAccount.id) == stage.c.account_id)
+        .where(stage.c.journal_entry_id.is_not(None))
+        .subquery()
+    )
+    internal_account_type = col(Posting.internal_account).type
+    await session.exec(
+        insert(Posting).from_select(
+            [
+                "journal_entry_id",
+                "account_id",
+                "internal_account",
+                "currency",
+                "amount",
+            ],
+            union_all(
+                select(
+                    posted.c.journal_entry_id,
+                    posted.c.account_id,
+                    cast(null(), internal_account_type),
+                    posted.c.currency,
+                    posted.c.amount,
+                ),
+                select(
+                    posted.c.journal_entry_id,
+                    cast(null(), Uuid),
+                    literal(
+                        InternalAccountEnum.InterestExpense, internal_account_type
+                    ),
+                    posted.c.currency,
+                    -posted.c.amount,
+                ),
+            ),
+        )
+    )
+
+    now = datetime.now(timezone.utc)
+    balances = await upsert_ledger_balances(
+        insert(LedgerBalance).from_select(
+            ["account_id", "currency", "balance", "version", "updated_at"],
+            select(
+                posted.c.account_id,
+                posted.c.currency,
+                posted.c.amount,
+                literal(1, BigInteger),
+                literal(now, pg.TIMESTAMP(timezone=True)),
+            ),
+        ),
+        now,
+        session,
+    )
+    return len(balances)
+
+
+async def accrue_chunk(day: date, rows: list[Row], session: AsyncSession) -> int:
+    account_ids = [row.id for row in rows]
+    balances = np.fromiter((row.balance for row in rows), np.int64, len(rows))
+    rates = np.fromiter((row.interest_rate for row in rows), np.float64, len(rows))
+    accruals = compute_daily_accruals(
+        balances, rates, settings.INTEREST_ACCRUAL_DAY_COUNT
+    )
+
+    records = [
+        (account_id, amount)
+        for account_id, amount in zip(account_ids, accruals.tolist())
+        if amount > 0
+    ]
+    accrued = 0
+    if records:
+        await stage_accruals(records, session)
+        accrued = await post_staged_accruals(day, session)
+
+    await session.exec(
+        update(InterestAccrualRun)
+        .where(col(InterestAccrualRun.accrual_date) == day)
+        .values(
+            last_account_id=account_ids[-1],
+            accounts=col(InterestAccrualRun.accounts) + accrued,
+            chunks=col(InterestAccrualRun.chunks) + 1,
+            updated_at=datetime.now(timezone.utc),
+        )
+    )
+    await session.commit()
+    return accrued
+
+
+async def accrue_interest_for_day(
+    day: date, reader: AsyncSession, writer: AsyncSession
+) -> int | None:
+    await writer.exec(
+        insert(InterestAccrualRun)
+        .values(accrual_date=day, accounts=0, chunks=0)
+        .on_conflict_do_nothing()
+    )
+    result = await writer.exec(
+        select(
+            col(InterestAccrualRun.last_account_id),
+            col(InterestAccrualRun.completed_at),
+        ).where(col(InterestAccrualRun.accrual_date) == day)
+    )
+    run = result.one()
+    await writer.commit()
+
+    if run.completed_at is not None:
+        return None
+    if run.last_account_id is not None:
+        logger.info(f"Resuming interest accrual for {day} after {run.last_account_id}")
+
+    chunk_size = settings.INTEREST_ACCRUAL_CHUNK_SIZE
+    result = await reader.stream(
+        accrual_candidates(day, run.last_account_id).execution_options(
+            yield_per=chunk_size
+        )
+    )
+    async for rows in result.partitions(chunk_size):
+        await accrue_chunk(day, rows, writer)
+
+    result = await writer.exec(
+        update(InterestAccrualRun)
+        .where(col(InterestAccrualRun.accrual_date) == day)
+        .values(completed_at=datetime.now(timezone.utc))
+        .returning(col(InterestAccrualRun.accounts))
+    )
+    accounts = result.scalar_one()
+    await writer.commit()
+    return accounts
+
+
+async def next_accrual_day(session: AsyncSession, last_day: date) -> date:
+    result = await session.exec(
+        select(func.min(col(InterestAccrualRun.accrual_date))).where(
+            col(InterestAccrualRun.completed_at).is_(None)
+        )
+    )
+    unfinished = result.scalar()
+    if unfinished is not None:
+        return unfinished
+
+    result = await session.exec(select(func.max(col(InterestAccrualRun.accrual_date))))
+    last_run = result.scalar()
+    if last_run is not None:
+        return last_run + timedelta(days=1)
+    return last_day
+
+
+async def accrue_interest(
+    reader: AsyncSession, writer: AsyncSession
+) -> list[tuple[date, int]]:
+    result = await reader.exec(
+        text("SELECT pg_try_advisory_xact_lock(:lock_id)").bindparams(
+            lock_id=INTEREST_ACCRUAL_LOCK_ID
+        )
+    )
+    if not result.scalar():
+        logger.info("Interest accrual is already running elsewhere")
+        await reader.rollback()
+        return []
+
+    accrued: list[tuple[date, int]] = []
+    try:
+        last_day = last_settled_day(datetime.now(timezone.utc))
+        day = await next_accrual_day(writer, last_day)
+
+        while (
+            day <= last_day
+            and len(accrued) < settings.INTEREST_ACCRUAL_MAX_DAYS_PER_RUN
+        ):
+            accounts = await accrue_interest_for_day(day, reader, writer)
+            if accounts is not None:
+                accrued.append((day, accounts))
+                logger.info(f"Interest for {day} accrued on {accounts} accounts")
+            day += timedelta(days=1)
+    finally:
+        await reader.rollback()
+
+    return accrued
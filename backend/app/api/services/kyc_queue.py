@@ -0,0 +1,139 @@
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import any_, update
+from sqlalchemy.orm import joinedload
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.app.api.services.bank_account import account_ids_param, claim_available
+from backend.app.auth.models import User
+from backend.app.bank_account.enums import AccountStatusEnum
+from backend.app.bank_account.models import BankAccount
+from backend.app.bank_account.schema import (
+    BankAccountReadSchema,
+    KycApplicantSchema,
+    KycReviewItemSchema,
+)
+from backend.app.core.config import settings
+from backend.app.core.loading import LoadPlan, related_loader
+from backend.app.core.logging import get_logger
+from backend.app.next_of_kin.models import NextOfKin
+from backend.app.next_of_kin.schema import NextOfKinReadSchema
+from backend.app.user_profile.schema import ProfileBaseSchema
+
+logger = get_logger()
+
+KYC_REVIEW_LOAD_PLAN = LoadPlan(joinedload(BankAccount.user).joinedload(User.profile))
+
+
+async def load_review_items(
+    account_ids: list[UUID], session: AsyncSession
+) -> list[KycReviewItemSchema]:
+    if not account_ids:
+        return []
+
+    result = await session.exec(
+        KYC_REVIEW_LOAD_PLAN.apply(
+            select(BankAccount)
+            .where(col(BankAccount.id) == any_(account_ids_param(account_ids)))
+            .order_by(col(BankAccount.created_at), col(BankAccount.id))
+        )
+    )
+    accounts = result.all()
+
+    next_of_kin_loader = related_loader(session, NextOfKin, col(NextOfKin.user_id))
+    next_of_kins = await next_of_kin_loader.load_many(
+        [account.user_id for account in accounts]
+    )
+
+    return [
+        KycReviewItemSchema(
+            account=BankAccountReadSchema.model_validate(account),
+            applicant=KycApplicantSchema(
+                id=account.user.id,
+                email=account.user.email,
+                full_name=account.user.full_name,
+                id_no=account.user.id_no,
+            ),
+            profile=(
+                ProfileBaseSchema.model_validate(account.user.profile)
+                if account.user.profile
+                else None
+            ),
+            next_of_kins=[NextOfKinReadSchema.model_validate(kin) for kin in kins],
+        )
+        for account, kins in zip(accounts, next_of_kins)
+    ]
+
+
+async def claim_pending_accounts(
+    reviewer_id: UUID, limit: int, session: AsyncSession
+) -> tuple[list[KycReviewItemSchema], datetime]:
+    limit = min(limit, settings.KYC_CLAIM_MAX_BATCH)
+    now = datetime.now(timezone.utc)
+    lease_expires_at = now + timedelta(minutes=settings.KYC_CLAIM_LEASE_MINUTES)
+
+    try:
+        candidates = (
+            select(col(BankAccount.id))
+            .where(
+                col(BankAccount.account_status) == AccountStatusEnum.Pending,
+                col(BankAccount.user_id) != reviewer_id,
+                claim_available(reviewer_id, now),
+            )
+            .order_by(col(BankAccount.created_at), col(BankAccount.id))
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .cte("candidates")
+        )
+        result = await session.exec(
+            update(BankAccount)
+            .where(col(BankAccount.id) == candidates.c.id)
+            .values(kyc_claimed_by=reviewer_id, kyc_claim_expires_at=lease_expires_at)
+            .returning(col(BankAccount.id))
+            .execution_options(synchronize_session=False)
+        )
+        claimed_ids = list(result.scalars().all())
+
+        items = await load_review_items(claimed_ids, session)
+        await session.commit()
+
+        return items, lease_expires_at
+
+    except Exception as e:
+        await session.rollback()
+        logger.error(f"Failed to claim pending bank accounts: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"status": "error", "message": "Failed to claim pending accounts"},
+        )
+
+
+async def release_claimed_accounts(
+    account_ids: list[UUID], reviewer_id: UUID, session: AsyncSession
+) -> int:
+    try:
+        result = await session.exec(
+            update(BankAccount)
+            .where(
+                col(BankAccount.id) == any_(account_ids_param(account_ids)),
+                col(BankAccount.kyc_claimed_by) == reviewer_id,
+            )
+            .values(kyc_claimed_by=None, kyc_claim_expires_at=None)
+            .returning(col(BankAccount.id))
+            .execution_options(synchronize_session=False)
+        )
+        released = len(result.all())
+        await session.commit()
+
+        return released
+
+    except Exception as e:
+        await session.rollback()
+        logger.error(f"Failed to release claimed bank accounts: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"status": "error", "message": "Failed to release claimed accounts"},
+        )
@@ -0,0 +1,272 @@
+import uuid
+from collections import defaultdict
+from datetime import date, datetime, timezone
+
+from fastapi import HTTPException, status
+from sqlalchemy import Numeric, Row, case, cast, func, select, update
+from sqlalchemy.dialects.postgresql import Insert, insert
+from sqlmodel import col
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.app.bank_account.enums import AccountCurrencyEnum
+from backend.app.bank_account.models import BankAccount
+from backend.app.core.logging import get_logger
+from backend.app.ledger.models import (
+    BalanceSnapshot,
+    JournalEntry,
+    LedgerBalance,
+    Posting,
+)
+from backend.app.ledger.schema import JournalEntryCreateSchema
+from backend.app.ledger.utils import CURRENCY_EXPONENTS
+
+logger = get_logger()
+
+
+def validate_journal_entry(entry: JournalEntryCreateSchema) -> None:
+    totals: dict[AccountCurrencyEnum, int] = defaultdict(int)
+    for posting in entry.postings:
+        totals[posting.currency] += posting.amount
+
+    unbalanced = [currency.value for currency, total in totals.items() if total != 0]
+    if unbalanced:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "status": "error",
+                "message": f"Journal entry is not balanced in {', '.join(unbalanced)}",
+                "action": "Make sure debits and credits sum to zero per currency",
+            },
+        )
+
+
+def collect_balance_deltas(
+    entries: list[JournalEntryCreateSchema],
+) -> list[dict]:
+    deltas: dict[uuid.UUID, dict] = {}
+    for entry in entries:
+        for posting in entry.postings:
+            if posting.account_id is None:
+                continue
+            delta = deltas.setdefault(
+                posting.account_id,
+                {
+                    "account_id": posting.account_id,
+                    "currency": posting.currency,
+                    "balance": 0,
+                    "version": 0,
+                },
+            )
+            delta["balance"] += posting.amount
+            delta["version"] += 1
+
+    return [deltas[account_id] for account_id in sorted(deltas)]
+
+
+async def lock_bank_accounts(
+    account_ids: list[uuid.UUID], session: AsyncSession
+) -> dict[uuid.UUID, Row]:
+    result = await session.exec(
+        select(
+            col(BankAccount.id),
+            col(BankAccount.user_id),
+            col(BankAccount.account_number),
+            col(BankAccount.currency),
+            col(BankAccount.account_status),
+        )
+        .where(col(BankAccount.id).in_(sorted(account_ids)))
+        .order_by(col(BankAccount.id))
+        .with_for_update()
+    )
+    return {row.id: row for row in result.all()}
+
+
+async def apply_balance_deltas(
+    deltas: list[dict], session: AsyncSession, accounts_locked: bool = False
+) -> dict[uuid.UUID, int]:
+    if not deltas:
+        return {}
+
+    # Every writer locks bankaccount rows first, in id order, so the
+    # ledgerbalance and bankaccount updates below can never deadlock.
+    if not accounts_locked:
+        await lock_bank_accounts([delta["account_id"] for delta in deltas], session)
+
+    now = datetime.now(timezone.utc)
+    balances = await upsert_ledger_balances(
+        insert(LedgerBalance).values(
+            [{**delta, "updated_at": now} for delta in deltas]
+        ),
+        now,
+        session,
+    )
+    if len(balances) != len(deltas):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "status": "error",
+                "message": "Posting currency does not match the account currency",
+            },
+        )
+    return balances
+
+
+async def upsert_ledger_balances(
+    upsert: Insert, now: datetime, session: AsyncSession
+) -> dict[uuid.UUID, int]:
+    upsert = upsert.on_conflict_do_update(
+        index_elements=[col(LedgerBalance.account_id)],
+        set_={
+            "balance": col(LedgerBalance.balance) + upsert.excluded.balance,
+            "version": col(LedgerBalance.version) + upsert.excluded.version,
+            "updated_at": upsert.excluded.updated_at,
+        },
+    ).returning(
+        col(LedgerBalance.account_id),
+        col(LedgerBalance.currency),
+        col(LedgerBalance.balance),
+    )
+    upserted = upsert.cte("upserted")
+
+    scale = case(
+        {
+            currency: 10**exponent
+            for currency, exponent in CURRENCY_EXPONENTS.items()
+        },
+        value=col(BankAccount.currency),
+    )
+    statement = (
+        update(BankAccount)
+        .where(
+            col(BankAccount.id) == upserted.c.account_id,
+            col(BankAccount.currency) == upserted.c.currency,
+        )
+        .values(balance=cast(upserted.c.balance, Numeric) / scale, updated_at=now)
+        .returning(col(BankAccount.id), upserted.c.balance)
+    )
+
+    result = await session.exec(statement)
+    return dict(result.all())
+
+
+async def post_journal_entries(
+    entries: list[JournalEntryCreateSchema],
+    session: AsyncSession,
+    accounts_locked: bool = False,
+) -> tuple[dict[str, uuid.UUID], set[str], dict[uuid.UUID, int]]:
+    for entry in entries:
+        validate_journal_entry(entry)
+
+    unique_entries: list[JournalEntryCreateSchema] = []
+    seen_keys: set[str] = set()
+    for entry in entries:
+        if entry.idempotency_key not in seen_keys:
+            seen_keys.add(entry.idempotency_key)
+            unique_entries.append(entry)
+
+    now = datetime.now(timezone.utc)
+    entry_ids = {entry.idempotency_key: uuid.uuid4() for entry in unique_entries}
+
+    result = await session.exec(
+        insert(JournalEntry)
+        .values(
+            [
+                {
+                    "id": entry_ids[entry.idempotency_key],
+                    "idempotency_key": entry.idempotency_key,
+                    "entry_type": entry.entry_type,
+                    "description": entry.description,
+                    "created_at": now,
+                }
+                for entry in unique_entries
+            ]
+        )
+        .on_conflict_do_nothing(index_elements=[col(JournalEntry.idempotency_key)])
+        .returning(col(JournalEntry.idempotency_key))
+    )
+    created_keys = set(result.scalars().all())
+
+    duplicate_keys = [key for key in entry_ids if key not in created_keys]
+    if duplicate_keys:
+        existing = await session.exec(
+            select(col(JournalEntry.idempotency_key), col(JournalEntry.id)).where(
+                col(JournalEntry.idempotency_key).in_(duplicate_keys)
+            )
+        )
+        entry_ids.update(dict(existing.all()))
+        logger.info(f"Skipped {len(duplicate_keys)} already posted journal entries")
+
+    created_entries = [
+        entry for entry in unique_entries if entry.idempotency_key in created_keys
+    ]
+    if not created_entries:
+        return entry_ids, created_keys, {}
+
+    await session.exec(
+        insert(Posting).values(
+            [
+                {
+                    **posting.model_dump(),
+                    "journal_entry_id": entry_ids[entry.idempotency_key],
+                    "created_at": now,
+                }
+                for entry in created_entries
+                for posting in entry.postings
+            ]
+        )
+    )
+
+    balances = await apply_balance_deltas(
+        collect_balance_deltas(created_entries), session, accounts_locked
+    )
+    return entry_ids, created_keys, balances
+
+
+async def post_journal_entry(
+    entry: JournalEntryCreateSchema, session: AsyncSession
+) -> tuple[uuid.UUID, bool]:
+    entry_ids, created_keys, _ = await post_journal_entries([entry], session)
+    return entry_ids[entry.idempotency_key], entry.idempotency_key in created_keys
+
+
+async def get_ledger_balances(
+    account_ids: list[uuid.UUID], session: AsyncSession
+) -> dict[uuid.UUID, int]:
+    result = await session.exec(
+        select(col(LedgerBalance.account_id), col(LedgerBalance.balance)).where(
+            col(LedgerBalance.account_id).in_(account_ids)
+        )
+    )
+    return dict(result.all())
+
+
+async def get_balance_at(
+    account_id: uuid.UUID, at: datetime, session: AsyncSession
+) -> tuple[int, date | None]:
+    snapshot_result = await session.exec(
+        select(
+            col(BalanceSnapshot.snapshot_date),
+            col(BalanceSnapshot.as_of),
+            col(BalanceSnapshot.balance),
+        )
+        .where(
+            col(BalanceSnapshot.account_id) == account_id,
+            col(BalanceSnapshot.snapshot_date) < at.astimezone(timezone.utc).date(),
+        )
+        .order_by(col(BalanceSnapshot.snapshot_date).desc())
+        .limit(1)
+    )
+    snapshot = snapshot_result.first()
+
+    statement = select(func.coalesce(func.sum(col(Posting.amount)), 0)).where(
+        col(Posting.account_id) == account_id,
+        col(Posting.created_at) < at,
+    )
+    if snapshot is None:
+        result = await session.exec(statement)
+        return result.scalar_one(), None
+
+    result = await session.exec(
+        statement.where(col(Posting.created_at) >= snapshot.as_of)
+    )
+    return snapshot.balance + result.scalar_one(), snapshot.snapshot_date
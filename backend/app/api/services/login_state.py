@@ -0,0 +1,145 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import and_, case, literal, not_, update
+from sqlmodel import col
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.app.auth.login_attempts import login_attempt_counter
+from backend.app.auth.models import User
+from backend.app.auth.otp_store import OTPVerifyResult, otp_store
+from backend.app.auth.principal_cache import principal_cache
+from backend.app.auth.schema import AccountStatusSchema
+from backend.app.auth.utils import generate_otp
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+
+class LoginStateEngine:
+    @staticmethod
+    def _status(value: AccountStatusSchema):
+        return literal(value, type_=User.__table__.c.account_status.type)
+
+    @staticmethod
+    def _lockout_cutoff(now: datetime) -> datetime:
+        return now - timedelta(minutes=settings.LOCKOUT_DURATION_MINUTES)
+
+    def _active_lockout(self, now: datetime):
+        return and_(
+            col(User.account_status) == AccountStatusSchema.LOCKED,
+            col(User.last_failed_login).is_not(None),
+            col(User.last_failed_login) > self._lockout_cutoff(now),
+        )
+
+    def _unlocked_status(self):
+        return case(
+            (
+                col(User.account_status) == AccountStatusSchema.LOCKED,
+                self._status(AccountStatusSchema.ACTIVE),
+            ),
+            else_=col(User.account_status),
+        )
+
+    def lockout_remaining_minutes(self, user: User) -> int | None:
+        if user.account_status != AccountStatusSchema.LOCKED:
+            return None
+
+        if user.last_failed_login is None:
+            return None
+
+        lockout_time = user.last_failed_login + timedelta(
+            minutes=settings.LOCKOUT_DURATION_MINUTES
+        )
+        current_time = datetime.now(timezone.utc)
+
+        if current_time >= lockout_time:
+            return None
+
+        return int((lockout_time - current_time).total_seconds() / 60)
+
+    async def reset_login_failures(self, user: User, session: AsyncSession) -> bool:
+        if user.account_status == AccountStatusSchema.LOCKED:
+            now = datetime.now(timezone.utc)
+            statement = (
+                update(User)
+                .where(col(User.id) == user.id, not_(self._active_lockout(now)))
+                .values(last_failed_login=None, account_status=self._unlocked_status())
+                .returning(col(User.account_status))
+            )
+            result = await session.exec(statement)
+            row = result.first()
+            await session.commit()
+
+            if row is None:
+                return False
+
+            user.last_failed_login = None
+            user.account_status = row[0]
+            await principal_cache.invalidate(user.id)
+
+        await login_attempt_counter.reset(str(user.id))
+        return True
+
+    async def issue_otp(self, user: User, session: AsyncSession) -> str | None:
+        if not user.is_active or self.lockout_remaining_minutes(user) is not None:
+            return None
+
+        if not await self.reset_login_failures(user, session):
+            return None
+
+        otp = generate_otp()
+        await otp_store.issue(
+            str(user.id), otp, settings.OTP_EXPIRATION_MINUTES * 60
+        )
+        return otp
+
+    async def clear_otp(self, user_id: uuid.UUID) -> None:
+        await otp_store.clear(str(user_id))
+
+    async def record_failed_attempt(
+        self, user: User, session: AsyncSession
+    ) -> tuple[int, bool] | None:
+        if self.lockout_remaining_minutes(user) is not None:
+            return None
+
+        attempts, reached_limit = await login_attempt_counter.record_failure(
+            str(user.id)
+        )
+        if not reached_limit:
+            return attempts, False
+
+        now = datetime.now(timezone.utc)
+        statement = (
+            update(User)
+            .where(col(User.id) == user.id, not_(self._active_lockout(now)))
+            .values(
+                account_status=self._status(AccountStatusSchema.LOCKED),
+                last_failed_login=now,
+            )
+            .returning(col(User.id))
+        )
+        result = await session.exec(statement)
+        locked = result.first() is not None
+        await session.commit()
+
+        if not locked:
+            return None
+
+        user.account_status = AccountStatusSchema.LOCKED
+        user.last_failed_login = now
+        await principal_cache.invalidate(user.id)
+        return attempts, True
+
+    async def verify_otp(
+        self, user: User, otp: str, session: AsyncSession
+    ) -> OTPVerifyResult:
+        result = await otp_store.verify(str(user.id), otp)
+
+        if result == OTPVerifyResult.VALID:
+            await self.reset_login_failures(user, session)
+        return result
+
+
+login_state_engine = LoginStateEngine()
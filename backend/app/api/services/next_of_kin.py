@@ -1,10 +1,12 @@
 from uuid import UUID
 
 from fastapi import HTTPException, status
-from sqlmodel import select
+from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from backend.app.core.loading import LoadPlan
 from backend.app.core.logging import get_logger
+from backend.app.core.utils.etag import row_version, weak_etag
 from backend.app.next_of_kin.models import NextOfKin
 from backend.app.next_of_kin.schema import (
     NextOfKinCreateSchema,
@@ -14,6 +16,8 @@ from backend.app.next_of_kin.schema import (
 
 logger = get_logger()
 
+NEXT_OF_KIN_LOAD_PLAN = LoadPlan()
+
 
 async def get_next_of_kin_count(user_id: UUID, session: AsyncSession) -> int:
     statement = select(NextOfKin).where(NextOfKin.user_id == user_id)
@@ -89,11 +93,24 @@ async def create_next_of_kin(
         )
 
 
+async def get_next_of_kins_etag(user_id: UUID, session: AsyncSession) -> str:
+    result = await session.exec(
+        select(
+            col(NextOfKin.id), col(NextOfKin.updated_at), row_version(NextOfKin)
+        )
+        .where(col(NextOfKin.user_id) == user_id)
+        .order_by(col(NextOfKin.id))
+    )
+    return weak_etag(user_id, *(tuple(row) for row in result.all()))
+
+
 async def get_user_next_of_kins(
     user_id: UUID, session: AsyncSession
 ) -> list[NextOfKin]:
     try:
-        statement = select(NextOfKin).where(NextOfKin.user_id == user_id)
+        statement = NEXT_OF_KIN_LOAD_PLAN.apply(
+            select(NextOfKin).where(NextOfKin.user_id == user_id)
+        )
         result = await session.exec(statement)
         next_of_kins = list(result.all())
         return next_of_kins
@@ -1,12 +1,26 @@
 import uuid
+from typing import Literal
 
 from fastapi import HTTPException, status
+from sqlalchemy import case, func, literal, literal_column, text, tuple_, union
+from sqlalchemy.orm import selectinload
 from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.app.auth.models import User
+from backend.app.auth.principal_cache import principal_cache
+from backend.app.core.config import settings
+from backend.app.core.loading import LoadPlan
 from backend.app.core.logging import get_logger
 from backend.app.core.tasks.image_upload import upload_profile_image_task
+from backend.app.core.utils.etag import row_version, weak_etag
+from backend.app.core.utils.pagination import (
+    decode_cursor,
+    decode_rank_cursor,
+    encode_cursor,
+    encode_rank_cursor,
+    estimate_row_count,
+)
 from backend.app.user_profile.enums import ImageTypeEnum
 from backend.app.user_profile.models import Profile
 from backend.app.user_profile.schema import (
@@ -17,6 +31,10 @@ from backend.app.user_profile.schema import (
 
 logger = get_logger()
 
+PROFILE_LOAD_PLAN = LoadPlan(selectinload(User.profile))
+
+MAX_ID_NO = 2**31 - 1
+
 
 async def get_user_profile(user_id: uuid.UUID, session: AsyncSession) -> Profile | None:
     try:
@@ -53,6 +71,7 @@ async def create_user_profile(
 
         await session.commit()
         await session.refresh(profile)
+        await principal_cache.invalidate(user_id)
 
         logger.info(f"Created profile for user {user_id}")
         return profile
@@ -93,6 +112,7 @@ async def update_user_profile(
 
         await session.commit()
         await session.refresh(profile)
+        await principal_cache.invalidate(user_id)
 
         logger.info(f"Updated profile for user {user_id}")
         return profile
@@ -159,6 +179,7 @@ async def update_profile_image_url(
         await session.commit()
 
         await session.refresh(profile)
+        await principal_cache.invalidate(user_id)
 
         return profile
     except HTTPException as http_ex:
@@ -171,14 +192,30 @@ async def update_profile_image_url(
         )
 
 
+async def get_profile_etag(user_id: uuid.UUID, session: AsyncSession) -> str | None:
+    result = await session.exec(
+        select(
+            col(User.updated_at),
+            row_version(User),
+            col(Profile.updated_at),
+            row_version(Profile),
+        )
+        .outerjoin(Profile, col(Profile.user_id) == col(User.id))
+        .where(col(User.id) == user_id)
+    )
+    row = result.first()
+    if row is None:
+        return None
+    return weak_etag(user_id, *row)
+
+
 async def get_user_with_profile(user_id: uuid.UUID, session: AsyncSession) -> User:
     try:
-        statement = select(User).where(User.id == user_id)
+        statement = PROFILE_LOAD_PLAN.apply(select(User).where(User.id == user_id))
         result = await session.exec(statement)
         user = result.first()
 
         if user:
-            await session.refresh(user, ["profile"])
             return user
         else:
             raise HTTPException(
@@ -193,50 +230,164 @@ async def get_user_with_profile(user_id: uuid.UUID, session: AsyncSession) -> Us
         )
 
 
+def ensure_branch_manager(current_user: User) -> None:
+    if current_user.role != RoleChoicesSchema.BRANCH_MANAGER:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={
+                "status": "error",
+                "message": "Access denied",
+                "action": "Only branch managers can access all profiles",
+            },
+        )
+
+
+def invalid_cursor_error() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail={
+            "status": "error",
+            "message": "Invalid pagination cursor",
+            "action": "Use the next_cursor returned by the previous page",
+        },
+    )
+
+
 async def get_all_user_profiles(
     session: AsyncSession,
     current_user: User,
-    skip: int = 0,
+    cursor: str | None = None,
     limit: int = 20,
-) -> tuple[list[User], int]:
+    total_mode: Literal["none", "exact", "estimate"] = "none",
+) -> tuple[list[User], str | None, int | None, bool]:
     try:
-        if current_user.role != RoleChoicesSchema.BRANCH_MANAGER:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail={
-                    "status": "error",
-                    "message": "Access denied",
-                    "action": "Only branch managers can access all profiles",
-                },
+        ensure_branch_manager(current_user)
+
+        statement = PROFILE_LOAD_PLAN.apply(
+            select(User)
+            .order_by(col(User.created_at).desc(), col(User.id).desc())
+            .limit(limit + 1)
+        )
+        if cursor is not None:
+            try:
+                created_at, user_id = decode_cursor(cursor)
+            except ValueError:
+                raise invalid_cursor_error()
+            statement = statement.where(
+                tuple_(col(User.created_at), col(User.id)) < tuple_(created_at, user_id)
             )
 
-        count_statement = select(User)
+        result = await session.exec(statement)
+        users = list(result.all())
+
+        next_cursor = None
+        if len(users) > limit:
+            users = users[:limit]
+            next_cursor = encode_cursor(users[-1].created_at, users[-1].id)
+
+        total_count = None
+        if total_mode == "estimate":
+            total_count = await estimate_row_count(User.__tablename__, session)
+        total_is_estimate = total_count is not None
+        if total_mode == "exact" or (total_mode == "estimate" and total_count is None):
+            result = await session.exec(select(func.count()).select_from(User))
+            total_count = result.one()
+
+        return users, next_cursor, total_count, total_is_estimate
+
+    except HTTPException as http_ex:
+        raise http_ex
+    except Exception as e:
+        logger.error(f"Error fetching all user profiles: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "status": "error",
+                "message": "Failed to fetch user profiles",
+                "action": "Please try again later",
+            },
+        )
 
-        result = await session.exec(count_statement)
 
-        total_count = len(result.all())
+def user_search_name():
+    # Must match the expression of ix_user_full_name_trgm for the index to be used.
+    return (
+        col(User.first_name).concat(literal_column("' '")).concat(col(User.last_name))
+    )
 
-        statement = (
-            select(User).offset(skip).limit(limit).order_by(col(User.created_at).desc())
+
+async def search_user_profiles(
+    session: AsyncSession,
+    current_user: User,
+    query: str,
+    cursor: str | None = None,
+    limit: int = 20,
+) -> tuple[list[tuple[User, float]], str | None]:
+    try:
+        ensure_branch_manager(current_user)
+
+        query = query.strip()
+        name = user_search_name()
+        word_match = literal(query).op("<%", precedence=100)
+        matches = [
+            select(col(User.id)).where(word_match(name)),
+            select(col(User.id)).where(word_match(col(User.email))),
+            select(col(Profile.user_id)).where(word_match(col(Profile.phone_number))),
+        ]
+        id_no_match = literal(0.0)
+        if query.isdigit() and int(query) <= MAX_ID_NO:
+            matches.append(select(col(User.id)).where(col(User.id_no) == int(query)))
+            id_no_match = case((col(User.id_no) == int(query), 1.0), else_=0.0)
+        candidates = union(*matches).subquery()
+
+        score = func.greatest(
+            func.word_similarity(query, name),
+            func.word_similarity(query, col(User.email)),
+            func.coalesce(func.word_similarity(query, col(Profile.phone_number)), 0),
+            id_no_match,
         )
-        result = await session.exec(statement)
+        statement = PROFILE_LOAD_PLAN.apply(
+            select(User, score.label("score"))
+            .outerjoin(Profile, col(Profile.user_id) == col(User.id))
+            .where(col(User.id).in_(select(candidates.c.id)))
+            .order_by(score.desc(), col(User.id).desc())
+            .limit(limit + 1)
+        )
+        if cursor is not None:
+            try:
+                last_score, user_id = decode_rank_cursor(cursor)
+            except ValueError:
+                raise invalid_cursor_error()
+            statement = statement.where(
+                tuple_(score, col(User.id)) < tuple_(last_score, user_id)
+            )
 
-        users = result.all()
+        await session.exec(
+            text(
+                "SELECT set_config("
+                "'pg_trgm.word_similarity_threshold', :threshold, true)"
+            ).bindparams(threshold=str(settings.PROFILE_SEARCH_SIMILARITY_THRESHOLD))
+        )
+        result = await session.exec(statement)
+        hits = [(user, hit_score) for user, hit_score in result.all()]
 
-        for user in users:
-            await session.refresh(user, ["profile"])
+        next_cursor = None
+        if len(hits) > limit:
+            hits = hits[:limit]
+            last_user, last_score = hits[-1]
+            next_cursor = encode_rank_cursor(last_score, last_user.id)
 
-        return list(users), total_count
+        return hits, next_cursor
 
     except HTTPException as http_ex:
         raise http_ex
     except Exception as e:
-        logger.error(f"Error fetching all user profiles: {e}")
+        logger.error(f"Error searching user profiles: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={
                 "status": "error",
-                "message": "Failed to fetch user profiles",
+                "message": "Failed to search user profiles",
                 "action": "Please try again later",
             },
         )
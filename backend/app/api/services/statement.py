@@ -0,0 +1,157 @@
+import csv
+import io
+import json
+from datetime import datetime
+from typing import AsyncIterator
+from uuid import UUID
+
+from sqlalchemy import select, tuple_
+from sqlmodel import col
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.app.api.services.ledger import get_balance_at
+from backend.app.bank_account.models import BankAccount
+from backend.app.core.config import settings
+from backend.app.core.db import async_session
+from backend.app.ledger.models import JournalEntry, Posting
+from backend.app.ledger.utils import from_minor_units
+
+STATEMENT_CSV_COLUMNS = [
+    "date",
+    "type",
+    "description",
+    "posting_id",
+    "journal_entry_id",
+    "amount",
+    "balance",
+]
+
+STATEMENT_CHUNK_SIZE = 64 * 1024
+
+
+async def iter_statement_postings(
+    account_id: UUID, start: datetime, end: datetime, session: AsyncSession
+) -> AsyncIterator:
+    page_size = settings.STATEMENT_PAGE_SIZE
+    last_key = None
+
+    while True:
+        statement = (
+            select(
+                col(Posting.id),
+                col(Posting.created_at),
+                col(Posting.amount),
+                col(Posting.journal_entry_id),
+                col(JournalEntry.entry_type),
+                col(JournalEntry.description),
+            )
+            .join(JournalEntry, col(JournalEntry.id) == col(Posting.journal_entry_id))
+            .where(
+                col(Posting.account_id) == account_id,
+                col(Posting.created_at) < end,
+            )
+            .order_by(col(Posting.created_at), col(Posting.id))
+            .limit(page_size)
+            .execution_options(yield_per=page_size)
+        )
+        if last_key is None:
+            statement = statement.where(col(Posting.created_at) >= start)
+        else:
+            statement = statement.where(
+                tuple_(col(Posting.created_at), col(Posting.id)) > tuple_(*last_key)
+            )
+
+        rows = 0
+        result = await session.stream(statement)
+        async for row in result:
+            rows += 1
+            last_key = (row.created_at, row.id)
+            yield row
+
+        if rows < page_size:
+            return
+
+
+async def statement_events(
+    account: BankAccount, start: datetime, end: datetime
+) -> AsyncIterator[dict]:
+    currency = account.currency
+
+    async with async_session() as session:
+        balance, _ = await get_balance_at(account.id, start, session)
+        yield {
+            "type": "opening_balance",
+            "date": start.isoformat(),
+            "account_number": account.account_number,
+            "currency": currency.value,
+            "balance": str(from_minor_units(balance, currency)),
+        }
+
+        postings = 0
+        credits = 0
+        debits = 0
+        async for row in iter_statement_postings(account.id, start, end, session):
+            balance += row.amount
+            postings += 1
+            if row.amount > 0:
+                credits += row.amount
+            else:
+                debits -= row.amount
+
+            yield {
+                "type": row.entry_type.value,
+                "date": row.created_at.isoformat(),
+                "description": row.description,
+                "posting_id": row.id,
+                "journal_entry_id": str(row.journal_entry_id),
+                "amount": str(from_minor_units(row.amount, currency)),
+                "balance": str(from_minor_units(balance, currency)),
+            }
+
+        yield {
+            "type": "closing_balance",
+            "date": end.isoformat(),
+            "postings": postings,
+            "total_credits": str(from_minor_units(credits, currency)),
+            "total_debits": str(from_minor_units(debits, currency)),
+            "balance": str(from_minor_units(balance, currency)),
+        }
+
+
+def encode_csv_row(event: dict) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(
+        [
+            event.get("date", ""),
+            event["type"],
+            event.get("description") or "",
+            event.get("posting_id", ""),
+            event.get("journal_entry_id", ""),
+            event.get("amount", ""),
+            event["balance"],
+        ]
+    )
+    return buffer.getvalue()
+
+
+async def render_statement(
+    account: BankAccount, start: datetime, end: datetime, fmt: str
+) -> AsyncIterator[str]:
+    chunk: list[str] = []
+    chunk_size = 0
+
+    if fmt == "csv":
+        chunk.append(",".join(STATEMENT_CSV_COLUMNS) + "\r\n")
+
+    async for event in statement_events(account, start, end):
+        line = encode_csv_row(event) if fmt == "csv" else json.dumps(event) + "\n"
+        chunk.append(line)
+        chunk_size += len(line)
+
+        if chunk_size >= STATEMENT_CHUNK_SIZE:
+            yield "".join(chunk)
+            chunk.clear()
+            chunk_size = 0
+
+    if chunk:
+        yield "".join(chunk)
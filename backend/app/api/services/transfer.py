@@ -0,0 +1,443 @@
+import asyncio
+import uuid
+from decimal import ROUND_HALF_EVEN, Decimal
+
+from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlmodel import col
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.app.api.services.ledger import (
+    get_ledger_balances,
+    lock_bank_accounts,
+    post_journal_entries,
+)
+from backend.app.bank_account.enums import AccountCurrencyEnum, AccountStatusEnum
+from backend.app.core.config import settings
+from backend.app.core.db import async_session
+from backend.app.core.logging import get_logger
+from backend.app.ledger.enums import InternalAccountEnum, JournalEntryTypeEnum
+from backend.app.ledger.models import JournalEntry, Posting
+from backend.app.ledger.schema import (
+    JournalEntryCreateSchema,
+    PostingCreateSchema,
+    TransferCreateSchema,
+    TransferReadSchema,
+)
+from backend.app.ledger.utils import (
+    from_minor_units,
+    minor_unit_scale,
+    to_minor_units,
+)
+
+logger = get_logger()
+
+TRANSFERABLE_STATUSES = frozenset({AccountStatusEnum.Active})
+
+
+def transfer_error(
+    message: str,
+    status_code: int = status.HTTP_400_BAD_REQUEST,
+    action: str | None = None,
+) -> HTTPException:
+    detail = {"status": "error", "message": message}
+    if action:
+        detail["action"] = action
+    return HTTPException(status_code=status_code, detail=detail)
+
+
+def exchange_rate(
+    source_currency: AccountCurrencyEnum, destination_currency: AccountCurrencyEnum
+) -> Decimal:
+    if source_currency == destination_currency:
+        return Decimal(1)
+
+    rates = settings.FX_RATES
+    if source_currency.value not in rates or destination_currency.value not in rates:
+        raise transfer_error(
+            f"No exchange rate configured for {source_currency.value} to "
+            f"{destination_currency.value}"
+        )
+    return Decimal(str(rates[destination_currency.value])) / Decimal(
+        str(rates[source_currency.value])
+    )
+
+
+def convert_minor_units(
+    amount: int,
+    source_currency: AccountCurrencyEnum,
+    destination_currency: AccountCurrencyEnum,
+    rate: Decimal,
+) -> int:
+    converted = (
+        Decimal(amount)
+        * rate
+        * minor_unit_scale(destination_currency)
+        / minor_unit_scale(source_currency)
+    )
+    return int(converted.quantize(Decimal(1), rounding=ROUND_HALF_EVEN))
+
+
+def build_transfer_entry(
+    idempotency_key: str,
+    source,
+    destination,
+    amount: int,
+    destination_amount: int,
+    description: str | None,
+) -> JournalEntryCreateSchema:
+    postings = [
+        PostingCreateSchema(
+            account_id=source.id, currency=source.currency, amount=-amount
+        ),
+        PostingCreateSchema(
+            account_id=destination.id,
+            currency=destination.currency,
+            amount=destination_amount,
+        ),
+    ]
+    if source.currency != destination.currency:
+        postings += [
+            PostingCreateSchema(
+                internal_account=InternalAccountEnum.FxClearing,
+                currency=source.currency,
+                amount=amount,
+            ),
+            PostingCreateSchema(
+                internal_account=InternalAccountEnum.FxClearing,
+                currency=destination.currency,
+                amount=-destination_amount,
+            ),
+        ]
+
+    return JournalEntryCreateSchema(
+        idempotency_key=idempotency_key,
+        entry_type=JournalEntryTypeEnum.Transfer,
+        description=description or f"Transfer to {destination.account_number}",
+        postings=postings,
+    )
+
+
+class PendingTransfer:
+    def __init__(
+        self, user_id: uuid.UUID, transfer_data: TransferCreateSchema
+    ) -> None:
+        self.user_id = user_id
+        self.transfer_data = transfer_data
+        self.entry_key = f"transfer:{user_id}:{transfer_data.idempotency_key}"
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+
+    def resolve(self, result: TransferReadSchema | HTTPException) -> None:
+        if self.future.done():
+            return
+        if isinstance(result, HTTPException):
+            self.future.set_exception(result)
+        else:
+            self.future.set_result(result)
+
+
+async def load_posted_transfers(
+    entry_ids: dict[str, uuid.UUID], session: AsyncSession
+) -> dict[str, list[Posting]]:
+    result = await session.exec(
+        select(Posting).where(
+            col(Posting.journal_entry_id).in_(list(entry_ids.values())),
+            col(Posting.account_id).is_not(None),
+        )
+    )
+    postings_by_entry: dict[uuid.UUID, list[Posting]] = {}
+    for posting in result.scalars().all():
+        postings_by_entry.setdefault(posting.journal_entry_id, []).append(posting)
+
+    return {
+        key: postings_by_entry.get(entry_id, [])
+        for key, entry_id in entry_ids.items()
+    }
+
+
+def posted_transfer_result(
+    pending: PendingTransfer, entry_id: uuid.UUID, postings: list[Posting]
+) -> TransferReadSchema | HTTPException:
+    transfer_data = pending.transfer_data
+    source = next(
+        (p for p in postings if p.account_id == transfer_data.source_account_id), None
+    )
+    destination = next(
+        (p for p in postings if p.account_id == transfer_data.destination_account_id),
+        None,
+    )
+    if (
+        source is None
+        or destination is None
+        or -source.amount != to_minor_units(transfer_data.amount, source.currency)
+    ):
+        return transfer_error(
+            "Idempotency key was already used for a different transfer",
+            status.HTTP_409_CONFLICT,
+        )
+
+    amount = from_minor_units(-source.amount, source.currency)
+    destination_amount = from_minor_units(destination.amount, destination.currency)
+    # Replays report the rate that was applied, worked out from the posted
+    # legs, rather than whatever FX_RATES holds now.
+    applied_rate = (
+        Decimal(1)
+        if source.currency == destination.currency
+        else destination_amount / amount
+    )
+    return TransferReadSchema(
+        journal_entry_id=entry_id,
+        source_account_id=source.account_id,
+        destination_account_id=destination.account_id,
+        amount=amount,
+        currency=source.currency,
+        destination_amount=destination_amount,
+        destination_currency=destination.currency,
+        exchange_rate=applied_rate,
+        created=False,
+    )
+
+
+async def execute_transfer_batch(
+    batch: list[PendingTransfer], session: AsyncSession
+) -> list[TransferReadSchema | HTTPException]:
+    existing = await session.exec(
+        select(col(JournalEntry.idempotency_key), col(JournalEntry.id)).where(
+            col(JournalEntry.idempotency_key).in_([p.entry_key for p in batch])
+        )
+    )
+    posted_ids = dict(existing.all())
+    posted = await load_posted_transfers(posted_ids, session) if posted_ids else {}
+
+    account_ids = {
+        account_id
+        for pending in batch
+        if pending.entry_key not in posted_ids
+        for account_id in (
+            pending.transfer_data.source_account_id,
+            pending.transfer_data.destination_account_id,
+        )
+    }
+    accounts = await lock_bank_accounts(account_ids, session) if account_ids else {}
+    balances = await get_ledger_balances(list(accounts), session) if accounts else {}
+
+    results: list[TransferReadSchema | HTTPException | None] = []
+    entries: list[JournalEntryCreateSchema] = []
+    accepted: list[tuple[int, str, dict]] = []
+    batch_keys: set[str] = set()
+
+    for pending in batch:
+        transfer_data = pending.transfer_data
+
+        if pending.entry_key in posted_ids:
+            results.append(
+                posted_transfer_result(
+                    pending,
+                    posted_ids[pending.entry_key],
+                    posted[pending.entry_key],
+                )
+            )
+            continue
+
+        if pending.entry_key in batch_keys:
+            results.append(
+                transfer_error(
+                    "A transfer with this idempotency key is already in progress",
+                    status.HTTP_409_CONFLICT,
+                )
+            )
+            continue
+
+        source = accounts.get(transfer_data.source_account_id)
+        destination = accounts.get(transfer_data.destination_account_id)
+
+        if source is None or source.user_id != pending.user_id:
+            results.append(
+                transfer_error("Source account not found", status.HTTP_404_NOT_FOUND)
+            )
+            continue
+        if destination is None:
+            results.append(
+                transfer_error(
+                    "Destination account not found", status.HTTP_404_NOT_FOUND
+                )
+            )
+            continue
+        if source.account_status not in TRANSFERABLE_STATUSES:
+            results.append(
+                transfer_error(
+                    f"Source account is {source.account_status.value}",
+                    action="Only active accounts can send transfers",
+                )
+            )
+            continue
+        if destination.account_status not in TRANSFERABLE_STATUSES:
+            results.append(
+                transfer_error(
+                    f"Destination account is {destination.account_status.value}",
+                    action="Only active accounts can receive transfers",
+                )
+            )
+            continue
+
+        amount = to_minor_units(transfer_data.amount, source.currency)
+        if balances.get(source.id, 0) < amount:
+            results.append(transfer_error("Insufficient funds"))
+            continue
+
+        try:
+            rate = exchange_rate(source.currency, destination.currency)
+        except HTTPException as http_ex:
+            results.append(http_ex)
+            continue
+
+        destination_amount = convert_minor_units(
+            amount, source.currency, destination.currency, rate
+        )
+        if destination_amount <= 0:
+            results.append(
+                transfer_error(
+                    "Amount is too small to convert to the destination currency"
+                )
+            )
+            continue
+
+        balances[source.id] = balances.get(source.id, 0) - amount
+        balances[destination.id] = balances.get(destination.id, 0) + destination_amount
+        batch_keys.add(pending.entry_key)
+
+        entries.append(
+            build_transfer_entry(
+                pending.entry_key,
+                source,
+                destination,
+                amount,
+                destination_amount,
+                transfer_data.description,
+            )
+        )
+        accepted.append(
+            (
+                len(results),
+                pending.entry_key,
+                {
+                    "source_account_id": source.id,
+                    "destination_account_id": destination.id,
+                    "amount": from_minor_units(amount, source.currency),
+                    "currency": source.currency,
+                    "destination_amount": from_minor_units(
+                        destination_amount, destination.currency
+                    ),
+                    "destination_currency": destination.currency,
+                    "exchange_rate": rate,
+                },
+            )
+        )
+        results.append(None)
+
+    if entries:
+        entry_ids, created_keys, _ = await post_journal_entries(
+            entries, session, accounts_locked=True
+        )
+        for index, entry_key, fields in accepted:
+            results[index] = TransferReadSchema(
+                journal_entry_id=entry_ids[entry_key],
+                created=entry_key in created_keys,
+                **fields,
+            )
+
+    return results
+
+
+class TransferBatcher:
+    def __init__(self, max_batch_size: int, linger_ms: float) -> None:
+        self._max_batch_size = max_batch_size
+        self._linger = linger_ms / 1000
+        self._queues: dict[uuid.UUID, list[PendingTransfer]] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self.batches = 0
+        self.transfers = 0
+        self.largest_batch = 0
+
+    def _queue_key(self, transfer_data: TransferCreateSchema) -> uuid.UUID:
+        source = transfer_data.source_account_id
+        destination = transfer_data.destination_account_id
+        if destination in self._queues and source not in self._queues:
+            return destination
+        return source
+
+    async def submit(
+        self, user_id: uuid.UUID, transfer_data: TransferCreateSchema
+    ) -> TransferReadSchema:
+        pending = PendingTransfer(user_id, transfer_data)
+        key = self._queue_key(transfer_data)
+
+        queue = self._queues.get(key)
+        if queue is not None:
+            queue.append(pending)
+        else:
+            self._queues[key] = [pending]
+            task = asyncio.create_task(self._drain(key))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        return await pending.future
+
+    async def _drain(self, key: uuid.UUID) -> None:
+        try:
+            if self._linger:
+                await asyncio.sleep(self._linger)
+
+            while self._queues[key]:
+                queue = self._queues[key]
+                batch = queue[: self._max_batch_size]
+                del queue[: self._max_batch_size]
+                await self._execute(batch)
+        finally:
+            for pending in self._queues.pop(key, []):
+                pending.resolve(
+                    transfer_error(
+                        "Failed to process transfer",
+                        status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    )
+                )
+
+    async def _execute(self, batch: list[PendingTransfer]) -> None:
+        try:
+            async with async_session() as session:
+                results = await execute_transfer_batch(batch, session)
+                await session.commit()
+        except Exception as e:
+            logger.error(f"Failed to process batch of {len(batch)} transfers: {e}")
+            for pending in batch:
+                pending.resolve(
+                    transfer_error(
+                        "Failed to process transfer",
+                        status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    )
+                )
+            return
+
+        self.batches += 1
+        self.transfers += len(batch)
+        self.largest_batch = max(self.largest_batch, len(batch))
+
+        for pending, result in zip(batch, results):
+            pending.resolve(result)
+
+    def get_metrics(self) -> dict[str, int | float]:
+        return {
+            "batches": self.batches,
+            "transfers": self.transfers,
+            "avg_batch_size": round(self.transfers / self.batches, 2)
+            if self.batches
+            else 0.0,
+            "largest_batch": self.largest_batch,
+            "pending_queues": len(self._queues),
+        }
+
+
+transfer_batcher = TransferBatcher(
+    max_batch_size=settings.TRANSFER_BATCH_MAX_SIZE,
+    linger_ms=settings.TRANSFER_BATCH_LINGER_MS,
+)
@@ -1,26 +1,26 @@
-import asyncio
 import uuid
-from datetime import datetime, timedelta, timezone
 
 import jwt
 from fastapi import HTTPException, status
-from sqlmodel import select
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from backend.app.api.services.login_state import login_state_engine
+from backend.app.api.services.user_existence import user_existence_service
+from backend.app.auth.login_attempts import login_attempt_counter
 from backend.app.auth.models import User
+from backend.app.auth.otp_store import OTPVerifyResult
+from backend.app.auth.password_hasher import password_hasher
+from backend.app.auth.principal_cache import principal_cache
 from backend.app.auth.schema import AccountStatusSchema, UserCreateSchema
-from backend.app.auth.utils import (
-    create_activation_token,
-    generate_otp,
-    generate_password_hash,
-    generate_username,
-    verify_password,
-)
+from backend.app.auth.utils import create_activation_token, generate_username
 from backend.app.core.config import settings
 from backend.app.core.logging import get_logger
 from backend.app.core.services.account_lockout import send_account_lockout_email
 from backend.app.core.services.activation_email import send_activation_email
-from backend.app.core.services.login_otp import send_login_otp_email
+from backend.app.core.services.login_otp import dispatch_login_otp_email
 
 logger = get_logger()
 
@@ -63,17 +63,43 @@ class UserAuthService:
         return user
 
     async def check_user_email_exists(self, email: str, session: AsyncSession) -> bool:
-        user = await self.get_user_by_email(email, session)
-        return bool(user)
+        return await user_existence_service.email_exists(email, session)
 
     async def check_user_id_no_exists(self, id_no: int, session: AsyncSession) -> bool:
-        user = await self.get_user_by_id_no(id_no, session)
-        return bool(user)
+        return await user_existence_service.id_no_exists(id_no, session)
 
     async def verify_user_password(
         self, plain_password: str, hashed_password: str
     ) -> bool:
-        return verify_password(plain_password, hashed_password)
+        return await password_hasher.verify(plain_password, hashed_password)
+
+    async def authenticate_password(
+        self, user: User, plain_password: str, session: AsyncSession
+    ) -> bool:
+        verified, new_hash = await password_hasher.verify_and_rehash(
+            plain_password, user.hashed_password
+        )
+
+        if verified and new_hash is not None:
+            try:
+                statement = (
+                    update(User)
+                    .where(
+                        col(User.id) == user.id,
+                        col(User.hashed_password) == user.hashed_password,
+                    )
+                    .values(hashed_password=new_hash)
+                )
+                await session.exec(statement)
+                await session.commit()
+                user.hashed_password = new_hash
+                logger.info(f"Upgraded password hash parameters for {user.email}")
+            except Exception as e:
+                logger.warning(f"Failed to upgrade password hash for {user.id}: {e}")
+                await session.rollback()
+                await session.refresh(user)
+
+        return verified
 
     async def reset_user_state(
         self,
@@ -85,19 +111,19 @@ class UserAuthService:
     ) -> None:
         previous_status = user.account_status
 
-        user.failed_login_attempts = 0
         user.last_failed_login = None
 
-        if clear_otp:
-            user.otp = ""
-            user.otp_expiry_time = None
-
         if user.account_status == AccountStatusSchema.LOCKED:
             user.account_status = AccountStatusSchema.ACTIVE
 
         await session.commit()
 
         await session.refresh(user)
+        await principal_cache.invalidate(user.id)
+        await login_attempt_counter.reset(str(user.id))
+
+        if clear_otp:
+            await login_state_engine.clear_otp(user.id)
 
         if log_action and previous_status != user.account_status:
             logger.info(
@@ -141,42 +167,21 @@ class UserAuthService:
         session: AsyncSession,
     ) -> tuple[bool, str]:
         try:
-            otp = generate_otp()
-            user.otp = otp
+            otp = await login_state_engine.issue_otp(user, session)
 
-            user.otp_expiry_time = datetime.now(timezone.utc) + timedelta(
-                minutes=settings.OTP_EXPIRATION_MINUTES
-            )
+            if otp is None:
+                logger.warning(f"OTP not issued to locked account: {user.email}")
+                return False, ""
 
-            await session.commit()
-            await session.refresh(user)
-
-            for attempt in range(3):
-                try:
-                    await send_login_otp_email(user.email, otp)
-                    logger.info(f"OTP sent to {user.email} successfully")
-                    return True, otp
-                except Exception as e:
-                    logger.error(
-                        f"Failed to send OTP email (attempt {attempt + 1}): {e}"
-                    )
-                    if attempt == 2:
-                        user.otp = ""
-                        user.otp_expiry_time = None
-                        await session.commit()
-                        await session.refresh(user)
-                        return False, ""
-
-                    await asyncio.sleep(2**attempt)
-            return False, ""
+            delivery_id = dispatch_login_otp_email(user.email, otp)
+            logger.info(f"OTP issued to {user.email}, delivery {delivery_id}")
+            return True, delivery_id
 
         except Exception as e:
             logger.error(f"Failed to generate and save OTP: {e}")
 
-            user.otp = ""
-            user.otp_expiry_time = None
-            await session.commit()
-            await session.refresh(user)
+            await session.rollback()
+            await login_state_engine.clear_otp(user.id)
             return False, ""
 
     async def create_user(
@@ -189,18 +194,27 @@ class UserAuthService:
         )
 
         password = user_data_dict.pop("password")
+        hashed_password = await password_hasher.hash(password)
 
         new_user = User(
             username=generate_username(),
-            hashed_password=generate_password_hash(password),
+            hashed_password=hashed_password,
             is_active=False,
             account_status=AccountStatusSchema.PENDING,
             **user_data_dict,
         )
 
         session.add(new_user)
-        await session.commit()
+        try:
+            await session.commit()
+        except IntegrityError:
+            await session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="User with this email or id number already exists",
+            )
         await session.refresh(new_user)
+        await user_existence_service.record([(new_user.email, new_user.id_no)])
 
         activation_token = create_activation_token(new_user.id)
         try:
@@ -253,6 +267,7 @@ class UserAuthService:
 
             await session.commit()
             await session.refresh(user)
+            await principal_cache.invalidate(user.id)
 
             return user
 
@@ -299,32 +314,41 @@ class UserAuthService:
 
             await self.check_user_lockout(user, session)
 
-            if not user.otp or user.otp != otp:
-                await self.increment_failed_login_attempts(user, session)
+            result = await login_state_engine.verify_otp(user, otp, session)
+
+            if result == OTPVerifyResult.VALID:
+                return user
+
+            if result == OTPVerifyResult.EXPIRED:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail={
                         "status": "error",
-                        "message": "Invalid OTP",
-                        "action": "Please check your OTP and try again",
+                        "message": "OTP has expired",
+                        "action": "Please request a new OTP",
                     },
                 )
 
-            if user.otp_expiry_time is None or user.otp_expiry_time < datetime.now(
-                timezone.utc
-            ):
+            await self.increment_failed_login_attempts(user, session)
+
+            if result == OTPVerifyResult.EXHAUSTED:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail={
                         "status": "error",
-                        "message": "OTP has expired",
+                        "message": "Too many invalid OTP attempts",
                         "action": "Please request a new OTP",
                     },
                 )
 
-            await self.reset_user_state(user, session, clear_otp=False)
-
-            return user
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "status": "error",
+                    "message": "Invalid OTP",
+                    "action": "Please check your OTP and try again",
+                },
+            )
 
         except HTTPException as http_ex:
             raise http_ex
@@ -344,25 +368,11 @@ class UserAuthService:
         user: User,
         session: AsyncSession,
     ) -> None:
-        if user.account_status != AccountStatusSchema.LOCKED:
-            return
+        remaining_minutes = login_state_engine.lockout_remaining_minutes(user)
 
-        if user.last_failed_login is None:
+        if remaining_minutes is None:
             return
 
-        lockout_time = user.last_failed_login + timedelta(
-            minutes=settings.LOCKOUT_DURATION_MINUTES
-        )
-
-        current_time = datetime.now(timezone.utc)
-
-        if current_time >= lockout_time:
-            await self.reset_user_state(user, session, clear_otp=False)
-            logger.info(f"Lockout period ended for user {user.email}")
-            return
-
-        remaining_minutes = int((lockout_time - current_time).total_seconds() / 60)
-
         logger.warning(f"Attempted login to locked account: {user.email}")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -378,17 +388,18 @@ class UserAuthService:
         self,
         user: User,
         session: AsyncSession,
-    ) -> None:
-        user.failed_login_attempts += 1
+    ) -> int:
+        outcome = await login_state_engine.record_failed_attempt(user, session)
 
-        current_time = datetime.now(timezone.utc)
-        user.last_failed_login = current_time
+        if outcome is None:
+            await self.check_user_lockout(user, session)
+            return settings.LOGIN_ATTEMPTS
 
-        if user.failed_login_attempts >= settings.LOGIN_ATTEMPTS:
-            user.account_status = AccountStatusSchema.LOCKED
+        failed_attempts, newly_locked = outcome
 
+        if newly_locked:
             try:
-                await send_account_lockout_email(user.email, current_time)
+                await send_account_lockout_email(user.email, user.last_failed_login)
                 logger.info(f"Account lockout notification email sent to {user.email}")
 
             except Exception as e:
@@ -398,9 +409,8 @@ class UserAuthService:
             logger.warning(
                 f"User {user.email} has been locked out due to too many failed login attempts"
             )
-        await session.commit()
 
-        await session.refresh(user)
+        return failed_attempts
 
     async def reset_password(
         self,
@@ -425,12 +435,13 @@ class UserAuthService:
                     detail={"status": "error", "message": "User not found"},
                 )
 
-            user.hashed_password = generate_password_hash(new_password)
+            user.hashed_password = await password_hasher.hash(new_password)
 
             await self.reset_user_state(user, session, clear_otp=True, log_action=True)
 
             await session.commit()
             await session.refresh(user)
+            await principal_cache.invalidate(user.id)
 
             logger.info(f"Password reset successful for user {user.email}")
 
@@ -0,0 +1,159 @@
+import asyncio
+import time
+
+from sqlalchemy import exists, func, select
+from sqlmodel import col
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.app.auth.models import User
+from backend.app.core.bloom import BloomFilter
+from backend.app.core.config import settings
+from backend.app.core.db import async_session
+from backend.app.core.logging import get_logger
+from backend.app.core.redis import get_redis
+
+logger = get_logger()
+
+REGISTERED_IDENTITIES_KEY = "registered_identities"
+SYNC_OVERLAP_MS = 5000
+
+
+class UserExistenceService:
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        self._capacity = capacity
+        self._error_rate = error_rate
+        self._emails = BloomFilter(capacity, error_rate)
+        self._id_nos = BloomFilter(capacity, error_rate)
+        self._ready = False
+        self._last_sync_ms = 0
+        self.negative_lookups = 0
+        self.database_lookups = 0
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    async def _exists(self, condition, session: AsyncSession) -> bool:
+        self.database_lookups += 1
+        result = await session.exec(select(exists().where(condition)))
+        return bool(result.scalar())
+
+    async def email_exists(self, email: str, session: AsyncSession) -> bool:
+        if self._ready and email not in self._emails:
+            self.negative_lookups += 1
+            return False
+        return await self._exists(col(User.email) == email, session)
+
+    async def id_no_exists(self, id_no: int, session: AsyncSession) -> bool:
+        if self._ready and str(id_no) not in self._id_nos:
+            self.negative_lookups += 1
+            return False
+        return await self._exists(col(User.id_no) == id_no, session)
+
+    async def record(self, identities: list[tuple[str, int]]) -> None:
+        if not identities:
+            return
+
+        for email, id_no in identities:
+            self._emails.add(email)
+            self._id_nos.add(str(id_no))
+
+        now_ms = int(time.time() * 1000)
+        members = {}
+        for email, id_no in identities:
+            members[f"email:{email}"] = now_ms
+            members[f"id_no:{id_no}"] = now_ms
+
+        try:
+            await get_redis().zadd(REGISTERED_IDENTITIES_KEY, members)
+        except Exception as e:
+            logger.warning(f"Failed to publish registered identities: {e}")
+
+    @staticmethod
+    def _add_member(emails: BloomFilter, id_nos: BloomFilter, member: str) -> None:
+        kind, _, value = member.partition(":")
+        if kind == "email":
+            emails.add(value)
+        elif kind == "id_no":
+            id_nos.add(value)
+
+    async def rebuild(self) -> None:
+        now_ms = int(time.time() * 1000)
+
+        async with async_session() as session:
+            count_result = await session.exec(select(func.count(col(User.id))))
+            total = count_result.scalar() or 0
+
+            capacity = max(self._capacity, total * 2)
+            emails = BloomFilter(capacity, self._error_rate)
+            id_nos = BloomFilter(capacity, self._error_rate)
+
+            result = await session.stream(
+                select(col(User.email), col(User.id_no)).execution_options(
+                    yield_per=10000
+                )
+            )
+            async for email, id_no in result:
+                emails.add(email)
+                id_nos.add(str(id_no))
+
+        redis = get_redis()
+        await redis.zremrangebyscore(
+            REGISTERED_IDENTITIES_KEY,
+            "-inf",
+            now_ms - settings.USER_EXISTENCE_REBUILD_INTERVAL_SECONDS * 2000,
+        )
+        for member in await redis.zrangebyscore(
+            REGISTERED_IDENTITIES_KEY, now_ms - SYNC_OVERLAP_MS, "+inf"
+        ):
+            self._add_member(emails, id_nos, member)
+
+        self._emails = emails
+        self._id_nos = id_nos
+        self._last_sync_ms = now_ms
+        self._ready = True
+        logger.info(f"User existence filters rebuilt with {total} users")
+
+    async def sync(self) -> None:
+        now_ms = int(time.time() * 1000)
+        members = await get_redis().zrangebyscore(
+            REGISTERED_IDENTITIES_KEY, self._last_sync_ms - SYNC_OVERLAP_MS, "+inf"
+        )
+        for member in members:
+            self._add_member(self._emails, self._id_nos, member)
+        self._last_sync_ms = now_ms
+
+    def get_metrics(self) -> dict[str, int | bool]:
+        return {
+            "ready": self._ready,
+            "emails": len(self._emails),
+            "negative_lookups": self.negative_lookups,
+            "database_lookups": self.database_lookups,
+        }
+
+
+user_existence_service = UserExistenceService(
+    capacity=settings.USER_EXISTENCE_BLOOM_CAPACITY,
+    error_rate=settings.USER_EXISTENCE_BLOOM_ERROR_RATE,
+)
+
+
+async def run_existence_sync() -> None:
+    last_rebuild = 0.0
+    while True:
+        try:
+            if (
+                not user_existence_service.ready
+                or time.monotonic() - last_rebuild
+                >= settings.USER_EXISTENCE_REBUILD_INTERVAL_SECONDS
+            ):
+                await user_existence_service.rebuild()
+                last_rebuild = time.monotonic()
+            else:
+                await user_existence_service.sync()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"User existence sync failed: {e}")
+
+        await asyncio.sleep(settings.USER_EXISTENCE_SYNC_INTERVAL_SECONDS)
@@ -0,0 +1,222 @@
+import csv
+import io
+import json
+import uuid
+from datetime import datetime, timezone
+from typing import AsyncIterator, Iterator
+
+from fastapi import HTTPException
+from pydantic import ValidationError
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import col
+
+from backend.app.api.services.user_existence import user_existence_service
+from backend.app.auth.models import User
+from backend.app.auth.password_hasher import password_hasher
+from backend.app.auth.schema import AccountStatusSchema, UserCreateSchema
+from backend.app.auth.utils import create_activation_token, generate_username
+from backend.app.core.config import settings
+from backend.app.core.db import async_session
+from backend.app.core.logging import get_logger
+from backend.app.core.services.activation_email import send_activation_emails
+
+logger = get_logger()
+
+IMPORT_FORMATS = ("csv", "ndjson")
+
+IMPORT_EXCLUDED_FIELDS = {
+    "password",
+    "confirm_password",
+    "username",
+    "is_active",
+    "account_status",
+}
+
+
+def detect_import_format(filename: str | None, content_type: str | None) -> str | None:
+    name = (filename or "").lower()
+    if name.endswith(".csv") or content_type == "text/csv":
+        return "csv"
+    if name.endswith((".ndjson", ".jsonl")) or content_type in (
+        "application/x-ndjson",
+        "application/jsonl",
+    ):
+        return "ndjson"
+    return None
+
+
+def iter_import_rows(content: str, fmt: str) -> Iterator[tuple[int, dict | None, str | None]]:
+    if fmt == "csv":
+        reader = csv.DictReader(io.StringIO(content))
+        for row_number, row in enumerate(reader, start=1):
+            yield row_number, {k: v for k, v in row.items() if v != ""}, None
+        return
+
+    for row_number, line in enumerate(content.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield row_number, None, f"Invalid JSON: {e.msg}"
+            continue
+        if not isinstance(data, dict):
+            yield row_number, None, "Row must be a JSON object"
+            continue
+        yield row_number, data, None
+
+
+def row_error(row_number: int, errors: list[str]) -> dict:
+    return {"row": row_number, "status": "error", "errors": errors}
+
+
+def validate_row(row_number: int, data: dict) -> UserCreateSchema | dict:
+    try:
+        return UserCreateSchema.model_validate(data)
+    except ValidationError as e:
+        return row_error(
+            row_number,
+            [
+                f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+                for error in e.errors()
+            ],
+        )
+    except HTTPException as e:
+        message = e.detail.get("message") if isinstance(e.detail, dict) else e.detail
+        return row_error(row_number, [str(message)])
+
+
+async def insert_user_batch(
+    batch: list[tuple[int, UserCreateSchema]],
+) -> tuple[list[tuple[uuid.UUID, str]], list[dict]]:
+    hashed_passwords = await password_hasher.hash_many(
+        [user_data.password for _, user_data in batch]
+    )
+
+    now = datetime.now(timezone.utc)
+    values = [
+        {
+            **user_data.model_dump(exclude=IMPORT_EXCLUDED_FIELDS),
+            "id": uuid.uuid4(),
+            "username": generate_username(),
+            "hashed_password": hashed_password,
+            "is_active": False,
+            "account_status": AccountStatusSchema.PENDING,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for (_, user_data), hashed_password in zip(batch, hashed_passwords)
+    ]
+
+    statement = (
+        insert(User)
+        .values(values)
+        .on_conflict_do_nothing()
+        .returning(col(User.id), col(User.email), col(User.id_no))
+    )
+
+    async with async_session() as session:
+        result = await session.exec(statement)
+        rows = result.all()
+        await session.commit()
+
+    await user_existence_service.record([(email, id_no) for _, email, id_no in rows])
+    inserted = [(user_id, email) for user_id, email, _ in rows]
+
+    inserted_emails = {email for _, email in inserted}
+    errors = [
+        row_error(row_number, ["User with this email or id number already exists"])
+        for row_number, user_data in batch
+        if user_data.email not in inserted_emails
+    ]
+    return inserted, errors
+
+
+async def queue_activation_emails(inserted: list[tuple[uuid.UUID, str]]) -> bool:
+    try:
+        await send_activation_emails(
+            [(email, create_activation_token(user_id)) for user_id, email in inserted]
+        )
+        return True
+    except Exception as e:
+        logger.error(f"Failed to queue activation emails for import batch: {e}")
+        return False
+
+
+async def import_users(content: str, fmt: str) -> AsyncIterator[dict]:
+    batch_size = settings.USER_IMPORT_BATCH_SIZE
+    seen_emails: set[str] = set()
+    seen_id_nos: set[int] = set()
+    batch: list[tuple[int, UserCreateSchema]] = []
+    total_rows = 0
+    imported = 0
+    failed = 0
+
+    async def flush() -> AsyncIterator[dict]:
+        nonlocal imported, failed
+        try:
+            inserted, errors = await insert_user_batch(batch)
+        except Exception as e:
+            logger.error(f"Failed to import batch of {len(batch)} users: {e}")
+            inserted = []
+            errors = [
+                row_error(row_number, ["Failed to import row"])
+                for row_number, _ in batch
+            ]
+
+        for error in errors:
+            yield error
+
+        emails_queued = await queue_activation_emails(inserted) if inserted else True
+        imported += len(inserted)
+        failed += len(errors)
+        batch.clear()
+
+        yield {
+            "status": "progress",
+            "processed": total_rows,
+            "imported": imported,
+            "failed": failed,
+            "activation_emails_queued": emails_queued,
+        }
+
+    for row_number, data, parse_error in iter_import_rows(content, fmt):
+        total_rows += 1
+
+        if parse_error is not None:
+            failed += 1
+            yield row_error(row_number, [parse_error])
+            continue
+
+        user_data = validate_row(row_number, data)
+        if isinstance(user_data, dict):
+            failed += 1
+            yield user_data
+            continue
+
+        if user_data.email in seen_emails or user_data.id_no in seen_id_nos:
+            failed += 1
+            yield row_error(row_number, ["Duplicate email or id number in import file"])
+            continue
+
+        seen_emails.add(user_data.email)
+        seen_id_nos.add(user_data.id_no)
+        batch.append((row_number, user_data))
+
+        if len(batch) >= batch_size:
+            async for event in flush():
+                yield event
+
+    if batch:
+        async for event in flush():
+            yield event
+
+    logger.info(
+        f"User import completed: {total_rows} rows, {imported} imported, {failed} failed"
+    )
+    yield {
+        "status": "completed",
+        "total_rows": total_rows,
+        "imported": imported,
+        "failed": failed,
+    }
@@ -0,0 +1,95 @@
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import deque
+
+from backend.app.core.config import settings
+from backend.app.core.redis import get_redis
+
+
+class LoginAttemptCounter(ABC):
+    def __init__(self, max_attempts: int, window_seconds: int) -> None:
+        self.max_attempts = max_attempts
+        self.window_seconds = window_seconds
+
+    @abstractmethod
+    async def record_failure(self, key: str) -> tuple[int, bool]: ...
+
+    @abstractmethod
+    async def reset(self, key: str) -> None: ...
+
+
+class InMemoryLoginAttemptCounter(LoginAttemptCounter):
+    def __init__(self, max_attempts: int, window_seconds: int) -> None:
+        super().__init__(max_attempts, window_seconds)
+        self._failures: dict[str, deque[float]] = {}
+
+    async def record_failure(self, key: str) -> tuple[int, bool]:
+        now = time.monotonic()
+        failures = self._failures.setdefault(key, deque())
+
+        while failures and failures[0] <= now - self.window_seconds:
+            failures.popleft()
+        failures.append(now)
+
+        attempts = len(failures)
+        if attempts >= self.max_attempts:
+            del self._failures[key]
+            return attempts, True
+        return attempts, False
+
+    async def reset(self, key: str) -> None:
+        self._failures.pop(key, None)
+
+
+RECORD_FAILURE_SCRIPT = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+redis.call('ZADD', KEYS[1], now, ARGV[4])
+local attempts = redis.call('ZCARD', KEYS[1])
+if attempts >= tonumber(ARGV[3]) then
+    redis.call('DEL', KEYS[1])
+    return {attempts, 1}
+end
+redis.call('PEXPIRE', KEYS[1], window)
+return {attempts, 0}
+"""
+
+
+class RedisLoginAttemptCounter(LoginAttemptCounter):
+    def __init__(
+        self, max_attempts: int, window_seconds: int, prefix: str = "login_failures"
+    ) -> None:
+        super().__init__(max_attempts, window_seconds)
+        self._prefix = prefix
+        self._record_script = get_redis().register_script(RECORD_FAILURE_SCRIPT)
+
+    def _key(self, key: str) -> str:
+        return f"{self._prefix}:{key}"
+
+    async def record_failure(self, key: str) -> tuple[int, bool]:
+        now_ms = int(time.time() * 1000)
+        attempts, locked = await self._record_script(
+            keys=[self._key(key)],
+            args=[now_ms, self.window_seconds * 1000, self.max_attempts, uuid.uuid4().hex],
+        )
+        return int(attempts), bool(locked)
+
+    async def reset(self, key: str) -> None:
+        await get_redis().delete(self._key(key))
+
+
+def create_login_attempt_counter() -> LoginAttemptCounter:
+    if settings.LOGIN_ATTEMPTS_BACKEND == "memory":
+        return InMemoryLoginAttemptCounter(
+            max_attempts=settings.LOGIN_ATTEMPTS,
+            window_seconds=settings.LOGIN_ATTEMPTS_WINDOW_SECONDS,
+        )
+    return RedisLoginAttemptCounter(
+        max_attempts=settings.LOGIN_ATTEMPTS,
+        window_seconds=settings.LOGIN_ATTEMPTS_WINDOW_SECONDS,
+    )
+
+
+login_attempt_counter = create_login_attempt_counter()
@@ -3,11 +3,12 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
 from pydantic import computed_field
-from sqlalchemy import func, text
+from sqlalchemy import Index, func, text
 from sqlalchemy.dialects import postgresql as pg
 from sqlmodel import Column, Field, Relationship
 
 from backend.app.auth.schema import BaseUserSchema, RoleChoicesSchema
+from backend.app.auth.utils import format_full_name
 
 if TYPE_CHECKING:
     from backend.app.bank_account.models import BankAccount
@@ -16,6 +17,21 @@ if TYPE_CHECKING:
 
 
 class User(BaseUserSchema, table=True):
+    __table_args__ = (
+        Index("ix_user_created_at_id", "created_at", "id"),
+        Index(
+            "ix_user_full_name_trgm",
+            text("(first_name || ' ' || last_name) gin_trgm_ops"),
+            postgresql_using="gin",
+        ),
+        Index(
+            "ix_user_email_trgm",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        ),
+    )
+
     id: uuid.UUID = Field(
         sa_column=Column(
             pg.UUID(as_uuid=True),
@@ -24,14 +40,9 @@ class User(BaseUserSchema, table=True):
         default_factory=uuid.uuid4,
     )
     hashed_password: str
-    failed_login_attempts: int = Field(default=0, sa_type=pg.SMALLINT)
     last_failed_login: datetime | None = Field(
         default=None, sa_column=Column(pg.TIMESTAMP(timezone=True))
     )
-    otp: str = Field(max_length=6, default="")
-    otp_expiry_time: datetime | None = Field(
-        default=None, sa_column=Column(pg.TIMESTAMP(timezone=True))
-    )
     created_at: datetime = Field(
         default_factory=lambda: datetime.now(timezone.utc),
         sa_column=Column(
@@ -63,8 +74,7 @@ class User(BaseUserSchema, table=True):
     @computed_field
     @property
     def full_name(self) -> str:
-        full_name = f"{self.first_name} {self.middle_name + ' ' if self.middle_name else ''}{self.last_name}"
-        return full_name.title().strip()
+        return format_full_name(self.first_name, self.middle_name, self.last_name)
 
     def has_role(self, role: RoleChoicesSchema) -> bool:
         return self.role.value == role.value
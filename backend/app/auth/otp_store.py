@@ -0,0 +1,128 @@
+import time
+from abc import ABC, abstractmethod
+from enum import Enum
+
+from backend.app.core.config import settings
+from backend.app.core.redis import get_redis
+
+
+class OTPVerifyResult(str, Enum):
+    VALID = "valid"
+    INVALID = "invalid"
+    EXPIRED = "expired"
+    EXHAUSTED = "exhausted"
+
+
+class OTPStore(ABC):
+    def __init__(self, max_attempts: int) -> None:
+        self.max_attempts = max_attempts
+
+    @abstractmethod
+    async def issue(self, key: str, otp: str, ttl_seconds: int) -> None: ...
+
+    @abstractmethod
+    async def verify(self, key: str, otp: str) -> OTPVerifyResult: ...
+
+    @abstractmethod
+    async def clear(self, key: str) -> None: ...
+
+
+class InMemoryOTPStore(OTPStore):
+    def __init__(self, max_attempts: int) -> None:
+        super().__init__(max_attempts)
+        self._entries: dict[str, tuple[str, float, int]] = {}
+
+    async def issue(self, key: str, otp: str, ttl_seconds: int) -> None:
+        self._entries[key] = (otp, time.monotonic() + ttl_seconds, 0)
+
+    async def verify(self, key: str, otp: str) -> OTPVerifyResult:
+        entry = self._entries.get(key)
+        if entry is None:
+            return OTPVerifyResult.EXPIRED
+
+        stored_otp, expires_at, attempts = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return OTPVerifyResult.EXPIRED
+
+        if stored_otp == otp:
+            del self._entries[key]
+            return OTPVerifyResult.VALID
+
+        attempts += 1
+        if attempts >= self.max_attempts:
+            del self._entries[key]
+            return OTPVerifyResult.EXHAUSTED
+
+        self._entries[key] = (stored_otp, expires_at, attempts)
+        return OTPVerifyResult.INVALID
+
+    async def clear(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+
+VERIFY_SCRIPT = """
+local stored = redis.call('GET', KEYS[1])
+if not stored then
+    return 0
+end
+if stored == ARGV[1] then
+    redis.call('DEL', KEYS[1], KEYS[2])
+    return 1
+end
+local attempts = redis.call('INCR', KEYS[2])
+if attempts == 1 then
+    local ttl = redis.call('PTTL', KEYS[1])
+    if ttl > 0 then
+        redis.call('PEXPIRE', KEYS[2], ttl)
+    end
+end
+if attempts >= tonumber(ARGV[2]) then
+    redis.call('DEL', KEYS[1], KEYS[2])
+    return 3
+end
+return 2
+"""
+
+_VERIFY_RESULTS = {
+    0: OTPVerifyResult.EXPIRED,
+    1: OTPVerifyResult.VALID,
+    2: OTPVerifyResult.INVALID,
+    3: OTPVerifyResult.EXHAUSTED,
+}
+
+
+class RedisOTPStore(OTPStore):
+    def __init__(self, max_attempts: int, prefix: str = "otp") -> None:
+        super().__init__(max_attempts)
+        self._prefix = prefix
+        self._verify_script = get_redis().register_script(VERIFY_SCRIPT)
+
+    def _keys(self, key: str) -> tuple[str, str]:
+        base = f"{self._prefix}:{{{key}}}"
+        return base, f"{base}:attempts"
+
+    async def issue(self, key: str, otp: str, ttl_seconds: int) -> None:
+        otp_key, attempts_key = self._keys(key)
+        async with get_redis().pipeline(transaction=True) as pipe:
+            pipe.set(otp_key, otp, ex=ttl_seconds)
+            pipe.delete(attempts_key)
+            await pipe.execute()
+
+    async def verify(self, key: str, otp: str) -> OTPVerifyResult:
+        result = await self._verify_script(
+            keys=list(self._keys(key)), args=[otp, self.max_attempts]
+        )
+        return _VERIFY_RESULTS[int(result)]
+
+    async def clear(self, key: str) -> None:
+        await get_redis().delete(*self._keys(key))
+
+
+def create_otp_store() -> OTPStore:
+    if settings.OTP_STORE_BACKEND == "memory":
+        return InMemoryOTPStore(max_attempts=settings.OTP_MAX_VERIFY_ATTEMPTS)
+    return RedisOTPStore(max_attempts=settings.OTP_MAX_VERIFY_ATTEMPTS)
+
+
+otp_store = create_otp_store()
@@ -0,0 +1,169 @@
+import asyncio
+import multiprocessing
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable
+
+from fastapi import HTTPException, status
+
+from backend.app.auth.utils import (
+    generate_password_hash,
+    verify_and_rehash_password,
+    verify_password,
+)
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+
+class LatencyRecorder:
+    def __init__(self, window: int = 1024) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.rejected = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self._recent: deque[float] = deque(maxlen=window)
+
+    def record(self, elapsed_ms: float) -> None:
+        self.calls += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self._recent.append(elapsed_ms)
+
+    def percentile(self, pct: float) -> float:
+        if not self._recent:
+            return 0.0
+        ordered = sorted(self._recent)
+        index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "rejected": self.rejected,
+            "avg_ms": round(self.total_ms / self.calls, 2) if self.calls else 0.0,
+            "p50_ms": round(self.percentile(50), 2),
+            "p99_ms": round(self.percentile(99), 2),
+            "max_ms": round(self.max_ms, 2),
+        }
+
+
+class PasswordHashingService:
+    def __init__(
+        self,
+        max_workers: int,
+        max_queue_size: int,
+        queue_timeout: float,
+    ) -> None:
+        self._max_workers = max_workers
+        self._queue_timeout = queue_timeout
+        self._slots = asyncio.Semaphore(max_workers + max_queue_size)
+        # Bulk hashing runs one password per job and leaves a worker free, so
+        # login verifies never queue behind an import.
+        self._bulk_slots = asyncio.Semaphore(max(1, max_workers - 1))
+        self._executor: ProcessPoolExecutor | None = None
+        self._metrics: dict[str, LatencyRecorder] = {
+            "hash": LatencyRecorder(),
+            "verify": LatencyRecorder(),
+        }
+        self.rehashed = 0
+
+    def start(self) -> None:
+        if self._executor is not None:
+            return
+        self._executor = ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        logger.info(
+            f"Password hashing pool started with {self._max_workers} worker(s)"
+        )
+
+    def shutdown(self) -> None:
+        if self._executor is None:
+            return
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._executor = None
+        logger.info("Password hashing pool shut down")
+
+    async def _run(self, operation: str, func: Callable[..., Any], *args: Any) -> Any:
+        metrics = self._metrics[operation]
+
+        try:
+            async with asyncio.timeout(self._queue_timeout):
+                await self._slots.acquire()
+        except asyncio.TimeoutError:
+            metrics.rejected += 1
+            logger.warning(f"Password {operation} rejected: hashing queue is full")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail={
+                    "status": "error",
+                    "message": "Service is busy",
+                    "action": "Please try again in a few moments",
+                },
+            )
+
+        try:
+            self.start()
+            loop = asyncio.get_running_loop()
+            started = time.perf_counter()
+            result = await loop.run_in_executor(self._executor, func, *args)
+            metrics.record((time.perf_counter() - started) * 1000)
+            return result
+        except Exception as e:
+            metrics.errors += 1
+            logger.error(f"Password {operation} failed in worker pool: {e}")
+            raise
+        finally:
+            self._slots.release()
+
+    async def hash(self, password: str) -> str:
+        return await self._run("hash", generate_password_hash, password)
+
+    async def _bulk_hash(self, password: str) -> str:
+        async with self._bulk_slots:
+            return await self.hash(password)
+
+    async def hash_many(self, passwords: list[str]) -> list[str]:
+        return list(
+            await asyncio.gather(*(self._bulk_hash(password) for password in passwords))
+        )
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run("verify", verify_password, password, hashed_password)
+
+    async def verify_and_rehash(
+        self, password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        verified, new_hash = await self._run(
+            "verify", verify_and_rehash_password, password, hashed_password
+        )
+        if new_hash is not None:
+            self.rehashed += 1
+        return verified, new_hash
+
+    def get_metrics(self) -> dict[str, Any]:
+        return {
+            **{
+                operation: recorder.snapshot()
+                for operation, recorder in self._metrics.items()
+            },
+            "rehashed": self.rehashed,
+            "parameters": {
+                "time_cost": settings.ARGON2_TIME_COST,
+                "memory_cost": settings.ARGON2_MEMORY_COST,
+                "parallelism": settings.ARGON2_PARALLELISM,
+            },
+        }
+
+
+password_hasher = PasswordHashingService(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue_size=settings.PASSWORD_HASH_QUEUE_SIZE,
+    queue_timeout=settings.PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS,
+)
@@ -0,0 +1,62 @@
+import uuid
+
+from backend.app.auth.models import User
+from backend.app.core.cache import TwoTierCache
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+from backend.app.user_profile.models import Profile
+
+logger = get_logger()
+
+PRINCIPAL_EXCLUDED_FIELDS = {"hashed_password", "security_answer"}
+
+
+class PrincipalCache:
+    def __init__(self, cache: TwoTierCache) -> None:
+        self._cache = cache
+
+    @staticmethod
+    def serialize(user: User) -> dict:
+        return {
+            "user": user.model_dump(mode="json", exclude=PRINCIPAL_EXCLUDED_FIELDS),
+            "profile": (
+                user.profile.model_dump(mode="json") if user.profile else None
+            ),
+        }
+
+    @staticmethod
+    def deserialize(data: dict) -> User:
+        user = User.model_validate(
+            {**data["user"], "hashed_password": "", "security_answer": ""}
+        )
+        if data["profile"] is not None:
+            user.profile = Profile.model_validate(data["profile"])
+        return user
+
+    async def get(self, user_id: uuid.UUID | str) -> User | None:
+        data = await self._cache.get(str(user_id))
+        if data is None:
+            return None
+        try:
+            return self.deserialize(data)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable principal cache entry: {e}")
+            await self._cache.invalidate(str(user_id))
+            return None
+
+    async def set(self, user: User) -> None:
+        await self._cache.set(str(user.id), self.serialize(user))
+
+    async def invalidate(self, user_id: uuid.UUID | str) -> None:
+        await self._cache.invalidate(str(user_id))
+
+
+principal_cache = PrincipalCache(
+    TwoTierCache(
+        namespace="principal",
+        max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+        local_ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+        redis_ttl_seconds=settings.PRINCIPAL_CACHE_REDIS_TTL_SECONDS,
+        redis_enabled=settings.PRINCIPAL_CACHE_REDIS_ENABLED,
+    )
+)
@@ -0,0 +1,128 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+
+from backend.app.core.bloom import BloomFilter
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+from backend.app.core.redis import get_redis
+
+logger = get_logger()
+
+REVOKED_TOKENS_KEY = "revoked_tokens"
+SYNC_OVERLAP_MS = 5000
+
+
+class TokenRevocationList:
+    def __init__(
+        self, capacity: int, error_rate: float, prefix: str = "revoked_jti"
+    ) -> None:
+        self._capacity = capacity
+        self._error_rate = error_rate
+        self._prefix = prefix
+        self._bloom = BloomFilter(capacity, error_rate)
+        self._ready = False
+        self._last_sync_ms = 0
+        self.bloom_positives = 0
+        self.store_lookups = 0
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    def _key(self, jti: str) -> str:
+        return f"{self._prefix}:{jti}"
+
+    @staticmethod
+    def _max_token_lifetime_ms() -> int:
+        return settings.JWT_REFRESH_TOKEN_EXPIRATION_DAYS * 24 * 60 * 60 * 1000
+
+    async def revoke(self, jti: str, expires_at: int) -> None:
+        ttl_seconds = int(expires_at - datetime.now(timezone.utc).timestamp())
+        if ttl_seconds <= 0:
+            return
+
+        now_ms = int(time.time() * 1000)
+        async with get_redis().pipeline(transaction=True) as pipe:
+            pipe.set(self._key(jti), 1, ex=ttl_seconds)
+            pipe.zadd(REVOKED_TOKENS_KEY, {jti: now_ms})
+            await pipe.execute()
+
+        self._bloom.add(jti)
+
+    async def is_revoked(self, jti: str | None) -> bool:
+        if not jti:
+            return False
+
+        if self._ready:
+            if jti not in self._bloom:
+                return False
+            self.bloom_positives += 1
+
+        self.store_lookups += 1
+        try:
+            return bool(await get_redis().exists(self._key(jti)))
+        except Exception as e:
+            logger.warning(f"Token revocation lookup failed: {e}")
+            return self._ready
+
+    async def rebuild(self) -> None:
+        now_ms = int(time.time() * 1000)
+        redis = get_redis()
+        await redis.zremrangebyscore(
+            REVOKED_TOKENS_KEY, "-inf", now_ms - self._max_token_lifetime_ms()
+        )
+        revoked = await redis.zrangebyscore(REVOKED_TOKENS_KEY, "-inf", "+inf")
+
+        bloom = BloomFilter(max(self._capacity, len(revoked) * 2), self._error_rate)
+        for jti in revoked:
+            bloom.add(jti)
+
+        self._bloom = bloom
+        self._last_sync_ms = now_ms
+        self._ready = True
+        logger.info(f"Token revocation filter rebuilt with {len(revoked)} entries")
+
+    async def sync(self) -> None:
+        now_ms = int(time.time() * 1000)
+        revoked = await get_redis().zrangebyscore(
+            REVOKED_TOKENS_KEY, self._last_sync_ms - SYNC_OVERLAP_MS, "+inf"
+        )
+        for jti in revoked:
+            self._bloom.add(jti)
+        self._last_sync_ms = now_ms
+
+    def get_metrics(self) -> dict[str, int | bool]:
+        return {
+            "ready": self._ready,
+            "entries": len(self._bloom),
+            "bloom_positives": self.bloom_positives,
+            "store_lookups": self.store_lookups,
+        }
+
+
+token_revocation_list = TokenRevocationList(
+    capacity=settings.TOKEN_REVOCATION_BLOOM_CAPACITY,
+    error_rate=settings.TOKEN_REVOCATION_BLOOM_ERROR_RATE,
+)
+
+
+async def run_revocation_sync() -> None:
+    last_rebuild = 0.0
+    while True:
+        try:
+            if (
+                not token_revocation_list.ready
+                or time.monotonic() - last_rebuild
+                >= settings.TOKEN_REVOCATION_REBUILD_INTERVAL_SECONDS
+            ):
+                await token_revocation_list.rebuild()
+                last_rebuild = time.monotonic()
+            else:
+                await token_revocation_list.sync()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Token revocation sync failed: {e}")
+
+        await asyncio.sleep(settings.TOKEN_REVOCATION_SYNC_INTERVAL_SECONDS)
@@ -10,7 +10,11 @@ from fastapi import Response
 
 from backend.app.core.config import settings
 
-_ph = PasswordHasher()
+_ph = PasswordHasher(
+    time_cost=settings.ARGON2_TIME_COST,
+    memory_cost=settings.ARGON2_MEMORY_COST,
+    parallelism=settings.ARGON2_PARALLELISM,
+)
 
 
 def generate_otp(length: int = 6) -> str:
@@ -29,6 +33,17 @@ def verify_password(password: str, hashed_password: str) -> bool:
         return False
 
 
+def verify_and_rehash_password(
+    password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    if not verify_password(password, hashed_password):
+        return False, None
+
+    if _ph.check_needs_rehash(hashed_password):
+        return True, _ph.hash(password)
+    return True, None
+
+
 def generate_username() -> str:
     bank_name = settings.SITE_NAME
     words = bank_name.split()
@@ -64,6 +79,7 @@ def create_jwt_token(id: uuid.UUID, type: str = settings.COOKIE_ACCESS_NAME) ->
     payload = {
         "id": str(id),
         "type": type,
+        "jti": uuid.uuid4().hex,
         "exp": datetime.now(timezone.utc) + expire_delta,
         "iat": datetime.now(timezone.utc),
     }
@@ -129,3 +145,8 @@ def create_password_reset_token(id: uuid.UUID) -> str:
     return jwt.encode(
         payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM
     )
+
+
+def format_full_name(first_name: str, middle_name: str | None, last_name: str) -> str:
+    full_name = f"{first_name} {middle_name + ' ' if middle_name else ''}{last_name}"
+    return full_name.title().strip()
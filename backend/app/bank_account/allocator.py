@@ -0,0 +1,113 @@
+import asyncio
+import hashlib
+
+from fastapi import HTTPException, status
+from sqlalchemy import text
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.app.bank_account.enums import AccountCurrencyEnum
+from backend.app.bank_account.utils import (
+    account_number_prefix,
+    build_account_number,
+)
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+# Serials are block_index * ACCOUNT_NUMBER_BLOCK_SIZE + offset, so changing
+# this value would make new blocks overlap ones that were already issued.
+ACCOUNT_NUMBER_BLOCK_SIZE = 1000
+ACCOUNT_NUMBER_BLOCK_SEQUENCE = "account_number_block_seq"
+
+
+class FeistelPermutation:
+    def __init__(self, digits: int, key: str, rounds: int = 6) -> None:
+        self.digits = digits
+        self.a = 10 ** ((digits + 1) // 2)
+        self.b = 10 ** (digits // 2)
+        self.domain = self.a * self.b
+        self.rounds = rounds
+        self._key = hashlib.sha256(key.encode()).digest()
+
+    def _round(self, round_index: int, value: int) -> int:
+        digest = hashlib.blake2b(
+            round_index.to_bytes(1, "big") + value.to_bytes(8, "big"),
+            key=self._key,
+            digest_size=8,
+        ).digest()
+        return int.from_bytes(digest, "big")
+
+    def permute(self, value: int) -> int:
+        for round_index in range(self.rounds):
+            left, right = divmod(value, self.b)
+            scrambled = (left + self._round(round_index, right)) % self.a
+            value = self.a * right + scrambled
+        return value
+
+    def invert(self, value: int) -> int:
+        for round_index in reversed(range(self.rounds)):
+            right, scrambled = divmod(value, self.a)
+            left = (scrambled - self._round(round_index, right)) % self.a
+            value = self.b * left + right
+        return value
+
+
+class AccountNumberAllocator:
+    def __init__(self, block_size: int = ACCOUNT_NUMBER_BLOCK_SIZE) -> None:
+        self._block_size = block_size
+        self._next_serial = 0
+        self._block_end = 0
+        self._lock = asyncio.Lock()
+        self._permutations: dict[int, FeistelPermutation] = {}
+
+    def _permutation(self, digits: int) -> FeistelPermutation:
+        permutation = self._permutations.get(digits)
+        if permutation is None:
+            permutation = FeistelPermutation(
+                digits, settings.ACCOUNT_NUMBER_SCRAMBLE_KEY or settings.SIGNING_KEY
+            )
+            self._permutations[digits] = permutation
+        return permutation
+
+    async def _reserve_block(self, session: AsyncSession) -> int:
+        result = await session.exec(
+            text(f"SELECT nextval('{ACCOUNT_NUMBER_BLOCK_SEQUENCE}')")
+        )
+        return result.scalar_one()
+
+    async def next_serial(self, session: AsyncSession) -> int:
+        async with self._lock:
+            if self._next_serial >= self._block_end:
+                block_index = await self._reserve_block(session)
+                self._next_serial = block_index * self._block_size
+                self._block_end = self._next_serial + self._block_size
+                logger.info(f"Reserved account number block {block_index}")
+
+            serial = self._next_serial
+            self._next_serial += 1
+            return serial
+
+    def format(self, currency: AccountCurrencyEnum, serial: int) -> str:
+        prefix = account_number_prefix(currency)
+        permutation = self._permutation(16 - len(prefix) - 1)
+
+        if serial >= permutation.domain:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail={
+                    "status": "error",
+                    "message": "Account number space exhausted",
+                },
+            )
+
+        body = str(permutation.permute(serial)).zfill(permutation.digits)
+        return build_account_number(prefix, body)
+
+    async def allocate(
+        self, currency: AccountCurrencyEnum, session: AsyncSession
+    ) -> str:
+        return self.format(currency, await self.next_serial(session))
+
+
+account_number_allocator = AccountNumberAllocator()
@@ -0,0 +1,53 @@
+from typing import Sequence
+
+import numpy as np
+
+DOUBLED_DIGIT_SUMS = np.array([0, 2, 4, 6, 8, 1, 3, 5, 7, 9], dtype=np.int8)
+
+
+def digits_matrix(
+    numbers: Sequence[str],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    encoded = np.asarray(numbers, dtype=np.str_)
+    if encoded.dtype.itemsize == 0:
+        encoded = encoded.astype("U1")
+
+    width = encoded.dtype.itemsize // 4
+    lengths = np.char.str_len(encoded).astype(np.int64)
+    codes = encoded.view(np.uint32).reshape(len(encoded), width)
+    digits = (codes - 48).astype(np.int8)
+
+    in_number = np.arange(width) < lengths[:, None]
+    well_formed = np.all(((codes >= 48) & (codes <= 57)) | ~in_number, axis=1)
+    digits = np.where(in_number & well_formed[:, None], digits, 0)
+    return digits, lengths, well_formed
+
+
+def _check_digits(digits: np.ndarray, partial_lengths: np.ndarray) -> np.ndarray:
+    positions_from_right = partial_lengths[:, None] - 1 - np.arange(digits.shape[1])
+    in_partial = positions_from_right >= 0
+    doubled = in_partial & (positions_from_right % 2 == 1)
+
+    plain = np.where(in_partial & ~doubled, digits, 0)
+    doubled_sums = np.where(doubled, DOUBLED_DIGIT_SUMS[digits], 0)
+    total = plain.sum(axis=1, dtype=np.int64) + doubled_sums.sum(axis=1, dtype=np.int64)
+    return (10 - total % 10) % 10
+
+
+def calculate_luhn_check_digits(numbers: Sequence[str]) -> np.ndarray:
+    if len(numbers) == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    digits, lengths, well_formed = digits_matrix(numbers)
+    check_digits = _check_digits(digits, lengths)
+    return np.where(well_formed & (lengths > 0), check_digits, -1)
+
+
+def validate_luhn_numbers(numbers: Sequence[str]) -> np.ndarray:
+    if len(numbers) == 0:
+        return np.zeros(0, dtype=bool)
+
+    digits, lengths, well_formed = digits_matrix(numbers)
+    last_digits = digits[np.arange(len(numbers)), np.maximum(lengths - 1, 0)]
+    expected = _check_digits(digits, lengths - 1)
+    return well_formed & (lengths > 1) & (expected == last_digits)
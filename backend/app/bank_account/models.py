@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
-from sqlalchemy import func, text
+from sqlalchemy import Index, func, text
 from sqlalchemy.dialects import postgresql as pg
 from sqlmodel import Column, Field, Relationship
 
@@ -13,6 +13,21 @@ if TYPE_CHECKING:
 
 
 class BankAccount(BankAccountBaseSchema, table=True):
+    __table_args__ = (
+        Index(
+            "uq_bankaccount_user_id_primary",
+            "user_id",
+            unique=True,
+            postgresql_where=text("is_primary"),
+        ),
+        Index(
+            "ix_bankaccount_pending_created_at",
+            "created_at",
+            "id",
+            postgresql_where=text("account_status = 'Pending'"),
+        ),
+    )
+
     id: uuid.UUID = Field(
         sa_column=Column(
             pg.UUID(as_uuid=True),
@@ -44,6 +59,15 @@ class BankAccount(BankAccountBaseSchema, table=True):
         ),
     )
 
+    kyc_claimed_by: uuid.UUID | None = Field(default=None)
+    kyc_claim_expires_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(
+            pg.TIMESTAMP(timezone=True),
+            nullable=True,
+        ),
+    )
+
     user_id: uuid.UUID = Field(foreign_key="user.id", ondelete="CASCADE")
 
     user: "User" = Relationship(back_populates="bank_accounts")
@@ -0,0 +1,49 @@
+from backend.app.bank_account.schema import NameEnquiryResponseSchema
+from backend.app.core.cache import CacheVersion, TwoTierCache
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+
+class NameEnquiryCache:
+    def __init__(self, cache: TwoTierCache) -> None:
+        self._cache = cache
+
+    async def get(self, account_number: str) -> NameEnquiryResponseSchema | None:
+        data = await self._cache.get(account_number)
+        if data is None:
+            return None
+        try:
+            return NameEnquiryResponseSchema.model_validate(data)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable name enquiry cache entry: {e}")
+            await self._cache.invalidate(account_number)
+            return None
+
+    async def version(self, account_number: str) -> CacheVersion:
+        return await self._cache.version(account_number)
+
+    async def set(
+        self, result: NameEnquiryResponseSchema, version: CacheVersion | None = None
+    ) -> None:
+        await self._cache.set(
+            result.account_number, result.model_dump(mode="json"), version
+        )
+
+    async def invalidate(self, account_number: str) -> None:
+        await self._cache.invalidate(account_number)
+
+    def get_metrics(self) -> dict[str, int]:
+        return self._cache.get_metrics()
+
+
+name_enquiry_cache = NameEnquiryCache(
+    TwoTierCache(
+        namespace="name_enquiry",
+        max_size=settings.NAME_ENQUIRY_CACHE_MAX_SIZE,
+        local_ttl_seconds=settings.NAME_ENQUIRY_CACHE_TTL_SECONDS,
+        redis_ttl_seconds=settings.NAME_ENQUIRY_CACHE_REDIS_TTL_SECONDS,
+        redis_enabled=settings.NAME_ENQUIRY_CACHE_REDIS_ENABLED,
+    )
+)
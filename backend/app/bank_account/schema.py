@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Literal
 from uuid import UUID
 
 from sqlmodel import Field, SQLModel
@@ -8,6 +9,8 @@ from backend.app.bank_account.enums import (
     AccountStatusEnum,
     AccountTypeEnum,
 )
+from backend.app.next_of_kin.schema import NextOfKinReadSchema
+from backend.app.user_profile.schema import ProfileBaseSchema
 
 
 class BankAccountBaseSchema(SQLModel):
@@ -40,3 +43,75 @@ class BankAccountUpdateSchema(BankAccountBaseSchema):
     account_name: str | None = None
     is_primary: bool | None = None
     account_status: AccountStatusEnum | None = None
+
+
+class AccountNumberValidationRequestSchema(SQLModel):
+    account_numbers: list[str] = Field(min_length=1, max_length=100000)
+
+
+class AccountNumberValidationResponseSchema(SQLModel):
+    total: int
+    valid: int
+    invalid: int
+    invalid_account_numbers: list[str]
+
+
+class NameEnquiryResponseSchema(SQLModel):
+    account_id: UUID
+    account_number: str
+    account_name: str
+    holder_name: str
+    currency: AccountCurrencyEnum
+    account_status: AccountStatusEnum
+
+
+class BankAccountBulkActivateRequestSchema(SQLModel):
+    account_ids: list[UUID] = Field(min_length=1, max_length=500)
+
+
+class BankAccountActivationResultSchema(SQLModel):
+    account_id: UUID
+    status: Literal[
+        "activated", "already_active", "not_found", "own_account", "claimed"
+    ]
+    account_number: str | None = None
+
+
+class BankAccountBulkActivateResponseSchema(SQLModel):
+    requested: int
+    activated: int
+    failed: int
+    emails_queued: bool
+    results: list[BankAccountActivationResultSchema]
+
+
+class KycClaimRequestSchema(SQLModel):
+    limit: int = Field(default=10, ge=1)
+
+
+class KycReleaseRequestSchema(SQLModel):
+    account_ids: list[UUID] = Field(min_length=1, max_length=500)
+
+
+class KycApplicantSchema(SQLModel):
+    id: UUID
+    email: str
+    full_name: str
+    id_no: int
+
+
+class KycReviewItemSchema(SQLModel):
+    account: BankAccountReadSchema
+    applicant: KycApplicantSchema
+    profile: ProfileBaseSchema | None
+    next_of_kins: list[NextOfKinReadSchema]
+
+
+class KycClaimResponseSchema(SQLModel):
+    claimed: int
+    lease_expires_at: datetime
+    items: list[KycReviewItemSchema]
+
+
+class KycReleaseResponseSchema(SQLModel):
+    released: int
@@ -1,5 +1,3 @@
-import secrets
-
 from fastapi import HTTPException, status
 
 from backend.app.bank_account.enums import AccountCurrencyEnum
@@ -47,44 +45,24 @@ def calculate_luhn_check_digit(number: str) -> int:
     return (10 - (total % 10)) % 10
 
 
-def generate_account_number(currency: AccountCurrencyEnum) -> str:
-    try:
-        if not all([settings.BANK_CODE, settings.BANK_BRANCH_CODE]):
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail={
-                    "status": "error",
-                    "message": "Bank or Branch code not configured",
-                },
-            )
-
-        currency_code = get_currency_code(currency)
-
-        prefix = f"{settings.BANK_CODE}{settings.BANK_BRANCH_CODE}{currency_code}"
-
-        remaining_digits = 16 - len(prefix) - 1
-
-        random_digits = "".join(
-            secrets.choice("0123456789") for _ in range(remaining_digits)
-        )
-
-        partial_account_number = f"{prefix}{random_digits}"
-
-        check_digit = calculate_luhn_check_digit(partial_account_number)
-
-        account_number = f"{partial_account_number}{check_digit}"
-
-        return account_number
-
-    except HTTPException as http_ex:
-        logger.error(f"HTTP Exception in account number generation: {http_ex.detail}")
-        raise http_ex
-    except Exception as e:
-        logger.error(f"Error generating account number: {e}")
+def account_number_prefix(currency: AccountCurrencyEnum) -> str:
+    if not all([settings.BANK_CODE, settings.BANK_BRANCH_CODE]):
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={
                 "status": "error",
-                "message": f"Failed to generate account number: {str(e)}",
+                "message": "Bank or Branch code not configured",
             },
         )
+
+    currency_code = get_currency_code(currency)
+
+    return f"{settings.BANK_CODE}{settings.BANK_BRANCH_CODE}{currency_code}"
+
+
+def build_account_number(prefix: str, body: str) -> str:
+    partial_account_number = f"{prefix}{body}"
+
+    check_digit = calculate_luhn_check_digit(partial_account_number)
+
+    return f"{partial_account_number}{check_digit}"
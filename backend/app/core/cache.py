@@ -0,0 +1,204 @@
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from typing import Any
+
+from backend.app.core.logging import get_logger
+from backend.app.core.redis import get_redis
+
+logger = get_logger()
+
+INVALIDATION_CHANNEL = "cache:invalidate"
+
+# Writes the value only if the key's generation is still the one the caller
+# read before loading it, so a fill racing an invalidation is dropped.
+GUARDED_SET_SCRIPT = """
+if (redis.call('GET', KEYS[2]) or '0') ~= ARGV[1] then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+return 1
+"""
+
+CacheVersion = tuple[int, str | None]
+
+
+class LRUTTLCache:
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self._ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_registry: dict[str, "TwoTierCache"] = {}
+
+
+class TwoTierCache:
+    def __init__(
+        self,
+        namespace: str,
+        max_size: int,
+        local_ttl_seconds: float,
+        redis_ttl_seconds: int,
+        redis_enabled: bool = True,
+    ) -> None:
+        self.namespace = namespace
+        self._local = LRUTTLCache(max_size=max_size, ttl_seconds=local_ttl_seconds)
+        self._redis_ttl_seconds = redis_ttl_seconds
+        self._redis_enabled = redis_enabled
+        self._epoch = 0
+        self._guarded_set_script = None
+        _registry[namespace] = self
+
+    def _redis_key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def _generation_key(self, key: str) -> str:
+        return f"{self._redis_key(key)}:generation"
+
+    async def version(self, key: str) -> CacheVersion:
+        if not self._redis_enabled:
+            return self._epoch, None
+
+        try:
+            generation = await get_redis().get(self._generation_key(key))
+        except Exception as e:
+            logger.warning(f"Redis read failed for cache {self.namespace}: {e}")
+            return self._epoch, None
+        return self._epoch, generation or "0"
+
+    async def get(self, key: str) -> dict | None:
+        value = self._local.get(key)
+        if value is not None or not self._redis_enabled:
+            return value
+
+        try:
+            raw = await get_redis().get(self._redis_key(key))
+        except Exception as e:
+            logger.warning(f"Redis read failed for cache {self.namespace}: {e}")
+            return None
+
+        if raw is None:
+            return None
+
+        value = json.loads(raw)
+        self._local.set(key, value)
+        return value
+
+    async def set(
+        self, key: str, value: dict, version: CacheVersion | None = None
+    ) -> None:
+        if version is None or version[0] == self._epoch:
+            self._local.set(key, value)
+        if not self._redis_enabled:
+            return
+
+        try:
+            if version is None:
+                await get_redis().set(
+                    self._redis_key(key), json.dumps(value), ex=self._redis_ttl_seconds
+                )
+            elif version[1] is not None:
+                if self._guarded_set_script is None:
+                    self._guarded_set_script = get_redis().register_script(
+                        GUARDED_SET_SCRIPT
+                    )
+                await self._guarded_set_script(
+                    keys=[self._redis_key(key), self._generation_key(key)],
+                    args=[version[1], json.dumps(value), self._redis_ttl_seconds],
+                )
+        except Exception as e:
+            logger.warning(f"Redis write failed for cache {self.namespace}: {e}")
+
+    async def invalidate(self, key: str) -> None:
+        self._local.delete(key)
+        self._epoch += 1
+        if not self._redis_enabled:
+            return
+
+        try:
+            redis = get_redis()
+            async with redis.pipeline(transaction=True) as pipe:
+                pipe.incr(self._generation_key(key))
+                pipe.expire(self._generation_key(key), self._redis_ttl_seconds)
+                pipe.delete(self._redis_key(key))
+                await pipe.execute()
+            await redis.publish(INVALIDATION_CHANNEL, self._redis_key(key))
+        except Exception as e:
+            logger.warning(f"Redis invalidation failed for cache {self.namespace}: {e}")
+
+    def evict_local(self, key: str) -> None:
+        self._local.delete(key)
+        self._epoch += 1
+
+    def clear_local(self) -> None:
+        self._local.clear()
+
+    def get_metrics(self) -> dict[str, int]:
+        return {
+            "size": len(self._local),
+            "hits": self._local.hits,
+            "misses": self._local.misses,
+        }
+
+
+async def listen_for_invalidations() -> None:
+    while True:
+        pubsub = get_redis().pubsub()
+        try:
+            await pubsub.subscribe(INVALIDATION_CHANNEL)
+            logger.info("Subscribed to cache invalidation channel")
+
+            while True:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=1.0
+                )
+                if message is None:
+                    continue
+                namespace, _, key = message["data"].partition(":")
+                cache = _registry.get(namespace)
+                if cache is not None:
+                    cache.evict_local(key)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Cache invalidation listener error: {e}")
+            for cache in _registry.values():
+                cache.clear_local()
+            await asyncio.sleep(1)
+        finally:
+            await pubsub.aclose()
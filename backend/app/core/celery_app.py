@@ -1,4 +1,5 @@
 from celery import Celery
+from celery.schedules import crontab
 
 from backend.app.core.config import settings
 
@@ -27,7 +28,21 @@ celery_app.conf.update(
     task_default_retry_delay=300,
     task_max_retries=3,
     task_default_queue="nextgen_tasks",
+    task_routes={"send_login_otp_task": {"queue": "otp_delivery"}},
     task_create_missing_queues=True,
+    beat_schedule={
+        "snapshot-balances": {
+            "task": "snapshot_balances_task",
+            "schedule": crontab(minute=settings.BALANCE_SNAPSHOT_SCHEDULE_MINUTE),
+        },
+        "accrue-interest": {
+            "task": "accrue_interest_task",
+            "schedule": crontab(
+                hour=settings.INTEREST_ACCRUAL_SCHEDULE_HOUR,
+                minute=settings.INTEREST_ACCRUAL_SCHEDULE_MINUTE,
+            ),
+        },
+    },
     worker_max_tasks_per_child=1000,
     worker_max_memory_per_child=50000,
     worker_log_format="[%(asctime)s: %(levelname)s/%(processName)s] %(message)s",
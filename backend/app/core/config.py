@@ -25,6 +25,7 @@ class Settings(BaseSettings):
     REDIS_HOST: str = "redis"
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
+    REDIS_SOCKET_TIMEOUT_SECONDS: float = 2.0
 
     RABBITMQ_HOST: str = "rabbitmq"
     RABBITMQ_PORT: int = 5672
@@ -67,6 +68,64 @@ class Settings(BaseSettings):
     CURRENCY_CODE_GBP: str = ""
     CURRENCY_CODE_KES: str = ""
     MAX_BANK_ACCOUNTS: int = 3
+    ACCOUNT_NUMBER_SCRAMBLE_KEY: str = ""
+
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_QUEUE_SIZE: int = 64
+    PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS: float = 5.0
+    ARGON2_TIME_COST: int = 3
+    ARGON2_MEMORY_COST: int = 65536
+    ARGON2_PARALLELISM: int = 4
+
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10000
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    PRINCIPAL_CACHE_REDIS_TTL_SECONDS: int = 300
+    PRINCIPAL_CACHE_REDIS_ENABLED: bool = True
+
+    NAME_ENQUIRY_CACHE_MAX_SIZE: int = 50000
+    NAME_ENQUIRY_CACHE_TTL_SECONDS: int = 300
+    NAME_ENQUIRY_CACHE_REDIS_TTL_SECONDS: int = 3600
+    NAME_ENQUIRY_CACHE_REDIS_ENABLED: bool = True
+
+    PROFILE_SEARCH_SIMILARITY_THRESHOLD: float = 0.5
+
+    OTP_STORE_BACKEND: Literal["redis", "memory"] = "redis"
+    OTP_MAX_VERIFY_ATTEMPTS: int = 3
+
+    LOGIN_ATTEMPTS_BACKEND: Literal["redis", "memory"] = "redis"
+    LOGIN_ATTEMPTS_WINDOW_SECONDS: int = 15 * 60
+
+    TOKEN_REVOCATION_BLOOM_CAPACITY: int = 100000
+    TOKEN_REVOCATION_BLOOM_ERROR_RATE: float = 0.001
+    TOKEN_REVOCATION_SYNC_INTERVAL_SECONDS: float = 1.0
+    TOKEN_REVOCATION_REBUILD_INTERVAL_SECONDS: int = 60 * 60
+
+    USER_IMPORT_BATCH_SIZE: int = 500
+
+    USER_EXISTENCE_BLOOM_CAPACITY: int = 1000000
+    USER_EXISTENCE_BLOOM_ERROR_RATE: float = 0.001
+    USER_EXISTENCE_SYNC_INTERVAL_SECONDS: float = 1.0
+    USER_EXISTENCE_REBUILD_INTERVAL_SECONDS: int = 6 * 60 * 60
+
+    FX_RATES: dict[str, float] = {"USD": 1.0, "EUR": 0.92, "GBP": 0.79, "KES": 129.0}
+    TRANSFER_BATCH_MAX_SIZE: int = 100
+    TRANSFER_BATCH_LINGER_MS: float = 0.0
+
+    STATEMENT_PAGE_SIZE: int = 1000
+    STATEMENT_MAX_RANGE_DAYS: int = 366
+
+    BALANCE_SNAPSHOT_SETTLE_MINUTES: int = 15
+    BALANCE_SNAPSHOT_SCHEDULE_MINUTE: int = 30
+    BALANCE_SNAPSHOT_MAX_DAYS_PER_RUN: int = 31
+
+    INTEREST_ACCRUAL_CHUNK_SIZE: int = 10_000
+    INTEREST_ACCRUAL_DAY_COUNT: int = 365
+    INTEREST_ACCRUAL_MAX_DAYS_PER_RUN: int = 7
+    INTEREST_ACCRUAL_SCHEDULE_HOUR: int = 1
+    INTEREST_ACCRUAL_SCHEDULE_MINUTE: int = 0
+
+    KYC_CLAIM_LEASE_MINUTES: int = 30
+    KYC_CLAIM_MAX_BATCH: int = 50
 
 
 settings = Settings()
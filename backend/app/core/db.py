@@ -1,9 +1,10 @@
 import asyncio
+from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
-from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.app.core.config import settings
@@ -47,6 +48,18 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
                 logger.error(f"Error closing database session: {close_error}")
 
 
+@asynccontextmanager
+async def task_session() -> AsyncGenerator[AsyncSession, None]:
+    # Celery tasks run each job in a fresh event loop, so they cannot share
+    # the pooled connections of the module level engine.
+    task_engine = create_async_engine(settings.DATABASE_URL, poolclass=NullPool)
+    try:
+        async with AsyncSession(task_engine, expire_on_commit=False) as session:
+            yield session
+    finally:
+        await task_engine.dispose()
+
+
 async def init_db() -> None:
     try:
         load_models()
@@ -1,3 +1,6 @@
+import asyncio
+
+from celery import group
 from jinja2 import Environment, FileSystemLoader
 
 from backend.app.core.emails.config import TEMPLATES_DIR
@@ -17,6 +20,16 @@ class EmailTemplate:
     template_name_plain: str
     subject: str
 
+    @classmethod
+    def render(cls, context: dict) -> tuple[str, str]:
+        if not cls.template_name or not cls.template_name_plain:
+            raise ValueError("Both HTML and plain text email templates are required")
+
+        html_template = email_env.get_template(cls.template_name)
+        plain_template = email_env.get_template(cls.template_name_plain)
+
+        return html_template.render(**context), plain_template.render(**context)
+
     @classmethod
     async def send_email(
         cls,
@@ -27,16 +40,7 @@ class EmailTemplate:
         try:
             recipients_list = [email_to] if isinstance(email_to, str) else email_to
 
-            if not cls.template_name or not cls.template_name_plain:
-                raise ValueError(
-                    "Both HTML and plain text email templates are required"
-                )
-
-            html_template = email_env.get_template(cls.template_name)
-            plain_template = email_env.get_template(cls.template_name_plain)
-
-            html_content = html_template.render(**context)
-            plain_content = plain_template.render(**context)
+            html_content, plain_content = cls.render(context)
 
             task = send_email_task.delay(
                 recipients=recipients_list,
@@ -51,3 +55,32 @@ class EmailTemplate:
                 f"Failed to queue email task for {recipients_list}: Error: {str(e)}"
             )
             raise
+
+    @classmethod
+    async def send_batch(
+        cls,
+        messages: list[tuple[str, dict]],
+        subject_override: str | None = None,
+    ) -> None:
+        if not messages:
+            return
+
+        try:
+            signatures = []
+            for email_to, context in messages:
+                html_content, plain_content = cls.render(context)
+                signatures.append(
+                    send_email_task.s(
+                        recipients=[email_to],
+                        subject=subject_override or cls.subject,
+                        html_content=html_content,
+                        plain_content=plain_content,
+                    )
+                )
+
+            result = await asyncio.to_thread(group(signatures).apply_async)
+            logger.info(f"Email group {result.id} queued for {len(signatures)} recipients")
+
+        except Exception as e:
+            logger.error(f"Failed to queue email batch of {len(messages)}: Error: {str(e)}")
+            raise
@@ -0,0 +1,88 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Generic, Hashable, TypeVar
+
+from sqlalchemy.orm import raiseload
+from sqlalchemy.orm.interfaces import LoaderOption
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LoadPlan:
+    def __init__(self, *options: LoaderOption, strict: bool = True) -> None:
+        # Strict plans turn every relationship they do not name into an
+        # error, so a forgotten eager load fails loudly instead of issuing
+        # one query per row.
+        self.options = options + ((raiseload("*"),) if strict else ())
+
+    def apply(self, statement):
+        return statement.options(*self.options)
+
+
+class BatchLoader(Generic[K, V]):
+    def __init__(
+        self,
+        batch_fn: Callable[[list[K]], Awaitable[dict[K, V]]],
+        default_factory: Callable[[], V] = lambda: None,
+    ) -> None:
+        self._batch_fn = batch_fn
+        self._default_factory = default_factory
+        self._futures: dict[K, asyncio.Future] = {}
+        self._queue: list[K] = []
+        self._dispatch_task: asyncio.Task | None = None
+        # Batches share the caller's session, which cannot run two queries at
+        # once, so a load issued while a batch is in flight waits its turn.
+        self._dispatch_lock = asyncio.Lock()
+        self.batches = 0
+
+    async def load(self, key: K) -> V:
+        future = self._futures.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._futures[key] = future
+            self._queue.append(key)
+            if self._dispatch_task is None:
+                self._dispatch_task = asyncio.create_task(self._dispatch())
+        return await future
+
+    async def load_many(self, keys: list[K]) -> list[V]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    async def _dispatch(self) -> None:
+        # Yield once so every load() issued in the same tick joins the batch.
+        await asyncio.sleep(0)
+        async with self._dispatch_lock:
+            # Keys queued while an earlier batch held the session join this one.
+            keys, self._queue = self._queue, []
+            self._dispatch_task = None
+            self.batches += 1
+
+            try:
+                results = await self._batch_fn(keys)
+            except Exception as e:
+                for key in keys:
+                    self._futures.pop(key).set_exception(e)
+                return
+
+        for key in keys:
+            value = results[key] if key in results else self._default_factory()
+            self._futures[key].set_result(value)
+
+
+def related_loader(
+    session: AsyncSession, model: type, key_column: Any, many: bool = True
+) -> BatchLoader:
+    async def load_related(keys: list) -> dict:
+        result = await session.exec(select(model).where(key_column.in_(keys)))
+        grouped: dict = {}
+        for row in result.all():
+            key = getattr(row, key_column.key)
+            if many:
+                grouped.setdefault(key, []).append(row)
+            else:
+                grouped[key] = row
+        return grouped
+
+    return BatchLoader(load_related, default_factory=list if many else lambda: None)
@@ -0,0 +1,27 @@
+from redis import asyncio as aioredis
+
+from backend.app.core.config import settings
+from backend.app.core.logging import get_logger
+
+logger = get_logger()
+
+redis_client = aioredis.Redis(
+    host=settings.REDIS_HOST,
+    port=settings.REDIS_PORT,
+    db=settings.REDIS_DB,
+    decode_responses=True,
+    socket_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+    socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+)
+
+
+def get_redis() -> aioredis.Redis:
+    return redis_client
+
+
+async def close_redis() -> None:
+    try:
+        await redis_client.aclose()
+        logger.debug("Redis client closed successfully")
+    except Exception as e:
+        logger.error(f"Error closing redis client: {e}")
@@ -8,14 +8,23 @@ class ActivationEmail(EmailTemplate):
     subject = "Activate your Account"
 
 
-async def send_activation_email(email: str, token: str) -> None:
+def activation_context(token: str) -> dict:
     activation_url = (
         f"{settings.API_BASE_URL}{settings.API_V1_STR}/auth/activate/{token}"
     )
-    context = {
+    return {
         "activation_url": activation_url,
         "expiry_time": settings.ACTIVATION_TOKEN_EXPIRATION_MINUTES,
         "site_name": settings.SITE_NAME,
         "support_email": settings.SUPPORT_EMAIL,
     }
-    await ActivationEmail.send_email(email_to=email, context=context)
+
+
+async def send_activation_email(email: str, token: str) -> None:
+    await ActivationEmail.send_email(email_to=email, context=activation_context(token))
+
+
+async def send_activation_emails(recipients: list[tuple[str, str]]) -> None:
+    await ActivationEmail.send_batch(
+        [(email, activation_context(token)) for email, token in recipients]
+    )
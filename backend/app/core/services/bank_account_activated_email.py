@@ -8,15 +8,14 @@ class AccountActivatedEmail(EmailTemplate):
     subject = "Your Bank Account Has been Activated"
 
 
-async def send_account_activated_email(
-    email: str,
+def account_activated_context(
     full_name: str,
     account_number: str,
     account_name: str,
     account_type: str,
     currency: str,
-) -> None:
-    context = {
+) -> dict:
+    return {
         "full_name": full_name,
         "account_number": account_number,
         "account_name": account_name,
@@ -26,4 +25,21 @@ async def send_account_activated_email(
         "support_email": settings.SUPPORT_EMAIL,
     }
 
+
+async def send_account_activated_email(
+    email: str,
+    full_name: str,
+    account_number: str,
+    account_name: str,
+    account_type: str,
+    currency: str,
+) -> None:
+    context = account_activated_context(
+        full_name, account_number, account_name, account_type, currency
+    )
+
     await AccountActivatedEmail.send_email(email_to=email, context=context)
+
+
+async def send_account_activated_emails(recipients: list[tuple[str, dict]]) -> None:
+    await AccountActivatedEmail.send_batch(recipients)
@@ -1,5 +1,20 @@
+import asyncio
+import uuid
+
+from celery import states
+
+from backend.app.core.celery_app import celery_app
 from backend.app.core.config import settings
 from backend.app.core.emails.base import EmailTemplate
+from backend.app.core.logging import get_logger
+from backend.app.core.redis import get_redis
+from backend.app.core.tasks.email import OTP_DELIVERY_QUEUE, send_login_otp_task
+
+logger = get_logger()
+
+DELIVERY_FAILED_PREFIX = "otp_delivery"
+
+_pending_publishes: set[asyncio.Task] = set()
 
 
 class LoginOTPEmail(EmailTemplate):
@@ -8,11 +23,88 @@ class LoginOTPEmail(EmailTemplate):
     subject = "Your Login OTP"
 
 
-async def send_login_otp_email(email: str, otp: str) -> None:
+def _delivery_ttl_seconds() -> int:
+    return settings.OTP_EXPIRATION_MINUTES * 60
+
+
+async def _mark_delivery_failed(delivery_id: str) -> None:
+    try:
+        await get_redis().set(
+            f"{DELIVERY_FAILED_PREFIX}:{delivery_id}",
+            "failed",
+            ex=_delivery_ttl_seconds(),
+        )
+    except Exception as e:
+        logger.warning(f"Failed to record OTP delivery failure {delivery_id}: {e}")
+
+
+async def _publish_login_otp(delivery_id: str, email: str, kwargs: dict) -> None:
+    try:
+        await asyncio.to_thread(
+            send_login_otp_task.apply_async,
+            kwargs=kwargs,
+            task_id=delivery_id,
+            queue=OTP_DELIVERY_QUEUE,
+            expires=_delivery_ttl_seconds(),
+            retry=True,
+            retry_policy={
+                "max_retries": 3,
+                "interval_start": 0,
+                "interval_step": 0.5,
+                "interval_max": 2,
+            },
+        )
+        logger.info(f"Login OTP delivery {delivery_id} queued for: {email}")
+    except Exception as e:
+        logger.error(f"Failed to queue login OTP delivery {delivery_id}: {e}")
+        await _mark_delivery_failed(delivery_id)
+
+
+def dispatch_login_otp_email(email: str, otp: str) -> str:
     context = {
         "otp": otp,
         "expiry_time": settings.OTP_EXPIRATION_MINUTES,
         "site_name": settings.SITE_NAME,
         "support_email": settings.SUPPORT_EMAIL,
     }
-    await LoginOTPEmail.send_email(email_to=email, context=context)
+    html_content, plain_content = LoginOTPEmail.render(context)
+
+    delivery_id = str(uuid.uuid4())
+    task = asyncio.create_task(
+        _publish_login_otp(
+            delivery_id,
+            email,
+            {
+                "recipients": [email],
+                "subject": LoginOTPEmail.subject,
+                "html_content": html_content,
+                "plain_content": plain_content,
+            },
+        )
+    )
+    _pending_publishes.add(task)
+    task.add_done_callback(_pending_publishes.discard)
+    return delivery_id
+
+
+async def get_login_otp_delivery_status(delivery_id: str) -> str:
+    try:
+        marker = await get_redis().get(f"{DELIVERY_FAILED_PREFIX}:{delivery_id}")
+    except Exception as e:
+        logger.warning(f"Failed to read OTP delivery marker {delivery_id}: {e}")
+        marker = None
+
+    if marker == "failed":
+        return "failed"
+
+    state = await asyncio.to_thread(lambda: celery_app.AsyncResult(delivery_id).state)
+
+    if state == states.SUCCESS:
+        return "delivered"
+    if state in (states.FAILURE, states.REVOKED):
+        return "failed"
+    if state == states.RETRY:
+        return "retrying"
+    if state == states.STARTED:
+        return "sending"
+    return "queued"
@@ -1,4 +1,11 @@
-from .email import send_email_task
+from .email import send_email_task, send_login_otp_task
 from .image_upload import upload_profile_image_task
+from .ledger import accrue_interest_task, snapshot_balances_task
 
-__all__ = ["send_email_task", "upload_profile_image_task"]
+__all__ = [
+    "accrue_interest_task",
+    "send_email_task",
+    "send_login_otp_task",
+    "snapshot_balances_task",
+    "upload_profile_image_task",
+]
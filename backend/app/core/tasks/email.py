@@ -8,6 +8,21 @@ from backend.app.core.logging import get_logger
 
 logger = get_logger()
 
+OTP_DELIVERY_QUEUE = "otp_delivery"
+
+
+def build_message(
+    recipients: list[str], subject: str, html_content: str, plain_content: str
+) -> MessageSchema:
+    return MessageSchema(
+        subject=subject,
+        recipients=recipients,
+        body=html_content,
+        subtype=MessageType.html,
+        alternative_body=plain_content,
+        multipart_subtype=MultipartSubtypeEnum.alternative,
+    )
+
 
 @celery_app.task(
     name="send_email_task",
@@ -22,17 +37,29 @@ def send_email_task(
     self, *, recipients: list[str], subject: str, html_content: str, plain_content: str
 ) -> bool:
     try:
-        message = MessageSchema(
-            subject=subject,
-            recipients=recipients,
-            body=html_content,
-            subtype=MessageType.html,
-            alternative_body=plain_content,
-            multipart_subtype=MultipartSubtypeEnum.alternative,
-        )
+        message = build_message(recipients, subject, html_content, plain_content)
         asyncio.run(fastamail.send_message(message))
         logger.info(f"Email successfully sent to {recipients} with subject {subject}")
         return True
     except Exception as e:
         logger.error(f"Failed to send email to {recipients}: Error: {str(e)}")
         return False
+
+
+@celery_app.task(
+    name="send_login_otp_task",
+    bind=True,
+    max_retries=5,
+    soft_time_limit=15,
+    autoretry_for=(Exception,),
+    retry_backoff=1,
+    retry_backoff_max=10,
+    retry_jitter=True,
+)
+def send_login_otp_task(
+    self, *, recipients: list[str], subject: str, html_content: str, plain_content: str
+) -> bool:
+    message = build_message(recipients, subject, html_content, plain_content)
+    asyncio.run(fastamail.send_message(message))
+    logger.info(f"Login OTP delivered to {recipients} (attempt {self.request.retries + 1})")
+    return True
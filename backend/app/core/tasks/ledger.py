@@ -0,0 +1,56 @@
+import asyncio
+
+from backend.app.api.services.balance_snapshot import take_balance_snapshots
+from backend.app.api.services.interest import accrue_interest
+from backend.app.core.celery_app import celery_app
+from backend.app.core.db import task_session
+from backend.app.core.logging import get_logger
+from backend.app.core.model_registry import load_models
+
+logger = get_logger()
+
+
+async def _snapshot_balances() -> int:
+    async with task_session() as session:
+        taken = await take_balance_snapshots(session)
+    return len(taken)
+
+
+@celery_app.task(
+    name="snapshot_balances_task",
+    bind=True,
+    max_retries=3,
+    soft_time_limit=25 * 60,
+    time_limit=30 * 60,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_backoff_max=300,
+)
+def snapshot_balances_task(self) -> int:
+    load_models()
+    days = asyncio.run(_snapshot_balances())
+    logger.info(f"Balance snapshot run completed for {days} day(s)")
+    return days
+
+
+async def _accrue_interest() -> int:
+    async with task_session() as reader, task_session() as writer:
+        accrued = await accrue_interest(reader, writer)
+    return len(accrued)
+
+
+@celery_app.task(
+    name="accrue_interest_task",
+    bind=True,
+    max_retries=3,
+    soft_time_limit=55 * 60,
+    time_limit=60 * 60,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_backoff_max=300,
+)
+def accrue_interest_task(self) -> int:
+    load_models()
+    days = asyncio.run(_accrue_interest())
+    logger.info(f"Interest accrual run completed for {days} day(s)")
+    return days
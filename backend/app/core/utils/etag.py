@@ -0,0 +1,30 @@
+import hashlib
+
+from sqlalchemy import String, cast, column
+
+
+def row_version(model: type):
+    # xmin changes whenever Postgres writes a new version of the row, including
+    # updates that bypass the ORM and so never touch updated_at.
+    return cast(column("xmin", _selectable=model.__table__), String)
+
+
+def weak_etag(*parts: object) -> str:
+    raw = "|".join(str(part) for part in parts).encode()
+    return f'W/"{hashlib.sha1(raw).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def etag_headers(etag: str) -> dict[str, str]:
+    return {"ETag": etag, "Cache-Control": "private, no-cache"}
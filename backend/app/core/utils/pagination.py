@@ -0,0 +1,53 @@
+import base64
+import uuid
+from datetime import datetime
+
+from sqlalchemy import text
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+def _encode(*parts: object) -> str:
+    raw = "|".join(str(part) for part in parts).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode(cursor: str) -> list[str]:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return base64.urlsafe_b64decode(padded).decode().split("|")
+
+
+def encode_cursor(created_at: datetime, row_id: uuid.UUID) -> str:
+    return _encode(created_at.isoformat(), row_id)
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    try:
+        created_at, row_id = _decode(cursor)
+        return datetime.fromisoformat(created_at), uuid.UUID(row_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def encode_rank_cursor(score: float, row_id: uuid.UUID) -> str:
+    return _encode(repr(score), row_id)
+
+
+def decode_rank_cursor(cursor: str) -> tuple[float, uuid.UUID]:
+    try:
+        score, row_id = _decode(cursor)
+        return float(score), uuid.UUID(row_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+async def estimate_row_count(table_name: str, session: AsyncSession) -> int | None:
+    result = await session.exec(
+        text(
+            "SELECT reltuples::bigint FROM pg_class "
+            "WHERE oid = to_regclass(:table_name)"
+        ).bindparams(table_name=f'"{table_name}"')
+    )
+    estimate = result.scalar()
+    if estimate is None or estimate < 0:
+        return None
+    return estimate
@@ -0,0 +1,16 @@
+from enum import Enum
+
+
+class JournalEntryTypeEnum(str, Enum):
+    Transfer = "transfer"
+    Deposit = "deposit"
+    Withdrawal = "withdrawal"
+    Interest = "interest"
+    Adjustment = "adjustment"
+
+
+class InternalAccountEnum(str, Enum):
+    Cash = "cash"
+    FxClearing = "fx_clearing"
+    InterestExpense = "interest_expense"
+    OpeningBalance = "opening_balance"
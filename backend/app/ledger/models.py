@@ -0,0 +1,128 @@
+import uuid
+from datetime import date, datetime, timezone
+
+from sqlalchemy import BigInteger, CheckConstraint, Identity, Index, text
+from sqlalchemy.dialects import postgresql as pg
+from sqlmodel import Column, Field, SQLModel
+
+from backend.app.bank_account.enums import AccountCurrencyEnum
+from backend.app.ledger.schema import JournalEntryBaseSchema, PostingBaseSchema
+
+
+class JournalEntry(JournalEntryBaseSchema, table=True):
+    id: uuid.UUID = Field(
+        sa_column=Column(
+            pg.UUID(as_uuid=True),
+            primary_key=True,
+        ),
+        default_factory=uuid.uuid4,
+    )
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(
+            pg.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=text("CURRENT_TIMESTAMP"),
+        ),
+    )
+
+
+class Posting(PostingBaseSchema, table=True):
+    __table_args__ = (
+        CheckConstraint(
+            "(account_id IS NULL) <> (internal_account IS NULL)",
+            name="ck_posting_single_target",
+        ),
+        CheckConstraint("amount <> 0", name="ck_posting_nonzero_amount"),
+        Index("ix_posting_account_id_created_at_id", "account_id", "created_at", "id"),
+        Index("ix_posting_created_at", "created_at", postgresql_using="brin"),
+    )
+
+    id: int | None = Field(
+        default=None,
+        sa_column=Column(BigInteger, Identity(always=False), primary_key=True),
+    )
+    amount: int = Field(sa_column=Column(BigInteger, nullable=False))
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(
+            pg.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=text("CURRENT_TIMESTAMP"),
+        ),
+    )
+    journal_entry_id: uuid.UUID = Field(
+        foreign_key="journalentry.id", ondelete="RESTRICT", index=True
+    )
+    account_id: uuid.UUID | None = Field(
+        default=None, foreign_key="bankaccount.id", ondelete="RESTRICT"
+    )
+
+
+class LedgerBalance(SQLModel, table=True):
+    account_id: uuid.UUID = Field(
+        primary_key=True, foreign_key="bankaccount.id", ondelete="CASCADE"
+    )
+    currency: AccountCurrencyEnum
+    balance: int = Field(default=0, sa_column=Column(BigInteger, nullable=False))
+    version: int = Field(default=0, sa_column=Column(BigInteger, nullable=False))
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(
+            pg.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=text("CURRENT_TIMESTAMP"),
+        ),
+    )
+
+
+class BalanceSnapshot(SQLModel, table=True):
+    account_id: uuid.UUID = Field(
+        primary_key=True, foreign_key="bankaccount.id", ondelete="CASCADE"
+    )
+    snapshot_date: date = Field(primary_key=True)
+    as_of: datetime = Field(
+        sa_column=Column(pg.TIMESTAMP(timezone=True), nullable=False)
+    )
+    balance: int = Field(sa_column=Column(BigInteger, nullable=False))
+    postings: int = Field(default=0)
+
+
+class BalanceSnapshotRun(SQLModel, table=True):
+    snapshot_date: date = Field(primary_key=True)
+    accounts: int = Field(default=0)
+    completed_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(
+            pg.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=text("CURRENT_TIMESTAMP"),
+        ),
+    )
+
+
+class InterestAccrualRun(SQLModel, table=True):
+    accrual_date: date = Field(primary_key=True)
+    last_account_id: uuid.UUID | None = Field(default=None)
+    accounts: int = Field(default=0)
+    chunks: int = Field(default=0)
+    started_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(
+            pg.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=text("CURRENT_TIMESTAMP"),
+        ),
+    )
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(
+            pg.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=text("CURRENT_TIMESTAMP"),
+        ),
+    )
+    completed_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(pg.TIMESTAMP(timezone=True), nullable=True),
+    )
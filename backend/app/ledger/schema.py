@@ -0,0 +1,80 @@
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+
+from pydantic import model_validator
+from sqlmodel import Field, SQLModel
+
+from backend.app.bank_account.enums import AccountCurrencyEnum
+from backend.app.ledger.enums import InternalAccountEnum, JournalEntryTypeEnum
+
+
+class JournalEntryBaseSchema(SQLModel):
+    idempotency_key: str = Field(max_length=128, unique=True, index=True)
+    entry_type: JournalEntryTypeEnum
+    description: str | None = Field(default=None, max_length=255)
+
+
+class PostingBaseSchema(SQLModel):
+    account_id: UUID | None = Field(default=None)
+    internal_account: InternalAccountEnum | None = Field(default=None)
+    currency: AccountCurrencyEnum
+    amount: int
+
+
+class PostingCreateSchema(PostingBaseSchema):
+    @model_validator(mode="after")
+    def validate_target(self):
+        if (self.account_id is None) == (self.internal_account is None):
+            raise ValueError(
+                "A posting must target exactly one of account_id or internal_account"
+            )
+        if self.amount == 0:
+            raise ValueError("Posting amount cannot be zero")
+        return self
+
+
+class JournalEntryCreateSchema(JournalEntryBaseSchema):
+    postings: list[PostingCreateSchema] = Field(min_length=2)
+
+
+class LedgerBalanceReadSchema(SQLModel):
+    account_id: UUID
+    currency: AccountCurrencyEnum
+    balance: int
+    version: int
+    updated_at: datetime
+
+
+class TransferCreateSchema(SQLModel):
+    idempotency_key: str = Field(min_length=8, max_length=64)
+    source_account_id: UUID
+    destination_account_id: UUID
+    amount: Decimal = Field(gt=0, max_digits=18, decimal_places=2)
+    description: str | None = Field(default=None, max_length=255)
+
+    @model_validator(mode="after")
+    def validate_accounts(self):
+        if self.source_account_id == self.destination_account_id:
+            raise ValueError("Source and destination accounts must be different")
+        return self
+
+
+class TransferReadSchema(SQLModel):
+    journal_entry_id: UUID
+    source_account_id: UUID
+    destination_account_id: UUID
+    amount: Decimal
+    currency: AccountCurrencyEnum
+    destination_amount: Decimal
+    destination_currency: AccountCurrencyEnum
+    exchange_rate: Decimal
+    created: bool
+
+
+class BalanceAtReadSchema(SQLModel):
+    account_id: UUID
+    currency: AccountCurrencyEnum
+    at: datetime
+    balance: Decimal
+    snapshot_date: date | None
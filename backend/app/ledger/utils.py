@@ -0,0 +1,24 @@
+from decimal import ROUND_HALF_EVEN, Decimal
+
+from backend.app.bank_account.enums import AccountCurrencyEnum
+
+CURRENCY_EXPONENTS = {
+    AccountCurrencyEnum.USD: 2,
+    AccountCurrencyEnum.EUR: 2,
+    AccountCurrencyEnum.GBP: 2,
+    AccountCurrencyEnum.KES: 2,
+}
+
+
+def minor_unit_scale(currency: AccountCurrencyEnum) -> int:
+    return 10 ** CURRENCY_EXPONENTS[currency]
+
+
+def to_minor_units(amount: Decimal | float | str, currency: AccountCurrencyEnum) -> int:
+    scaled = Decimal(str(amount)) * minor_unit_scale(currency)
+    return int(scaled.quantize(Decimal(1), rounding=ROUND_HALF_EVEN))
+
+
+def from_minor_units(amount: int, currency: AccountCurrencyEnum) -> Decimal:
+    exponent = CURRENCY_EXPONENTS[currency]
+    return Decimal(amount).scaleb(-exponent)
@@ -6,10 +6,20 @@ from fastapi import FastAPI, status
 from fastapi.responses import JSONResponse
 
 from backend.app.api.main import api_router
+from backend.app.api.services.transfer import transfer_batcher
+from backend.app.api.services.user_existence import (
+    run_existence_sync,
+    user_existence_service,
+)
+from backend.app.auth.password_hasher import password_hasher
+from backend.app.auth.token_revocation import run_revocation_sync, token_revocation_list
+from backend.app.bank_account.name_enquiry_cache import name_enquiry_cache
+from backend.app.core.cache import listen_for_invalidations
 from backend.app.core.config import settings
 from backend.app.core.db import engine, init_db
 from backend.app.core.health import ServiceStatus, health_checker
 from backend.app.core.logging import get_logger
+from backend.app.core.redis import close_redis
 
 logger = get_logger()
 
@@ -43,12 +53,25 @@ async def startup_health_check(timeout: float = 90.0) -> bool:
         return False
 
 
+async def shutdown_background_tasks(tasks: list[asyncio.Task]) -> None:
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    tasks.clear()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    background_tasks: list[asyncio.Task] = []
     try:
         await init_db()
         logger.info("Database initialized successfully")
 
+        password_hasher.start()
+        background_tasks.append(asyncio.create_task(listen_for_invalidations()))
+        background_tasks.append(asyncio.create_task(run_revocation_sync()))
+        background_tasks.append(asyncio.create_task(run_existence_sync()))
+
         await health_checker.add_service("database", health_checker.check_database)
         await health_checker.add_service("celery", health_checker.check_celery)
         await health_checker.add_service("redis", health_checker.check_redis)
@@ -60,13 +83,19 @@ async def lifespan(app: FastAPI):
         yield
     except Exception as e:
         logger.error(f"Application startup failed: {e}")
+        await shutdown_background_tasks(background_tasks)
         await engine.dispose()
         await health_checker.cleanup()
+        await close_redis()
+        password_hasher.shutdown()
         raise
     finally:
         logger.info("Shutting down")
+        await shutdown_background_tasks(background_tasks)
         await engine.dispose()
         await health_checker.cleanup()
+        await close_redis()
+        password_hasher.shutdown()
 
 
 app = FastAPI(
@@ -91,7 +120,17 @@ async def health_check():
         else:
             status_code = status.HTTP_503_SERVICE_UNAVAILABLE
 
-        return JSONResponse(status_code=status_code, content=health_status)
+        return JSONResponse(
+            status_code=status_code,
+            content={
+                **health_status,
+                "password_hashing": password_hasher.get_metrics(),
+                "token_revocation": token_revocation_list.get_metrics(),
+                "user_existence": user_existence_service.get_metrics(),
+                "transfers": transfer_batcher.get_metrics(),
+                "name_enquiry_cache": name_enquiry_cache.get_metrics(),
+            },
+        )
     except Exception as e:
         logger.error(f"Health check failed: {e}")
         return JSONResponse(
@@ -36,6 +36,6 @@ class NextOfKin(NextOfKinBaseSchema, table=True):
             onupdate=func.current_timestamp(),
         ),
     )
-    user_id: uuid.UUID = Field(foreign_key="user.id", ondelete="CASCADE")
+    user_id: uuid.UUID = Field(foreign_key="user.id", ondelete="CASCADE", index=True)
 
     user: "User" = Relationship(back_populates="next_of_kins")
@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
-from sqlalchemy import func, text
+from sqlalchemy import Index, func, text
 from sqlalchemy.dialects import postgresql as pg
 from sqlmodel import Column, Field, Relationship
 
@@ -13,6 +13,15 @@ if TYPE_CHECKING:
 
 
 class Profile(ProfileBaseSchema, table=True):
+    __table_args__ = (
+        Index(
+            "ix_profile_phone_number_trgm",
+            "phone_number",
+            postgresql_using="gin",
+            postgresql_ops={"phone_number": "gin_trgm_ops"},
+        ),
+    )
+
     id: uuid.UUID = Field(
         sa_column=Column(
             pg.UUID(as_uuid=True),
@@ -37,6 +46,6 @@ class Profile(ProfileBaseSchema, table=True):
         ),
     )
 
-    user_id: uuid.UUID = Field(foreign_key="user.id", ondelete="CASCADE")
+    user_id: uuid.UUID = Field(foreign_key="user.id", ondelete="CASCADE", index=True)
 
     user: "User" = Relationship(back_populates="profile")
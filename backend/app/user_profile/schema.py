@@ -99,6 +99,17 @@ class ProfileResponseSchema(SQLModel):
 
 class PaginatedProfileResponseSchema(SQLModel):
     profiles: list[ProfileResponseSchema]
-    total: int
-    skip: int
     limit: int
+    next_cursor: str | None = None
+    total: int | None = None
+    total_is_estimate: bool = False
+
+
+class ProfileSearchHitSchema(ProfileResponseSchema):
+    score: float
+
+
+class ProfileSearchResponseSchema(SQLModel):
+    results: list[ProfileSearchHitSchema]
+    limit: int
+    next_cursor: str | None = None
@@ -0,0 +1,103 @@
+import argparse
+import asyncio
+import secrets
+import time
+
+from backend.app.bank_account.allocator import AccountNumberAllocator
+from backend.app.bank_account.enums import AccountCurrencyEnum
+from backend.app.bank_account.utils import (
+    account_number_prefix,
+    calculate_luhn_check_digit,
+)
+from backend.benchmarks.common import print_table
+
+
+class LocalBlockAllocator(AccountNumberAllocator):
+    def __init__(self) -> None:
+        super().__init__()
+        self.blocks_reserved = 0
+
+    async def _reserve_block(self, session) -> int:
+        block_index = self.blocks_reserved
+        self.blocks_reserved += 1
+        return block_index
+
+
+async def run_allocator(count: int, currency: AccountCurrencyEnum) -> list[object]:
+    allocator = LocalBlockAllocator()
+    issued: set[str] = set()
+    invalid_check_digits = 0
+
+    started = time.perf_counter()
+    for _ in range(count):
+        account_number = await allocator.allocate(currency, None)
+        issued.add(account_number)
+    elapsed = time.perf_counter() - started
+
+    for account_number in list(issued)[:10000]:
+        if calculate_luhn_check_digit(account_number[:-1]) != int(account_number[-1]):
+            invalid_check_digits += 1
+
+    return [
+        "block allocator",
+        count,
+        count - len(issued),
+        allocator.blocks_reserved,
+        invalid_check_digits,
+        elapsed / count * 1_000_000,
+    ]
+
+
+def run_random(count: int, currency: AccountCurrencyEnum) -> list[object]:
+    prefix = account_number_prefix(currency)
+    remaining_digits = 16 - len(prefix) - 1
+    issued: set[str] = set()
+    retries = 0
+
+    started = time.perf_counter()
+    while len(issued) < count:
+        body = "".join(secrets.choice("0123456789") for _ in range(remaining_digits))
+        if body in issued:
+            retries += 1
+            continue
+        issued.add(body)
+    elapsed = time.perf_counter() - started
+
+    return ["random digits", count, retries, "-", 0, elapsed / count * 1_000_000]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare block-allocated account numbers with random generation"
+    )
+    parser.add_argument("--count", type=int, default=2_000_000)
+    parser.add_argument(
+        "--currency",
+        choices=[currency.value for currency in AccountCurrencyEnum],
+        default=AccountCurrencyEnum.USD.value,
+    )
+    args = parser.parse_args()
+
+    currency = AccountCurrencyEnum(args.currency)
+    prefix = account_number_prefix(currency)
+    print(
+        f"Prefix {prefix} leaves {16 - len(prefix) - 1} digits "
+        f"({10 ** (16 - len(prefix) - 1):,} numbers)\n"
+    )
+
+    rows = [await run_allocator(args.count, currency), run_random(args.count, currency)]
+    print_table(
+        [
+            "generator",
+            "issued",
+            "collisions/retries",
+            "blocks reserved",
+            "bad check digits",
+            "us/number",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
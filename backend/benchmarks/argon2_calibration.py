@@ -0,0 +1,101 @@
+import argparse
+import secrets
+import statistics
+import time
+
+from argon2 import PasswordHasher
+
+from backend.app.core.config import settings
+from backend.benchmarks.common import print_table
+
+
+def measure_verify_ms(hasher: PasswordHasher, samples: int) -> float:
+    password = secrets.token_urlsafe(16)
+    hashed = hasher.hash(password)
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        hasher.verify(hashed, password)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate_memory_cost(
+    memory_cost: int,
+    parallelism: int,
+    target_ms: float,
+    max_time_cost: int,
+    samples: int,
+) -> tuple[int, float] | None:
+    best = None
+    for time_cost in range(1, max_time_cost + 1):
+        hasher = PasswordHasher(
+            time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism
+        )
+        latency_ms = measure_verify_ms(hasher, samples)
+        if latency_ms > target_ms:
+            break
+        best = (time_cost, latency_ms)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Find the strongest Argon2 parameters that verify within a target latency on this host"
+    )
+    parser.add_argument("--target-ms", type=float, default=250.0)
+    parser.add_argument(
+        "--memory-costs",
+        type=int,
+        nargs="+",
+        default=[19456, 47104, 65536, 131072, 262144],
+        help="Candidate memory costs in KiB",
+    )
+    parser.add_argument("--parallelism", type=int, default=settings.ARGON2_PARALLELISM)
+    parser.add_argument("--max-time-cost", type=int, default=10)
+    parser.add_argument("--samples", type=int, default=5)
+    args = parser.parse_args()
+
+    current = PasswordHasher(
+        time_cost=settings.ARGON2_TIME_COST,
+        memory_cost=settings.ARGON2_MEMORY_COST,
+        parallelism=settings.ARGON2_PARALLELISM,
+    )
+    print(
+        f"Current parameters t={settings.ARGON2_TIME_COST} "
+        f"m={settings.ARGON2_MEMORY_COST} p={settings.ARGON2_PARALLELISM}: "
+        f"{measure_verify_ms(current, args.samples):.2f} ms per verification\n"
+    )
+
+    rows = []
+    candidates = []
+    for memory_cost in args.memory_costs:
+        result = calibrate_memory_cost(
+            memory_cost,
+            args.parallelism,
+            args.target_ms,
+            args.max_time_cost,
+            args.samples,
+        )
+        if result is None:
+            rows.append([memory_cost, "-", "-", "over target"])
+            continue
+        time_cost, latency_ms = result
+        rows.append([memory_cost, time_cost, latency_ms, "ok"])
+        candidates.append((memory_cost * time_cost, memory_cost, time_cost, latency_ms))
+
+    print_table(["memory KiB", "time cost", "verify ms", "status"], rows)
+
+    if not candidates:
+        print(f"\nNo candidate verifies within {args.target_ms} ms on this host")
+        return
+
+    _, memory_cost, time_cost, latency_ms = max(candidates)
+    print(f"\nRecommended ({latency_ms:.2f} ms per verification):")
+    print(f"ARGON2_TIME_COST={time_cost}")
+    print(f"ARGON2_MEMORY_COST={memory_cost}")
+    print(f"ARGON2_PARALLELISM={args.parallelism}")
+
+
+if __name__ == "__main__":
+    main()
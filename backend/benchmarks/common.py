@@ -0,0 +1,72 @@
+import statistics
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+class RoundTripCounter:
+    def __init__(self, engine: AsyncEngine) -> None:
+        self._engine = engine.sync_engine
+        self.count = 0
+
+    def _on_execute(self, *args) -> None:
+        self.count += 1
+
+    def _on_commit(self, *args) -> None:
+        self.count += 1
+
+    def __enter__(self) -> "RoundTripCounter":
+        event.listen(self._engine, "before_cursor_execute", self._on_execute)
+        event.listen(self._engine, "commit", self._on_commit)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        event.remove(self._engine, "before_cursor_execute", self._on_execute)
+        event.remove(self._engine, "commit", self._on_commit)
+
+
+class LatencySamples:
+    def __init__(self) -> None:
+        self.samples_ms: list[float] = []
+
+    @asynccontextmanager
+    async def measure(self) -> AsyncIterator[None]:
+        started = time.perf_counter()
+        yield
+        self.samples_ms.append((time.perf_counter() - started) * 1000)
+
+    def percentile(self, pct: float) -> float:
+        if not self.samples_ms:
+            return 0.0
+        ordered = sorted(self.samples_ms)
+        index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def summary(self) -> dict[str, float]:
+        return {
+            "mean_ms": statistics.fmean(self.samples_ms) if self.samples_ms else 0.0,
+            "p50_ms": self.percentile(50),
+            "p99_ms": self.percentile(99),
+        }
+
+
+def print_table(headers: list[str], rows: list[list[object]]) -> None:
+    widths = [
+        max(len(str(header)), *(len(_format(row[i])) for row in rows))
+        for i, header in enumerate(headers)
+    ]
+    print("  ".join(str(h).ljust(w) for h, w in zip(headers, widths)))
+    print("  ".join("-" * w for w in widths))
+    for row in rows:
+        print("  ".join(_format(v).ljust(w) for v, w in zip(row, widths)))
+
+
+def _format(value: object) -> str:
+    if isinstance(value, float):
+        return f"{value:,.2f}"
+    if isinstance(value, int):
+        return f"{value:,}"
+    return str(value)
@@ -0,0 +1,96 @@
+import argparse
+import asyncio
+
+from sqlmodel import select
+
+from backend.app.api.services.next_of_kin import (
+    get_next_of_kins_etag,
+    get_user_next_of_kins,
+)
+from backend.app.api.services.profile import get_profile_etag, get_user_with_profile
+from backend.app.auth.models import User
+from backend.app.core.db import async_session, engine
+from backend.app.core.model_registry import load_models
+from backend.app.next_of_kin.schema import NextOfKinReadSchema
+from backend.app.user_profile.schema import ProfileResponseSchema
+from backend.benchmarks.common import LatencySamples, RoundTripCounter, print_table
+
+# Compares a full read of /profile/me and /next-of-kin/all with the version
+# probe that answers an unchanged poll with 304 Not Modified.
+
+
+async def full_profile(user: User, session) -> None:
+    loaded = await get_user_with_profile(user.id, session)
+    ProfileResponseSchema(
+        username=loaded.username or "",
+        first_name=loaded.first_name or "",
+        middle_name=loaded.middle_name or "",
+        last_name=loaded.last_name or "",
+        email=loaded.email or "",
+        id_no=str(loaded.id_no) if loaded.id_no else "",
+        role=loaded.role,
+        profile=loaded.profile,
+    ).model_dump_json()
+
+
+async def full_next_of_kins(user: User, session) -> None:
+    next_of_kins = await get_user_next_of_kins(user.id, session)
+    for kin in next_of_kins:
+        NextOfKinReadSchema.model_validate(kin).model_dump_json()
+
+
+async def profile_probe(user: User, session) -> None:
+    await get_profile_etag(user.id, session)
+
+
+async def next_of_kins_probe(user: User, session) -> None:
+    await get_next_of_kins_etag(user.id, session)
+
+
+async def measure(name: str, read, user: User, iterations: int) -> list[object]:
+    latency = LatencySamples()
+    trips = 0
+
+    with RoundTripCounter(engine) as counter:
+        for _ in range(iterations):
+            before = counter.count
+            async with async_session() as session:
+                async with latency.measure():
+                    await read(user, session)
+            trips += counter.count - before
+
+    summary = latency.summary()
+    return [name, trips / iterations, summary["p50_ms"], summary["p99_ms"]]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare full profile reads with the conditional GET probe"
+    )
+    parser.add_argument("--email", required=True, help="Email of a user with a profile")
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    load_models()
+    async with async_session() as session:
+        result = await session.exec(select(User).where(User.email == args.email))
+        user = result.first()
+        if user is None:
+            print(f"No user with email {args.email}")
+            return
+
+    print_table(
+        ["read", "round-trips/op", "p50 ms", "p99 ms"],
+        [
+            await measure("profile 200", full_profile, user, args.iterations),
+            await measure("profile 304", profile_probe, user, args.iterations),
+            await measure("next of kin 200", full_next_of_kins, user, args.iterations),
+            await measure("next of kin 304", next_of_kins_probe, user, args.iterations),
+        ],
+    )
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,180 @@
+import argparse
+import asyncio
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import delete
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import col, select
+
+from backend.app.api.services.bank_account import create_bank_account
+from backend.app.auth.models import User
+from backend.app.bank_account.allocator import account_number_allocator
+from backend.app.bank_account.enums import AccountCurrencyEnum, AccountTypeEnum
+from backend.app.bank_account.models import BankAccount
+from backend.app.bank_account.schema import BankAccountCreateSchema
+from backend.app.core.config import settings
+from backend.app.core.db import async_session, engine
+from backend.app.core.model_registry import load_models
+from backend.benchmarks.common import LatencySamples, RoundTripCounter, print_table
+
+# Creates and deletes bank accounts for the given user, who must have a
+# profile and a next of kin and no existing bank accounts.
+
+
+async def legacy_create_bank_account(
+    user_id: UUID, account_data: BankAccountCreateSchema, session
+) -> BankAccount:
+    result = await session.exec(select(User).where(User.id == user_id))
+    user = result.first()
+    await session.refresh(user, ["profile", "next_of_kins"])
+    if not user.profile or not user.next_of_kins:
+        raise HTTPException(status_code=400, detail="KYC requirements not met")
+
+    result = await session.exec(
+        select(BankAccount).where(BankAccount.user_id == user_id)
+    )
+    existing_accounts = result.all()
+    if len(existing_accounts) >= settings.MAX_BANK_ACCOUNTS:
+        raise HTTPException(status_code=400, detail="Maximum accounts reached")
+    if account_data.is_primary and any(a.is_primary for a in existing_accounts):
+        raise HTTPException(status_code=400, detail="Primary account exists")
+
+    account = BankAccount(
+        **account_data.model_dump(exclude={"account_number"}),
+        user_id=user_id,
+        account_number=await account_number_allocator.allocate(
+            account_data.currency, session
+        ),
+    )
+    session.add(account)
+    await session.commit()
+    await session.refresh(account)
+    return account
+
+
+def account_data(is_primary: bool) -> BankAccountCreateSchema:
+    return BankAccountCreateSchema(
+        account_type=AccountTypeEnum.Savings,
+        currency=AccountCurrencyEnum.USD,
+        account_name="Benchmark account",
+        is_primary=is_primary,
+    )
+
+
+async def delete_accounts(user_id: UUID) -> None:
+    async with async_session() as session:
+        await session.exec(
+            delete(BankAccount).where(col(BankAccount.user_id) == user_id)
+        )
+        await session.commit()
+
+
+async def measure(name: str, create, user_id: UUID, iterations: int) -> list[object]:
+    latency = LatencySamples()
+    trips = 0
+
+    with RoundTripCounter(engine) as counter:
+        for _ in range(iterations):
+            before = counter.count
+            async with latency.measure():
+                async with async_session() as session:
+                    await create(user_id, account_data(False), session)
+            trips += counter.count - before
+            await delete_accounts(user_id)
+
+    summary = latency.summary()
+    return [name, trips / iterations, summary["p50_ms"], summary["p99_ms"]]
+
+
+async def race(name: str, create, user_id: UUID, parallel: int) -> list[object]:
+    async def attempt() -> bool:
+        async with async_session() as session:
+            try:
+                await create(user_id, account_data(True), session)
+                return True
+            except (HTTPException, IntegrityError):
+                await session.rollback()
+                return False
+
+    results = await asyncio.gather(*(attempt() for _ in range(parallel)))
+
+    async with async_session() as session:
+        result = await session.exec(
+            select(BankAccount).where(BankAccount.user_id == user_id)
+        )
+        accounts = result.all()
+    await delete_accounts(user_id)
+
+    primaries = sum(1 for account in accounts if account.is_primary)
+    holds = len(accounts) <= settings.MAX_BANK_ACCOUNTS and primaries <= 1
+    return [
+        name,
+        parallel,
+        sum(results),
+        len(accounts),
+        primaries,
+        "yes" if holds else "NO",
+    ]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare create_bank_account round-trips and check the account "
+            "limits under parallel creates"
+        )
+    )
+    parser.add_argument(
+        "--email", required=True, help="Email of a user with completed KYC"
+    )
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--parallel", type=int, default=20)
+    args = parser.parse_args()
+
+    load_models()
+    async with async_session() as session:
+        result = await session.exec(select(User).where(User.email == args.email))
+        user = result.first()
+        if user is None:
+            print(f"No user with email {args.email}")
+            return
+
+        result = await session.exec(
+            select(BankAccount.id).where(BankAccount.user_id == user.id)
+        )
+        if result.first() is not None:
+            print(f"{args.email} already has bank accounts; use a fresh test user")
+            return
+
+    print_table(
+        ["implementation", "round-trips/op", "p50 ms", "p99 ms"],
+        [
+            await measure(
+                "legacy", legacy_create_bank_account, user.id, args.iterations
+            ),
+            await measure("aggregate", create_bank_account, user.id, args.iterations),
+        ],
+    )
+    print()
+
+    print_table(
+        [
+            "implementation",
+            "parallel creates",
+            "succeeded",
+            "accounts",
+            "primaries",
+            "limits hold",
+        ],
+        [
+            await race("legacy", legacy_create_bank_account, user.id, args.parallel),
+            await race("aggregate", create_bank_account, user.id, args.parallel),
+        ],
+    )
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,55 @@
+import argparse
+import asyncio
+
+from backend.app.api.services.login_state import login_state_engine
+from backend.app.api.services.user_auth import user_auth_service
+from backend.app.core.config import settings
+from backend.app.core.db import async_session, engine
+from backend.app.core.model_registry import load_models
+from backend.app.core.redis import close_redis
+from backend.benchmarks.common import LatencySamples, RoundTripCounter, print_table
+
+
+async def record_failure(email: str) -> None:
+    async with async_session() as session:
+        user = await user_auth_service.get_user_by_email(email, session)
+        await login_state_engine.record_failed_attempt(user, session)
+        await login_state_engine.reset_login_failures(user, session)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure database writes caused by a burst of failed logins"
+    )
+    parser.add_argument("--email", required=True, help="Email of an active test user")
+    parser.add_argument("--iterations", type=int, default=1000)
+    args = parser.parse_args()
+
+    load_models()
+
+    latency = LatencySamples()
+    with RoundTripCounter(engine) as counter:
+        for _ in range(args.iterations):
+            async with latency.measure():
+                await record_failure(args.email)
+
+    summary = latency.summary()
+    print_table(
+        ["backend", "failures", "round-trips/failure", "p50 ms", "p99 ms"],
+        [
+            [
+                settings.LOGIN_ATTEMPTS_BACKEND,
+                args.iterations,
+                counter.count / args.iterations,
+                summary["p50_ms"],
+                summary["p99_ms"],
+            ]
+        ],
+    )
+
+    await engine.dispose()
+    await close_redis()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,104 @@
+import argparse
+import asyncio
+import time
+import uuid
+from decimal import ROUND_HALF_EVEN, Decimal
+
+import numpy as np
+
+from backend.app.api.services.interest import compute_daily_accruals, stage_accruals
+from backend.app.core.config import settings
+from backend.app.core.db import async_session, engine
+from backend.app.core.model_registry import load_models
+from backend.benchmarks.common import print_table
+
+# The compute comparison needs no database. With --copy the staging COPY is
+# measured against DATABASE_URL inside transactions that are rolled back.
+
+
+def scalar_accruals(balances: list[int], rates: list[float], day_count: int) -> list:
+    accruals = []
+    for balance, rate in zip(balances, rates):
+        daily = Decimal(balance) * Decimal(str(rate)) / 100 / day_count
+        accruals.append(int(daily.quantize(Decimal(1), rounding=ROUND_HALF_EVEN)))
+    return accruals
+
+
+def vectorized_accruals(
+    balances: np.ndarray, rates: np.ndarray, day_count: int, chunk_size: int
+) -> np.ndarray:
+    return np.concatenate(
+        [
+            compute_daily_accruals(
+                balances[start : start + chunk_size],
+                rates[start : start + chunk_size],
+                day_count,
+            )
+            for start in range(0, len(balances), chunk_size)
+        ]
+    )
+
+
+async def copy_throughput(accruals: np.ndarray, chunk_size: int) -> float:
+    started = time.perf_counter()
+    for start in range(0, len(accruals), chunk_size):
+        chunk = accruals[start : start + chunk_size].tolist()
+        records = [(uuid.uuid4(), amount) for amount in chunk]
+        async with async_session() as session:
+            await stage_accruals(records, session)
+            await session.rollback()
+    return time.perf_counter() - started
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare per-row and vectorized daily interest accrual"
+    )
+    parser.add_argument("--accounts", type=int, default=10_000_000)
+    parser.add_argument("--scalar-sample", type=int, default=200_000)
+    parser.add_argument(
+        "--chunk-size", type=int, default=settings.INTEREST_ACCRUAL_CHUNK_SIZE
+    )
+    parser.add_argument("--copy", action="store_true")
+    args = parser.parse_args()
+
+    day_count = settings.INTEREST_ACCRUAL_DAY_COUNT
+    rng = np.random.default_rng(7)
+    balances = rng.integers(1, 50_000_000, args.accounts, dtype=np.int64)
+    rates = np.round(rng.uniform(0.1, 12.0, args.accounts), 2)
+
+    sample = min(args.scalar_sample, args.accounts)
+    started = time.perf_counter()
+    expected = scalar_accruals(
+        balances[:sample].tolist(), rates[:sample].tolist(), day_count
+    )
+    scalar_s = (time.perf_counter() - started) * args.accounts / sample
+
+    started = time.perf_counter()
+    accruals = vectorized_accruals(balances, rates, day_count, args.chunk_size)
+    vector_s = time.perf_counter() - started
+    assert accruals[:sample].tolist() == expected
+
+    rows = [
+        [
+            "per-row Decimal (extrapolated)",
+            args.accounts,
+            scalar_s,
+            args.accounts / scalar_s,
+        ],
+        ["NumPy chunks", args.accounts, vector_s, args.accounts / vector_s],
+    ]
+
+    if args.copy:
+        load_models()
+        copy_s = await copy_throughput(accruals, args.chunk_size)
+        rows.append(
+            ["COPY into staging", args.accounts, copy_s, args.accounts / copy_s]
+        )
+        await engine.dispose()
+
+    print_table(["stage", "accounts", "seconds", "accounts/s"], rows)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,94 @@
+import argparse
+import asyncio
+import time
+import uuid
+
+from sqlalchemy import ARRAY, Uuid, any_, bindparam, update
+from sqlmodel import col
+
+from backend.app.api.services.kyc_queue import claim_pending_accounts
+from backend.app.bank_account.models import BankAccount
+from backend.app.core.db import async_session, engine
+from backend.app.core.model_registry import load_models
+from backend.benchmarks.common import LatencySamples, print_table
+
+# Every claim is made under a fresh reviewer id so that accounts stay leased
+# for the rest of the run, the way they would while under review. All leases
+# taken by the benchmark are cleared when a scenario finishes.
+
+
+async def clear_claims(reviewer_ids: list[uuid.UUID]) -> None:
+    async with async_session() as session:
+        await session.exec(
+            update(BankAccount)
+            .where(
+                col(BankAccount.kyc_claimed_by)
+                == any_(
+                    bindparam(
+                        "reviewer_ids", reviewer_ids, type_=ARRAY(Uuid(as_uuid=True))
+                    )
+                )
+            )
+            .values(kyc_claimed_by=None, kyc_claim_expires_at=None)
+        )
+        await session.commit()
+
+
+async def run_scenario(reviewers: int, batch_size: int) -> list[object]:
+    latency = LatencySamples()
+    reviewer_ids: list[uuid.UUID] = []
+    claimed: list[uuid.UUID] = []
+
+    async def reviewer() -> None:
+        while True:
+            reviewer_id = uuid.uuid4()
+            reviewer_ids.append(reviewer_id)
+            async with latency.measure():
+                async with async_session() as session:
+                    items, _ = await claim_pending_accounts(
+                        reviewer_id, batch_size, session
+                    )
+            if not items:
+                return
+            claimed.extend(item.account.id for item in items)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(reviewer() for _ in range(reviewers)))
+    elapsed = time.perf_counter() - started
+
+    await clear_claims(reviewer_ids)
+
+    summary = latency.summary()
+    return [
+        reviewers,
+        len(claimed),
+        len(claimed) / elapsed,
+        summary["p50_ms"],
+        summary["p99_ms"],
+        len(claimed) - len(set(claimed)),
+    ]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Drain the pending KYC queue with a growing number of reviewers"
+    )
+    parser.add_argument("--reviewers", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--batch-size", type=int, default=10)
+    args = parser.parse_args()
+
+    load_models()
+    rows = [
+        await run_scenario(reviewers, args.batch_size) for reviewers in args.reviewers
+    ]
+
+    print_table(
+        ["reviewers", "claimed", "accounts/s", "p50 ms", "p99 ms", "double claims"],
+        rows,
+    )
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,179 @@
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from collections import defaultdict
+
+from sqlalchemy import func, select
+from sqlmodel import col
+
+from backend.app.api.services.ledger import get_ledger_balances, post_journal_entries
+from backend.app.bank_account.models import BankAccount
+from backend.app.core.db import async_session
+from backend.app.core.model_registry import load_models
+from backend.app.ledger.enums import JournalEntryTypeEnum
+from backend.app.ledger.schema import JournalEntryCreateSchema, PostingCreateSchema
+from backend.benchmarks.common import LatencySamples, print_table
+
+# Writes real journal entries between existing bank accounts. Point
+# DATABASE_URL at a local database before running it.
+
+
+async def load_accounts(limit: int) -> list[tuple[uuid.UUID, object]]:
+    async with async_session() as session:
+        busiest = await session.exec(
+            select(col(BankAccount.currency))
+            .group_by(col(BankAccount.currency))
+            .order_by(func.count().desc())
+            .limit(1)
+        )
+        currency = busiest.scalar()
+        result = await session.exec(
+            select(col(BankAccount.id))
+            .where(col(BankAccount.currency) == currency)
+            .limit(limit)
+        )
+        return [(account_id, currency) for account_id in result.scalars().all()]
+
+
+def build_transfer(source, target, currency, amount: int) -> JournalEntryCreateSchema:
+    return JournalEntryCreateSchema(
+        idempotency_key=f"benchmark:{uuid.uuid4()}",
+        entry_type=JournalEntryTypeEnum.Transfer,
+        postings=[
+            PostingCreateSchema(account_id=source, currency=currency, amount=-amount),
+            PostingCreateSchema(account_id=target, currency=currency, amount=amount),
+        ],
+    )
+
+
+async def run_scenario(
+    name: str,
+    accounts: list[tuple[uuid.UUID, object]],
+    entries: int,
+    concurrency: int,
+    batch_size: int,
+    hot: bool,
+) -> list[object]:
+    account_ids = [account_id for account_id, _ in accounts]
+    currency = accounts[0][1]
+
+    async with async_session() as session:
+        opening = await get_ledger_balances(account_ids, session)
+
+    expected: dict[uuid.UUID, int] = defaultdict(int)
+    latency = LatencySamples()
+    failures = 0
+    remaining = entries
+
+    async def worker() -> None:
+        nonlocal remaining, failures
+        while remaining > 0:
+            count = min(batch_size, remaining)
+            remaining -= count
+
+            batch = []
+            for _ in range(count):
+                source, target = random.sample(account_ids, 2)
+                if hot:
+                    source = account_ids[0]
+                    target = target if target != source else account_ids[1]
+                batch.append(
+                    build_transfer(source, target, currency, random.randint(1, 500))
+                )
+
+            try:
+                async with latency.measure():
+                    async with async_session() as session:
+                        await post_journal_entries(batch, session)
+                        await session.commit()
+            except Exception as e:
+                failures += count
+                print(f"Batch failed: {e}")
+                continue
+
+            for entry in batch:
+                for posting in entry.postings:
+                    expected[posting.account_id] += posting.amount
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    async with async_session() as session:
+        closing = await get_ledger_balances(account_ids, session)
+
+    lost_updates = sum(
+        1
+        for account_id in account_ids
+        if closing.get(account_id, 0) - opening.get(account_id, 0)
+        != expected.get(account_id, 0)
+    )
+    posted = entries - failures
+    summary = latency.summary()
+
+    return [
+        name,
+        posted,
+        posted / elapsed,
+        posted * 2 / elapsed,
+        summary["p50_ms"],
+        summary["p99_ms"],
+        failures,
+        lost_updates,
+    ]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure ledger posting throughput and check for lost updates"
+    )
+    parser.add_argument("--accounts", type=int, default=100)
+    parser.add_argument("--entries", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=1)
+    args = parser.parse_args()
+
+    load_models()
+    accounts = await load_accounts(args.accounts)
+    if len(accounts) < 2:
+        print("At least two bank accounts in the same currency are required")
+        return
+
+    print(
+        f"{len(accounts)} {accounts[0][1].value} accounts, "
+        f"{args.concurrency} concurrent writers, "
+        f"{args.batch_size} entries per transaction\n"
+    )
+
+    rows = [
+        await run_scenario(
+            "spread", accounts, args.entries, args.concurrency, args.batch_size, False
+        ),
+        await run_scenario(
+            "hot account",
+            accounts,
+            args.entries,
+            args.concurrency,
+            args.batch_size,
+            True,
+        ),
+    ]
+    print_table(
+        [
+            "scenario",
+            "entries",
+            "entries/s",
+            "postings/s",
+            "p50 ms",
+            "p99 ms",
+            "failed",
+            "lost updates",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,65 @@
+import argparse
+import asyncio
+
+from sqlmodel import col, select
+
+from backend.app.api.services.profile import PROFILE_LOAD_PLAN
+from backend.app.auth.models import User
+from backend.app.core.db import async_session, engine
+from backend.app.core.model_registry import load_models
+from backend.benchmarks.common import LatencySamples, RoundTripCounter, print_table
+
+
+def newest_users(limit: int):
+    return (
+        select(User)
+        .order_by(col(User.created_at).desc(), col(User.id).desc())
+        .limit(limit)
+    )
+
+
+async def legacy_page(limit: int) -> None:
+    async with async_session() as session:
+        result = await session.exec(newest_users(limit))
+        for user in result.all():
+            await session.refresh(user, ["profile"])
+
+
+async def planned_page(limit: int) -> None:
+    async with async_session() as session:
+        result = await session.exec(PROFILE_LOAD_PLAN.apply(newest_users(limit)))
+        for user in result.all():
+            user.profile
+
+
+async def measure(name: str, load_page, limit: int, repeat: int) -> list[object]:
+    latency = LatencySamples()
+    with RoundTripCounter(engine) as counter:
+        for _ in range(repeat):
+            async with latency.measure():
+                await load_page(limit)
+    summary = latency.summary()
+    return [name, limit, counter.count / repeat, summary["p50_ms"], summary["p99_ms"]]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Count round-trips per profile page with and without load plans"
+    )
+    parser.add_argument("--limits", type=int, nargs="+", default=[10, 50, 100])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    load_models()
+    rows = []
+    for limit in args.limits:
+        rows.append(await measure("refresh per row", legacy_page, limit, args.repeat))
+        rows.append(await measure("load plan", planned_page, limit, args.repeat))
+
+    print_table(["loading", "page size", "round-trips", "p50 ms", "p99 ms"], rows)
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,135 @@
+import argparse
+import asyncio
+from datetime import datetime, timezone
+
+from backend.app.api.services.login_state import login_state_engine
+from backend.app.api.services.user_auth import user_auth_service
+from backend.app.auth.otp_store import OTPVerifyResult
+from backend.app.auth.schema import AccountStatusSchema
+from backend.app.auth.utils import generate_otp
+from backend.app.core.config import settings
+from backend.app.core.db import async_session, engine
+from backend.app.core.model_registry import load_models
+from backend.app.core.redis import close_redis
+from backend.benchmarks.common import LatencySamples, RoundTripCounter, print_table
+
+# Password verification is left out: it runs in the hashing pool, so only
+# database and OTP store work is measured.
+#
+# The legacy flow kept the OTP in user.otp and user.otp_expiry_time, which no
+# longer exist. Its baseline replays the same sequence of commits and
+# refreshes against the user row, touching updated_at where it used to write
+# the OTP columns, so the round-trips and row writes match what it cost.
+
+
+async def legacy_request_otp(email: str) -> str:
+    async with async_session() as session:
+        user = await user_auth_service.get_user_by_email(email, session)
+
+        user.failed_login_attempts = 0
+        user.last_failed_login = None
+        user.updated_at = datetime.now(timezone.utc)
+        if user.account_status == AccountStatusSchema.LOCKED:
+            user.account_status = AccountStatusSchema.ACTIVE
+        await session.commit()
+        await session.refresh(user)
+
+        otp = generate_otp()
+        user.updated_at = datetime.now(timezone.utc)
+        await session.commit()
+        await session.refresh(user)
+        return otp
+
+
+async def legacy_verify_otp(email: str, otp: str) -> None:
+    async with async_session() as session:
+        user = await user_auth_service.get_user_by_email(email, session)
+
+        for _ in range(2):
+            user.failed_login_attempts = 0
+            user.last_failed_login = None
+            user.updated_at = datetime.now(timezone.utc)
+            await session.commit()
+            await session.refresh(user)
+
+
+async def request_otp(email: str) -> str:
+    async with async_session() as session:
+        user = await user_auth_service.get_user_by_email(email, session)
+        return await login_state_engine.issue_otp(user, session)
+
+
+async def verify_otp(email: str, otp: str) -> None:
+    async with async_session() as session:
+        user = await user_auth_service.get_user_by_email(email, session)
+        result = await login_state_engine.verify_otp(user, otp, session)
+        assert result == OTPVerifyResult.VALID
+
+
+async def run_flow(name: str, request_otp, verify_otp, email: str, iterations: int):
+    request_latency = LatencySamples()
+    verify_latency = LatencySamples()
+    request_trips = 0
+    verify_trips = 0
+
+    with RoundTripCounter(engine) as counter:
+        for _ in range(iterations):
+            before = counter.count
+            async with request_latency.measure():
+                otp = await request_otp(email)
+            request_trips += counter.count - before
+
+            before = counter.count
+            async with verify_latency.measure():
+                await verify_otp(email, otp)
+            verify_trips += counter.count - before
+
+    return [
+        [
+            name,
+            "request-otp",
+            request_trips / iterations,
+            request_latency.summary()["p50_ms"],
+            request_latency.summary()["p99_ms"],
+        ],
+        [
+            name,
+            "verify-otp",
+            verify_trips / iterations,
+            verify_latency.summary()["p50_ms"],
+            verify_latency.summary()["p99_ms"],
+        ],
+    ]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare round-trips and latency of the legacy login OTP flow with "
+            "the OTP store flow"
+        )
+    )
+    parser.add_argument("--email", required=True, help="Email of an active test user")
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    load_models()
+
+    rows = await run_flow(
+        "legacy", legacy_request_otp, legacy_verify_otp, args.email, args.iterations
+    )
+    rows += await run_flow(
+        f"otp-store:{settings.OTP_STORE_BACKEND}",
+        request_otp,
+        verify_otp,
+        args.email,
+        args.iterations,
+    )
+    print_table(["flow", "step", "round-trips/op", "p50 ms", "p99 ms"], rows)
+
+    await engine.dispose()
+    await close_redis()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
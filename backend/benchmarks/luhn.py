@@ -0,0 +1,68 @@
+import argparse
+import random
+import time
+
+from backend.app.bank_account.luhn import (
+    calculate_luhn_check_digits,
+    validate_luhn_numbers,
+)
+from backend.app.bank_account.utils import calculate_luhn_check_digit
+from backend.benchmarks.common import print_table
+
+
+def timed(func, *args) -> tuple[object, float]:
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+
+def scalar_check_digits(partials: list[str]) -> list[int]:
+    return [calculate_luhn_check_digit(partial) for partial in partials]
+
+
+def scalar_validate(numbers: list[str]) -> list[bool]:
+    return [
+        calculate_luhn_check_digit(number[:-1]) == int(number[-1]) for number in numbers
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare scalar and vectorized Luhn check digit computation"
+    )
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--length", type=int, default=15)
+    args = parser.parse_args()
+
+    partials = [
+        "".join(random.choices("0123456789", k=args.length)) for _ in range(args.count)
+    ]
+
+    scalar_digits, scalar_generate_s = timed(scalar_check_digits, partials)
+    vector_digits, vector_generate_s = timed(calculate_luhn_check_digits, partials)
+    assert list(vector_digits) == scalar_digits
+
+    numbers = [f"{partial}{digit}" for partial, digit in zip(partials, scalar_digits)]
+    scalar_valid, scalar_validate_s = timed(scalar_validate, numbers)
+    vector_valid, vector_validate_s = timed(validate_luhn_numbers, numbers)
+    assert all(scalar_valid) and bool(vector_valid.all())
+
+    rows = []
+    for operation, scalar_s, vector_s in (
+        ("check digits", scalar_generate_s, vector_generate_s),
+        ("validate", scalar_validate_s, vector_validate_s),
+    ):
+        rows.append(
+            [
+                operation,
+                args.count,
+                scalar_s * 1000,
+                vector_s * 1000,
+                scalar_s / vector_s,
+            ]
+        )
+    print_table(["operation", "numbers", "scalar ms", "numpy ms", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
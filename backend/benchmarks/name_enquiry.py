@@ -0,0 +1,80 @@
+import argparse
+import asyncio
+import random
+
+from sqlalchemy import select
+from sqlmodel import col
+
+from backend.app.api.services.bank_account import name_enquiry
+from backend.app.bank_account.models import BankAccount
+from backend.app.bank_account.name_enquiry_cache import name_enquiry_cache
+from backend.app.core.db import async_session, engine
+from backend.app.core.model_registry import load_models
+from backend.benchmarks.common import LatencySamples, RoundTripCounter, print_table
+
+
+async def load_account_numbers(limit: int) -> list[str]:
+    async with async_session() as session:
+        result = await session.exec(
+            select(col(BankAccount.account_number))
+            .where(col(BankAccount.account_number).is_not(None))
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+
+async def measure(name: str, account_numbers: list[str], lookups: int, cached: bool):
+    for account_number in account_numbers:
+        await name_enquiry_cache.invalidate(account_number)
+    if cached:
+        async with async_session() as session:
+            for account_number in account_numbers:
+                await name_enquiry(account_number, session)
+
+    latency = LatencySamples()
+    with RoundTripCounter(engine) as counter:
+        async with async_session() as session:
+            for _ in range(lookups):
+                account_number = random.choice(account_numbers)
+                if not cached:
+                    await name_enquiry_cache.invalidate(account_number)
+                async with latency.measure():
+                    await name_enquiry(account_number, session)
+
+    summary = latency.summary()
+    return [
+        name,
+        lookups,
+        counter.count / lookups,
+        summary["p50_ms"],
+        summary["p99_ms"],
+    ]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare cached and uncached name enquiry latency"
+    )
+    parser.add_argument("--accounts", type=int, default=2000)
+    parser.add_argument("--lookups", type=int, default=20000)
+    args = parser.parse_args()
+
+    load_models()
+    account_numbers = await load_account_numbers(args.accounts)
+    if not account_numbers:
+        print("No bank accounts with account numbers found")
+        return
+
+    print_table(
+        ["mode", "lookups", "queries/lookup", "p50 ms", "p99 ms"],
+        [
+            await measure("postgres", account_numbers, args.lookups, cached=False),
+            await measure("cached", account_numbers, args.lookups, cached=True),
+        ],
+    )
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
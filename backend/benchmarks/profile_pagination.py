@@ -0,0 +1,111 @@
+import argparse
+import asyncio
+
+from sqlalchemy import func, tuple_
+from sqlmodel import col, select
+
+from backend.app.auth.models import User
+from backend.app.core.db import async_session, engine
+from backend.app.core.model_registry import load_models
+from backend.app.core.utils.pagination import estimate_row_count
+from backend.benchmarks.common import LatencySamples, print_table
+
+NEWEST_FIRST = (col(User.created_at).desc(), col(User.id).desc())
+
+
+async def offset_page(session, page: int, limit: int) -> None:
+    result = await session.exec(
+        select(User).order_by(*NEWEST_FIRST).offset(page * limit).limit(limit)
+    )
+    result.all()
+
+
+async def keyset_page(session, boundary, limit: int) -> None:
+    statement = select(User).order_by(*NEWEST_FIRST).limit(limit + 1)
+    if boundary is not None:
+        statement = statement.where(
+            tuple_(col(User.created_at), col(User.id)) < tuple_(*boundary)
+        )
+    result = await session.exec(statement)
+    result.all()
+
+
+async def page_boundary(session, page: int, limit: int):
+    if page == 0:
+        return None
+    result = await session.exec(
+        select(col(User.created_at), col(User.id))
+        .order_by(*NEWEST_FIRST)
+        .offset(page * limit - 1)
+        .limit(1)
+    )
+    row = result.first()
+    return tuple(row) if row else None
+
+
+async def timed(repeat: int, call) -> dict[str, float]:
+    latency = LatencySamples()
+    for _ in range(repeat):
+        async with latency.measure():
+            await call()
+    return latency.summary()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare OFFSET and keyset profile pages at increasing depth"
+    )
+    parser.add_argument(
+        "--pages", type=int, nargs="+", default=[1, 100, 1000, 10000]
+    )
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    load_models()
+    rows = []
+    async with async_session() as session:
+        for page in args.pages:
+            boundary = await page_boundary(session, page - 1, args.limit)
+            offset = await timed(
+                args.repeat, lambda: offset_page(session, page - 1, args.limit)
+            )
+            keyset = await timed(
+                args.repeat, lambda: keyset_page(session, boundary, args.limit)
+            )
+            rows.append(
+                [
+                    page,
+                    offset["p50_ms"],
+                    keyset["p50_ms"],
+                    offset["p99_ms"],
+                    keyset["p99_ms"],
+                ]
+            )
+
+        async def exact_count() -> None:
+            await session.exec(select(func.count()).select_from(User))
+
+        exact = await timed(args.repeat, exact_count)
+        estimate = await timed(
+            args.repeat, lambda: estimate_row_count(User.__tablename__, session)
+        )
+
+    print_table(
+        ["page", "offset p50 ms", "keyset p50 ms", "offset p99 ms", "keyset p99 ms"],
+        rows,
+    )
+    print()
+    print_table(
+        ["total", "p50 ms", "p99 ms"],
+        [
+            ["exact COUNT(*)", exact["p50_ms"], exact["p99_ms"]],
+            ["planner estimate", estimate["p50_ms"], estimate["p99_ms"]],
+        ],
+    )
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,77 @@
+import argparse
+import asyncio
+
+from sqlalchemy import func
+from sqlmodel import select
+
+from backend.app.api.services.profile import search_user_profiles
+from backend.app.auth.models import User
+from backend.app.auth.schema import RoleChoicesSchema
+from backend.app.core.db import async_session, engine
+from backend.app.core.model_registry import load_models
+from backend.app.core.utils.pagination import estimate_row_count
+from backend.benchmarks.common import LatencySamples, print_table
+
+
+def search_terms(user: User) -> dict[str, str]:
+    return {
+        "name": f"{user.first_name} {user.last_name}",
+        "misspelt name": f"{user.first_name[:-1]} {user.last_name}",
+        "email prefix": user.email.split("@")[0],
+        "id number": str(user.id_no),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure profile search latency for different kinds of queries"
+    )
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    load_models()
+    async with async_session() as session:
+        result = await session.exec(
+            select(User).where(User.role == RoleChoicesSchema.BRANCH_MANAGER)
+        )
+        manager = result.first()
+        if manager is None:
+            print("No branch manager to search as")
+            return
+
+        result = await session.exec(
+            select(User).order_by(func.random()).limit(args.samples)
+        )
+        users = [user for user in result.all() if len(user.first_name) > 2]
+        total = await estimate_row_count(User.__tablename__, session)
+
+    if not users:
+        print("No users to search for")
+        return
+
+    rows = []
+    for kind in search_terms(users[0]):
+        latency = LatencySamples()
+        found = 0
+        for user in users:
+            term = search_terms(user)[kind]
+            async with async_session() as session:
+                async with latency.measure():
+                    hits, _ = await search_user_profiles(
+                        session, manager, term, limit=args.limit
+                    )
+            found += any(hit.id == user.id for hit, _ in hits)
+        summary = latency.summary()
+        rows.append(
+            [kind, len(users), found / len(users), summary["p50_ms"], summary["p99_ms"]]
+        )
+
+    print(f"~{total or 0:,} users\n")
+    print_table(["query", "searches", "recall@limit", "p50 ms", "p99 ms"], rows)
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
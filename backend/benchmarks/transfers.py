@@ -0,0 +1,191 @@
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from decimal import Decimal
+
+from sqlalchemy import select
+from sqlmodel import col
+
+from backend.app.api.services.ledger import post_journal_entries
+from backend.app.api.services.transfer import (
+    PendingTransfer,
+    TransferBatcher,
+    execute_transfer_batch,
+)
+from backend.app.bank_account.enums import AccountStatusEnum
+from backend.app.bank_account.models import BankAccount
+from backend.app.core.config import settings
+from backend.app.core.db import async_session
+from backend.app.core.model_registry import load_models
+from backend.app.ledger.enums import InternalAccountEnum, JournalEntryTypeEnum
+from backend.app.ledger.schema import (
+    JournalEntryCreateSchema,
+    PostingCreateSchema,
+    TransferCreateSchema,
+)
+from backend.app.ledger.utils import to_minor_units
+from backend.benchmarks.common import LatencySamples, print_table
+
+# Funds the selected active accounts from the cash account and then moves
+# money between them. Point DATABASE_URL at a local database before running.
+
+FUNDING_AMOUNT = Decimal("1000000.00")
+
+
+async def load_accounts(limit: int) -> list:
+    async with async_session() as session:
+        result = await session.exec(
+            select(
+                col(BankAccount.id),
+                col(BankAccount.user_id),
+                col(BankAccount.currency),
+            )
+            .where(col(BankAccount.account_status) == AccountStatusEnum.Active)
+            .limit(limit)
+        )
+        return result.all()
+
+
+async def fund_accounts(accounts: list) -> None:
+    entries = []
+    for account in accounts:
+        amount = to_minor_units(FUNDING_AMOUNT, account.currency)
+        entries.append(
+            JournalEntryCreateSchema(
+                idempotency_key=f"benchmark-funding:{uuid.uuid4()}",
+                entry_type=JournalEntryTypeEnum.Deposit,
+                postings=[
+                    PostingCreateSchema(
+                        internal_account=InternalAccountEnum.Cash,
+                        currency=account.currency,
+                        amount=-amount,
+                    ),
+                    PostingCreateSchema(
+                        account_id=account.id, currency=account.currency, amount=amount
+                    ),
+                ],
+            )
+        )
+
+    async with async_session() as session:
+        await post_journal_entries(entries, session)
+        await session.commit()
+
+
+def pick_transfer(accounts: list, hot: bool) -> tuple:
+    source, destination = random.sample(accounts, 2)
+    if hot:
+        source = accounts[0]
+        if destination is source:
+            destination = accounts[1]
+    return source, destination
+
+
+async def submit_direct(user_id: uuid.UUID, transfer_data: TransferCreateSchema):
+    pending = PendingTransfer(user_id, transfer_data)
+    async with async_session() as session:
+        result = await execute_transfer_batch([pending], session)
+        await session.commit()
+    return result[0]
+
+
+async def run_scenario(
+    name: str, accounts: list, transfers: int, concurrency: int, hot: bool, batched: bool
+) -> list[object]:
+    batcher = TransferBatcher(
+        max_batch_size=settings.TRANSFER_BATCH_MAX_SIZE,
+        linger_ms=settings.TRANSFER_BATCH_LINGER_MS,
+    )
+    latency = LatencySamples()
+    failures = 0
+    remaining = transfers
+
+    async def client() -> None:
+        nonlocal remaining, failures
+        while remaining > 0:
+            remaining -= 1
+            source, destination = pick_transfer(accounts, hot)
+            transfer_data = TransferCreateSchema(
+                idempotency_key=uuid.uuid4().hex,
+                source_account_id=source.id,
+                destination_account_id=destination.id,
+                amount=Decimal("0.01"),
+            )
+            try:
+                async with latency.measure():
+                    if batched:
+                        await batcher.submit(source.user_id, transfer_data)
+                    else:
+                        result = await submit_direct(source.user_id, transfer_data)
+                        if isinstance(result, Exception):
+                            raise result
+            except Exception:
+                failures += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    summary = latency.summary()
+    metrics = batcher.get_metrics()
+    return [
+        name,
+        "batched" if batched else "direct",
+        transfers - failures,
+        (transfers - failures) / elapsed,
+        summary["p50_ms"],
+        summary["p99_ms"],
+        metrics["avg_batch_size"] if batched else 1.0,
+        failures,
+    ]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Load test transfers on one hot account and across many accounts"
+    )
+    parser.add_argument("--accounts", type=int, default=200)
+    parser.add_argument("--transfers", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    args = parser.parse_args()
+
+    load_models()
+    accounts = await load_accounts(args.accounts)
+    if len(accounts) < 2:
+        print("At least two active bank accounts are required")
+        return
+
+    await fund_accounts(accounts)
+    print(
+        f"{len(accounts)} active accounts, {args.concurrency} concurrent clients, "
+        f"batches of up to {settings.TRANSFER_BATCH_MAX_SIZE}\n"
+    )
+
+    rows = []
+    for name, hot in (("hot account", True), ("many accounts", False)):
+        for batched in (False, True):
+            rows.append(
+                await run_scenario(
+                    name, accounts, args.transfers, args.concurrency, hot, batched
+                )
+            )
+
+    print_table(
+        [
+            "scenario",
+            "mode",
+            "transfers",
+            "transfers/s",
+            "p50 ms",
+            "p99 ms",
+            "avg batch",
+            "failed",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -6,4 +6,6 @@ set -o nounset
 
 set -o pipefail
 
-exec watchfiles --filter python celery.__main__.main --args '-A backend.app.core.celery_app worker -l INFO'
+QUEUES="${CELERY_WORKER_QUEUES:-nextgen_tasks,otp_delivery}"
+
+exec watchfiles --filter python celery.__main__.main --args "-A backend.app.core.celery_app worker -l INFO -Q ${QUEUES}"
@@ -0,0 +1,52 @@
+import argparse
+import asyncio
+import json
+import sys
+
+from backend.app.api.services.user_import import (
+    IMPORT_FORMATS,
+    detect_import_format,
+    import_users,
+)
+from backend.app.auth.password_hasher import password_hasher
+from backend.app.core.db import engine
+from backend.app.core.model_registry import load_models
+
+
+async def run(path: str, fmt: str) -> int:
+    with open(path, encoding="utf-8-sig") as import_file:
+        content = import_file.read()
+
+    failed = 0
+    async for event in import_users(content, fmt):
+        print(json.dumps(event), flush=True)
+        if event["status"] == "completed":
+            failed = event["failed"]
+    return failed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Bulk import customers from CSV or NDJSON"
+    )
+    parser.add_argument("file", help="Path to the import file")
+    parser.add_argument("--format", choices=IMPORT_FORMATS, default=None)
+    args = parser.parse_args()
+
+    fmt = args.format or detect_import_format(args.file, None)
+    if fmt is None:
+        parser.error("Could not detect the file format, pass --format")
+
+    load_models()
+    password_hasher.start()
+    try:
+        failed = await run(args.file, fmt)
+    finally:
+        password_hasher.shutdown()
+        await engine.dispose()
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
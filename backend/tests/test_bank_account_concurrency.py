@@ -0,0 +1,155 @@
+import asyncio
+import random
+import uuid
+from datetime import date
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import delete, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.app.api.services.bank_account import create_bank_account
+from backend.app.auth.models import User
+from backend.app.auth.schema import AccountStatusSchema, SecurityQuestionsSchema
+from backend.app.bank_account.enums import AccountCurrencyEnum, AccountTypeEnum
+from backend.app.bank_account.models import BankAccount
+from backend.app.bank_account.schema import BankAccountCreateSchema
+from backend.app.core.config import settings
+from backend.app.next_of_kin.enums import RelationshipTypeEnum
+from backend.app.next_of_kin.models import NextOfKin
+from backend.app.user_profile.enums import (
+    EmploymentStatusEnum,
+    GenderEnum,
+    IdentificationTypeEnum,
+    MaritalStatusEnum,
+    SalutationEnum,
+)
+from backend.app.user_profile.models import Profile
+
+PARALLEL_CREATES = settings.MAX_BANK_ACCOUNTS * 4
+
+
+def kyc_complete_user() -> tuple[User, Profile, NextOfKin]:
+    user_id = uuid.uuid4()
+    user = User(
+        id=user_id,
+        email=f"{user_id.hex[:12]}@example.com",
+        first_name="Parallel",
+        last_name="Creates",
+        id_no=random.randint(10**8, 2**31 - 1),
+        is_active=True,
+        security_question=SecurityQuestionsSchema.BIRTH_CITY,
+        security_answer="nairobi",
+        account_status=AccountStatusSchema.ACTIVE,
+        hashed_password="",
+    )
+    profile = Profile(
+        user_id=user_id,
+        title=SalutationEnum.Mr,
+        gender=GenderEnum.Male,
+        date_of_birth=date(1990, 1, 1),
+        country_of_birth="Kenya",
+        place_of_birth="Nairobi",
+        marital_status=MaritalStatusEnum.Single,
+        means_of_identification=IdentificationTypeEnum.National_ID,
+        id_issue_date=date(2015, 1, 1),
+        id_expiry_date=date(2035, 1, 1),
+        passport_number="A1234567",
+        nationality="Kenyan",
+        phone_number="+254712345678",
+        address="1 Test Street",
+        city="Nairobi",
+        country="Kenya",
+        employment_status=EmploymentStatusEnum.Employed,
+        employer_name="NextGen",
+        employer_address="2 Test Street",
+        employer_city="Nairobi",
+        employer_country="Kenya",
+        annual_income=50000.0,
+        date_of_employment=date(2020, 1, 1),
+    )
+    next_of_kin = NextOfKin(
+        user_id=user_id,
+        full_name="Next Kin",
+        relationship=RelationshipTypeEnum.Sibling,
+        email="kin@example.com",
+        phone_number="+254712345679",
+        address="1 Test Street",
+        city="Nairobi",
+        country="Kenya",
+        nationality="Kenyan",
+        is_primary=True,
+    )
+    return user, profile, next_of_kin
+
+
+async def parallel_creates(is_primary) -> tuple[int, list[BankAccount]]:
+    engine = create_async_engine(settings.DATABASE_URL, poolclass=NullPool)
+    try:
+        try:
+            async with engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+        except Exception as e:
+            pytest.skip(f"PostgreSQL is not reachable: {e}")
+
+        user, profile, next_of_kin = kyc_complete_user()
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            session.add(user)
+            await session.flush()
+            session.add_all([profile, next_of_kin])
+            await session.commit()
+
+        async def attempt(i: int) -> bool:
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                try:
+                    await create_bank_account(
+                        user.id,
+                        BankAccountCreateSchema(
+                            account_type=AccountTypeEnum.Savings,
+                            currency=AccountCurrencyEnum.USD,
+                            account_name=f"Parallel account {i}",
+                            is_primary=is_primary(i),
+                        ),
+                        session,
+                    )
+                    return True
+                except HTTPException as e:
+                    assert e.status_code == 400
+                    return False
+
+        try:
+            results = await asyncio.gather(
+                *(attempt(i) for i in range(PARALLEL_CREATES))
+            )
+            async with AsyncSession(engine) as session:
+                result = await session.exec(
+                    select(BankAccount).where(col(BankAccount.user_id) == user.id)
+                )
+                accounts = list(result.all())
+        finally:
+            async with AsyncSession(engine) as session:
+                await session.exec(delete(User).where(col(User.id) == user.id))
+                await session.commit()
+
+        return sum(results), accounts
+    finally:
+        await engine.dispose()
+
+
+def test_parallel_creates_respect_account_limit_and_single_primary():
+    succeeded, accounts = asyncio.run(parallel_creates(lambda i: i % 2 == 0))
+
+    assert succeeded == settings.MAX_BANK_ACCOUNTS
+    assert len(accounts) == settings.MAX_BANK_ACCOUNTS
+    assert sum(account.is_primary for account in accounts) == 1
+
+
+def test_parallel_primary_creates_leave_exactly_one_primary():
+    succeeded, accounts = asyncio.run(parallel_creates(lambda i: True))
+
+    assert succeeded == 1
+    assert len(accounts) == 1
+    assert accounts[0].is_primary
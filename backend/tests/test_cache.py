@@ -0,0 +1,36 @@
+import asyncio
+
+from backend.app.core.cache import TwoTierCache
+
+
+def local_cache(namespace: str) -> TwoTierCache:
+    return TwoTierCache(
+        namespace=namespace,
+        max_size=16,
+        local_ttl_seconds=60,
+        redis_ttl_seconds=60,
+        redis_enabled=False,
+    )
+
+
+def test_fill_after_invalidation_is_dropped():
+    cache = local_cache("test_guarded_fill")
+
+    async def scenario():
+        version = await cache.version("key")
+        await cache.invalidate("key")
+        await cache.set("key", {"status": "Pending"}, version)
+        return await cache.get("key")
+
+    assert asyncio.run(scenario()) is None
+
+
+def test_fill_without_invalidation_is_kept():
+    cache = local_cache("test_unguarded_fill")
+
+    async def scenario():
+        version = await cache.version("key")
+        await cache.set("key", {"status": "Active"}, version)
+        return await cache.get("key")
+
+    assert asyncio.run(scenario()) == {"status": "Active"}
@@ -0,0 +1,34 @@
+import asyncio
+
+from backend.app.core.loading import BatchLoader
+
+
+def test_loads_during_an_inflight_batch_wait_and_coalesce():
+    in_flight = 0
+    peak = 0
+    batches: list[list[int]] = []
+
+    async def batch_fn(keys):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        batches.append(sorted(keys))
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {key: key * 10 for key in keys}
+
+    async def scenario():
+        loader = BatchLoader(batch_fn)
+        first = asyncio.create_task(loader.load_many([1, 2]))
+        await asyncio.sleep(0.001)
+        late = [asyncio.create_task(loader.load(key)) for key in (3, 4)]
+        await asyncio.sleep(0)
+        later = asyncio.create_task(loader.load(5))
+        return await first, await asyncio.gather(*late, later)
+
+    first, late = asyncio.run(scenario())
+
+    assert first == [10, 20]
+    assert late == [30, 40, 50]
+    assert peak == 1
+    assert batches == [[1, 2], [3, 4, 5]]
@@ -0,0 +1,31 @@
+import asyncio
+
+from backend.app.auth.password_hasher import PasswordHashingService
+
+
+def test_hash_many_hashes_one_password_per_job_and_leaves_a_worker_free(
+    monkeypatch,
+):
+    service = PasswordHashingService(max_workers=3, max_queue_size=8, queue_timeout=1.0)
+    in_flight = 0
+    peak = 0
+    jobs: list[str] = []
+
+    async def hash(password):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        jobs.append(password)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return f"hashed:{password}"
+
+    monkeypatch.setattr(service, "hash", hash)
+    passwords = [f"password-{i}" for i in range(20)]
+
+    hashed = asyncio.run(service.hash_many(passwords))
+
+    assert hashed == [f"hashed:{password}" for password in passwords]
+    assert sorted(jobs) == sorted(passwords)
+    assert peak == 2
+
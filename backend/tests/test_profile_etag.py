@@ -0,0 +1,51 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.app.api.routes.auth.deps import get_current_user
+from backend.app.api.routes.profile import me
+from backend.app.core.db import get_session
+from backend.app.core.utils.etag import weak_etag
+
+
+@pytest.fixture
+def client(user, monkeypatch) -> TestClient:
+    async def profile_etag(user_id, session):
+        return weak_etag(user_id, user.updated_at)
+
+    async def user_with_profile(user_id, session):
+        return user
+
+    async def no_session():
+        yield None
+
+    monkeypatch.setattr(me, "get_profile_etag", profile_etag)
+    monkeypatch.setattr(me, "get_user_with_profile", user_with_profile)
+
+    app = FastAPI()
+    app.include_router(me.router)
+    app.dependency_overrides[get_current_user] = lambda: user
+    app.dependency_overrides[get_session] = no_session
+    return TestClient(app)
+
+
+def test_profile_me_returns_etag_then_not_modified(client, user):
+    response = client.get("/profile/me")
+
+    assert response.status_code == 200
+    assert response.json()["email"] == user.email
+    etag = response.headers["ETag"]
+    assert etag.startswith('W/"')
+
+    response = client.get("/profile/me", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+
+
+def test_profile_me_stale_etag_returns_profile(client):
+    response = client.get("/profile/me", headers={"If-None-Match": 'W/"stale"'})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != 'W/"stale"'
@@ -0,0 +1,66 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.app.api.routes.auth import logout
+from backend.app.api.routes.auth.deps import CurrentUser
+from backend.app.auth.principal_cache import principal_cache
+from backend.app.auth.token_revocation import token_revocation_list
+from backend.app.auth.utils import create_jwt_token
+from backend.app.core.config import settings
+from backend.app.core.db import get_session
+
+
+@pytest.fixture
+def revoked(monkeypatch) -> set[str]:
+    jtis: set[str] = set()
+
+    async def revoke(jti, expires_at):
+        jtis.add(jti)
+
+    async def is_revoked(jti):
+        return jti in jtis
+
+    monkeypatch.setattr(token_revocation_list, "revoke", revoke)
+    monkeypatch.setattr(token_revocation_list, "is_revoked", is_revoked)
+    return jtis
+
+
+@pytest.fixture
+def client(user, revoked, monkeypatch) -> TestClient:
+    async def cached_principal(user_id):
+        return user
+
+    async def no_session():
+        yield None
+
+    monkeypatch.setattr(principal_cache, "get", cached_principal)
+
+    app = FastAPI()
+    app.include_router(logout.router)
+
+    @app.get("/whoami")
+    async def whoami(current_user: CurrentUser) -> dict:
+        return {"email": current_user.email}
+
+    app.dependency_overrides[get_session] = no_session
+    return TestClient(app)
+
+
+def test_logged_out_access_token_is_rejected_with_401(client, user, revoked):
+    client.cookies.set(settings.COOKIE_ACCESS_NAME, create_jwt_token(user.id))
+
+    response = client.get("/whoami")
+    assert response.status_code == 200
+    assert response.json()["email"] == user.email
+
+    token = client.cookies.get(settings.COOKIE_ACCESS_NAME)
+    response = client.post("/auth/logout")
+    assert response.status_code == 200
+    assert len(revoked) == 1
+
+    client.cookies.set(settings.COOKIE_ACCESS_NAME, token)
+    response = client.get("/whoami")
+
+    assert response.status_code == 401
+    assert response.json()["detail"]["message"] == "Token has been revoked"
@@ -0,0 +1,67 @@
+import asyncio
+import uuid
+from decimal import Decimal
+
+from fastapi import HTTPException
+
+from backend.app.api.services.transfer import PendingTransfer, posted_transfer_result
+from backend.app.bank_account.enums import AccountCurrencyEnum
+from backend.app.core.config import settings
+from backend.app.ledger.models import Posting
+from backend.app.ledger.schema import TransferCreateSchema
+
+SOURCE_ID = uuid.uuid4()
+DESTINATION_ID = uuid.uuid4()
+ENTRY_ID = uuid.uuid4()
+
+
+def replay(amount: str, postings: list[Posting]):
+    async def run():
+        pending = PendingTransfer(
+            uuid.uuid4(),
+            TransferCreateSchema(
+                idempotency_key="replay-key",
+                source_account_id=SOURCE_ID,
+                destination_account_id=DESTINATION_ID,
+                amount=Decimal(amount),
+            ),
+        )
+        return posted_transfer_result(pending, ENTRY_ID, postings)
+
+    return asyncio.run(run())
+
+
+def usd_to_kes_postings() -> list[Posting]:
+    return [
+        Posting(
+            journal_entry_id=ENTRY_ID,
+            account_id=SOURCE_ID,
+            currency=AccountCurrencyEnum.USD,
+            amount=-10000,
+        ),
+        Posting(
+            journal_entry_id=ENTRY_ID,
+            account_id=DESTINATION_ID,
+            currency=AccountCurrencyEnum.KES,
+            amount=1290000,
+        ),
+    ]
+
+
+def test_replay_reports_the_applied_rate_after_fx_rates_change(monkeypatch):
+    monkeypatch.setattr(settings, "FX_RATES", {"USD": 1.0})
+
+    result = replay("100.00", usd_to_kes_postings())
+
+    assert not isinstance(result, HTTPException)
+    assert result.created is False
+    assert result.amount == Decimal("100.00")
+    assert result.destination_amount == Decimal("12900.00")
+    assert result.exchange_rate == Decimal(129)
+
+
+def test_replay_with_a_different_amount_conflicts():
+    result = replay("99.00", usd_to_kes_postings())
+
+    assert isinstance(result, HTTPException)
+    assert result.status_code == 409
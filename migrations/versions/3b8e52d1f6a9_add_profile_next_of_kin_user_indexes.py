@@ -0,0 +1,32 @@
+"""add_profile_next_of_kin_user_indexes
+
+Revision ID: 3b8e52d1f6a9
+Revises: 7d2f60a4e8c1
+Create Date: 2026-10-17 18:42:11.508317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '3b8e52d1f6a9'
+down_revision: Union[str, None] = '7d2f60a4e8c1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside the migration transaction.
+    with op.get_context().autocommit_block():
+        op.create_index(op.f('ix_profile_user_id'), 'profile', ['user_id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index(op.f('ix_nextofkin_user_id'), 'nextofkin', ['user_id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(op.f('ix_nextofkin_user_id'), table_name='nextofkin', postgresql_concurrently=True, if_exists=True)
+        op.drop_index(op.f('ix_profile_user_id'), table_name='profile', postgresql_concurrently=True, if_exists=True)
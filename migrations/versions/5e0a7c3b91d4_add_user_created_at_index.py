@@ -0,0 +1,30 @@
+"""add_user_created_at_index
+
+Revision ID: 5e0a7c3b91d4
+Revises: 9b4e17c5d2a8
+Create Date: 2026-10-17 15:08:39.227615
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '5e0a7c3b91d4'
+down_revision: Union[str, None] = '9b4e17c5d2a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside the migration transaction.
+    with op.get_context().autocommit_block():
+        op.create_index('ix_user_created_at_id', 'user', ['created_at', 'id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_user_created_at_id', table_name='user', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,36 @@
+"""add_profile_search_indexes
+
+Revision ID: 7d2f60a4e8c1
+Revises: 5e0a7c3b91d4
+Create Date: 2026-10-17 16:42:05.371926
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '7d2f60a4e8c1'
+down_revision: Union[str, None] = '5e0a7c3b91d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # id_no is already covered by the btree behind its unique constraint.
+    # CONCURRENTLY cannot run inside the migration transaction.
+    with op.get_context().autocommit_block():
+        op.create_index('ix_user_full_name_trgm', 'user', [sa.text("(first_name || ' ' || last_name) gin_trgm_ops")], unique=False, postgresql_using='gin', postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_user_email_trgm', 'user', ['email'], unique=False, postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'}, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_profile_phone_number_trgm', 'profile', ['phone_number'], unique=False, postgresql_using='gin', postgresql_ops={'phone_number': 'gin_trgm_ops'}, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_profile_phone_number_trgm', table_name='profile', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_user_email_trgm', table_name='user', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_user_full_name_trgm', table_name='user', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,30 @@
+"""add_account_number_block_sequence
+
+Revision ID: d41f6b82c7e0
+Revises: b7e35f0d9a61
+Create Date: 2026-10-16 11:20:05.482317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41f6b82c7e0'
+down_revision: Union[str, None] = 'b7e35f0d9a61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE SEQUENCE IF NOT EXISTS account_number_block_seq "
+        "START WITH 0 MINVALUE 0 INCREMENT BY 1"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP SEQUENCE IF EXISTS account_number_block_seq")